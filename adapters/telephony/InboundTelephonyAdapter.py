@@ -29,12 +29,14 @@ import uuid
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 
+from sqlalchemy import insert
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
 from adapters.telephony.did_tenant import DIDTenantMapper
 from app.models import Call, CallDirection, CallStatus
-from backend.ai_services.ai_loop_handler import AILoopHandler
+from backend.ai_services.ai_loop_handler import get_ai_loop_handler
 
 logger = logging.getLogger(__name__)
 
@@ -128,7 +130,7 @@ class ExotelInboundAdapter:
         """
         self.db = db
         self.did_mapper = DIDTenantMapper(db)
-        self.ai_loop_handler = AILoopHandler()
+        self.ai_loop_handler = get_ai_loop_handler()
         logger.info("[EXOTEL_ADAPTER] Initialized (TEMPORARY - INBOUND ONLY)")
     
     async def handle_inbound_webhook(
@@ -284,11 +286,12 @@ class ExotelInboundAdapter:
         event: NormalizedInboundEvent,
         tenant_id: uuid.UUID,
         phone_number_id: uuid.UUID
-    ) -> Call:
+    ) -> Row:
         """
         Store minimal normalized call summary.
         
         ⚠️ IMPORTANT: Stores ONLY normalized data, never raw provider payload.
+        Uses a single INSERT ... RETURNING round-trip.
         
         Phase 5 Scope:
         - Minimal call record (direction, status, timestamps)
@@ -302,20 +305,19 @@ class ExotelInboundAdapter:
             phone_number_id: Resolved phone number ID
             
         Returns:
-            Call: Created call record
+            Row: (id, started_at) of the created call record
         """
-        call = Call(
+        stmt = insert(Call).values(
             tenant_id=tenant_id,
             phone_number_id=phone_number_id,
             direction=CallDirection.INBOUND,
             status=CallStatus.COMPLETED,  # Will be updated when call ends
             started_at=event.timestamp
             # Note: ended_at is None until call completes
-        )
+        ).returning(Call.id, Call.started_at)
         
-        self.db.add(call)
+        call = self.db.execute(stmt).one()
         self.db.commit()
-        self.db.refresh(call)
         
         logger.info(
             f"[EXOTEL_ADAPTER] Stored call summary: call_id={call.id}, "
@@ -8,7 +8,7 @@ from alembic import context
 # Import app settings and models
 from app.config import settings
 from app.config.database import Base
-from app.models import User, Tenant, PhoneNumber, Call, AIProfile, BusinessProfile, CallSummary, NotificationLog
+from app.models import User, Tenant, PhoneNumber, Call, AIProfile, BusinessProfile, CallSummary, CallSummaryText, NotificationLog
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
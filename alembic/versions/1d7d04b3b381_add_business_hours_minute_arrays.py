@@ -0,0 +1,58 @@
+"""Add business hours minute arrays to business_profiles
+
+Revision ID: 1d7d04b3b381
+Revises: 51176981435e
+Create Date: 2026-10-16 09:12:41.502113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.schemas import business_hours_arrays
+
+# revision identifiers, used by Alembic.
+revision: str = '1d7d04b3b381'
+down_revision: Union[str, None] = '51176981435e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Weekday-indexed open/close times in minutes since midnight (0=Monday)
+    op.add_column(
+        'business_profiles',
+        sa.Column('business_hours_open_min', postgresql.ARRAY(sa.SmallInteger(), dimensions=1), nullable=True)
+    )
+    op.add_column(
+        'business_profiles',
+        sa.Column('business_hours_close_min', postgresql.ARRAY(sa.SmallInteger(), dimensions=1), nullable=True)
+    )
+    
+    # Backfill existing profiles; free-form hours leave both columns NULL
+    business_profiles = sa.table(
+        'business_profiles',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('business_hours', sa.JSON()),
+        sa.column('business_hours_open_min', postgresql.ARRAY(sa.SmallInteger(), dimensions=1)),
+        sa.column('business_hours_close_min', postgresql.ARRAY(sa.SmallInteger(), dimensions=1)),
+    )
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(business_profiles.c.id, business_profiles.c.business_hours)
+    ).all()
+    for profile_id, business_hours in rows:
+        if not business_hours:
+            continue
+        connection.execute(
+            business_profiles.update()
+            .where(business_profiles.c.id == profile_id)
+            .values(**business_hours_arrays(business_hours))
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('business_profiles', 'business_hours_close_min')
+    op.drop_column('business_profiles', 'business_hours_open_min')
@@ -0,0 +1,49 @@
+"""Move call_summaries.summary_text into call_summary_texts
+
+Revision ID: 934558ab5ca2
+Revises: bb3ad8a10b2c
+Create Date: 2026-10-16 10:41:52.917406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '934558ab5ca2'
+down_revision: Union[str, None] = 'bb3ad8a10b2c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create sibling table for the long summary text
+    op.create_table(
+        'call_summary_texts',
+        sa.Column('call_summary_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('call_summaries.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('tenants.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('summary_text', sa.Text(), nullable=False),
+    )
+    op.create_index('idx_call_summary_text_tenant_id', 'call_summary_texts', ['tenant_id'])
+
+    # Copy existing text, then drop it from the hot table
+    op.execute(
+        "INSERT INTO call_summary_texts (call_summary_id, tenant_id, summary_text) "
+        "SELECT id, tenant_id, summary_text FROM call_summaries"
+    )
+    op.drop_column('call_summaries', 'summary_text')
+
+
+def downgrade() -> None:
+    op.add_column('call_summaries', sa.Column('summary_text', sa.Text(), nullable=True))
+    op.execute(
+        "UPDATE call_summaries SET summary_text = t.summary_text "
+        "FROM call_summary_texts t WHERE t.call_summary_id = call_summaries.id"
+    )
+    op.execute("UPDATE call_summaries SET summary_text = '' WHERE summary_text IS NULL")
+    op.alter_column('call_summaries', 'summary_text', nullable=False)
+
+    op.drop_index('idx_call_summary_text_tenant_id', 'call_summary_texts')
+    op.drop_table('call_summary_texts')
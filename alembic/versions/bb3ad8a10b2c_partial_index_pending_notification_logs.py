@@ -0,0 +1,33 @@
+"""Replace notification_logs status index with a partial pending index
+
+Revision ID: bb3ad8a10b2c
+Revises: 1d7d04b3b381
+Create Date: 2026-10-16 10:03:17.284519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'bb3ad8a10b2c'
+down_revision: Union[str, None] = '1d7d04b3b381'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Index only the retry backlog (status = 'pending')
+    op.create_index(
+        'idx_notif_pending',
+        'notification_logs',
+        ['tenant_id', 'sent_at'],
+        postgresql_where=sa.text("status = 'pending'")
+    )
+    op.drop_index('idx_notification_log_status', 'notification_logs', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index('idx_notification_log_status', 'notification_logs', ['status'])
+    op.drop_index('idx_notif_pending', 'notification_logs')
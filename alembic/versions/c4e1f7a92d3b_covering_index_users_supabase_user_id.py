@@ -0,0 +1,50 @@
+"""Replace users.supabase_user_id index with a unique covering index
+
+Revision ID: c4e1f7a92d3b
+Revises: 934558ab5ca2
+Create Date: 2026-10-16 11:36:08.614253
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1f7a92d3b'
+down_revision: Union[str, None] = '934558ab5ca2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_users_supabase_uid_covering',
+            'users',
+            ['supabase_user_id'],
+            unique=True,
+            postgresql_include=['id', 'tenant_id', 'role', 'email'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_user_supabase_user_id',
+            'users',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_user_supabase_user_id',
+            'users',
+            ['supabase_user_id'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_users_supabase_uid_covering',
+            'users',
+            postgresql_concurrently=True
+        )
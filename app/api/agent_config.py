@@ -11,18 +11,22 @@ All endpoints enforce strict tenant isolation.
 from uuid import UUID
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.orm import Session, joinedload
 
 from app.config.database import get_db
 from app.models import Tenant, BusinessProfile
 from app.services.auth import CurrentUser, get_current_user
+from app.services.tenant_cache import invalidate_primary_language
 from app.schemas import (
+    AgentConfigAdapter,
     AgentConfigResponse,
     AgentConfigUpdate,
     BusinessProfileResponse,
     BusinessProfileCreate,
     BusinessProfileUpdate,
+    business_hours_arrays,
+    from_orm_fast,
 )
 
 
@@ -34,7 +38,7 @@ async def get_agent_config(
     tenant_id: UUID,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[CurrentUser, Depends(get_current_user)]
-) -> AgentConfigResponse:
+) -> Response:
     """
     Get agent configuration for a tenant.
     
@@ -46,7 +50,7 @@ async def get_agent_config(
         current_user: Authenticated user
         
     Returns:
-        AgentConfigResponse: Agent configuration including primary_language and business_profile
+        Response: JSON AgentConfigResponse with primary_language and business_profile
         
     Raises:
         HTTPException: 403 if tenant_id doesn't match user's tenant
@@ -59,8 +63,10 @@ async def get_agent_config(
             detail="Access denied: tenant_id mismatch"
         )
     
-    # Fetch tenant
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    # Fetch tenant and business profile (one-to-one) in a single SELECT ... JOIN
+    tenant = db.query(Tenant).options(
+        joinedload(Tenant.business_profile)
+    ).filter(Tenant.id == tenant_id).first()
     
     if not tenant:
         raise HTTPException(
@@ -68,16 +74,14 @@ async def get_agent_config(
             detail="Tenant not found"
         )
     
-    # Fetch business profile if exists
-    business_profile = db.query(BusinessProfile).filter(
-        BusinessProfile.tenant_id == tenant_id
-    ).first()
+    business_profile = tenant.business_profile
     
-    return AgentConfigResponse(
+    config = AgentConfigResponse(
         tenant_id=tenant.id,
         primary_language=tenant.primary_language,
-        business_profile=BusinessProfileResponse.model_validate(business_profile) if business_profile else None
+        business_profile=from_orm_fast(BusinessProfileResponse, business_profile) if business_profile else None
     )
+    return Response(content=AgentConfigAdapter.dump_json(config), media_type="application/json")
 
 
 @router.patch("/tenants/{tenant_id}/agent-config", response_model=AgentConfigResponse)
@@ -120,8 +124,10 @@ async def update_agent_config(
             detail="Access denied: owner or admin role required"
         )
     
-    # Fetch tenant
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    # Fetch tenant and business profile (one-to-one) in a single SELECT ... JOIN
+    tenant = db.query(Tenant).options(
+        joinedload(Tenant.business_profile)
+    ).filter(Tenant.id == tenant_id).first()
     
     if not tenant:
         raise HTTPException(
@@ -134,13 +140,11 @@ async def update_agent_config(
         tenant.primary_language = config_update.primary_language
     
     # Update or create business profile if provided
-    business_profile = None
+    business_profile = tenant.business_profile
     if config_update.business_profile is not None:
-        business_profile = db.query(BusinessProfile).filter(
-            BusinessProfile.tenant_id == tenant_id
-        ).first()
-        
         profile_data = config_update.business_profile.model_dump(exclude_unset=True)
+        if profile_data.get("business_hours") is not None:
+            profile_data.update(business_hours_arrays(profile_data["business_hours"]))
         
         if business_profile:
             # Update existing business profile
@@ -160,19 +164,17 @@ async def update_agent_config(
                 **profile_data
             )
             db.add(business_profile)
-    else:
-        # Fetch existing business profile if not updating it
-        business_profile = db.query(BusinessProfile).filter(
-            BusinessProfile.tenant_id == tenant_id
-        ).first()
     
     db.commit()
     db.refresh(tenant)
     if business_profile:
         db.refresh(business_profile)
     
+    if config_update.primary_language is not None:
+        invalidate_primary_language(tenant_id)
+    
     return AgentConfigResponse(
         tenant_id=tenant.id,
         primary_language=tenant.primary_language,
-        business_profile=BusinessProfileResponse.model_validate(business_profile) if business_profile else None
+        business_profile=from_orm_fast(BusinessProfileResponse, business_profile) if business_profile else None
     )
@@ -8,13 +8,21 @@ All endpoints enforce tenant isolation and the one default profile per tenant ru
 from uuid import UUID
 from typing import Annotated, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
 from app.models import Tenant, AIProfile
-from app.schemas import AIProfileCreate, AIProfileUpdate, AIProfileResponse
+from app.schemas import (
+    AIProfileCreate,
+    AIProfileUpdate,
+    AIProfileResponse,
+    AIProfileListAdapter,
+    from_orm_fast,
+    response_columns,
+)
 from app.services.auth import CurrentUser, get_current_user
+from app.services.ai_profile_cache import invalidate_ai_profile
 
 
 router = APIRouter(tags=["ai-profiles"])
@@ -90,7 +98,7 @@ async def create_ai_profile(
     db.commit()
     db.refresh(new_profile)
     
-    return AIProfileResponse.model_validate(new_profile)
+    return from_orm_fast(AIProfileResponse, new_profile)
 
 
 @router.get("/tenants/{tenant_id}/ai-profiles", response_model=List[AIProfileResponse])
@@ -98,7 +106,7 @@ async def list_ai_profiles(
     tenant_id: UUID,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[CurrentUser, Depends(get_current_user)]
-) -> List[AIProfileResponse]:
+) -> Response:
     """
     List all AI profiles for a tenant.
     
@@ -107,7 +115,7 @@ async def list_ai_profiles(
         db: Database session
         
     Returns:
-        List[AIProfileResponse]: List of AI profiles
+        Response: JSON list of AIProfileResponse
         
     Raises:
         HTTPException: 404 if tenant not found
@@ -120,7 +128,7 @@ async def list_ai_profiles(
         )
     
     # Validate tenant exists
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    tenant = db.query(Tenant.id).filter(Tenant.id == tenant_id).first()
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -128,11 +136,17 @@ async def list_ai_profiles(
         )
     
     # Get all AI profiles for tenant
-    profiles = db.query(AIProfile).filter(
+    # Select only the response columns and build responses from rows
+    profiles = db.query(*response_columns(AIProfileResponse, AIProfile)).filter(
         AIProfile.tenant_id == tenant_id
     ).all()
     
-    return [AIProfileResponse.model_validate(profile) for profile in profiles]
+    return Response(
+        content=AIProfileListAdapter.dump_json(
+            [from_orm_fast(AIProfileResponse, profile) for profile in profiles]
+        ),
+        media_type="application/json"
+    )
 
 
 @router.patch(
@@ -207,8 +221,9 @@ async def update_ai_profile(
     
     db.commit()
     db.refresh(profile)
+    invalidate_ai_profile(tenant_id, ai_profile_id)
     
-    return AIProfileResponse.model_validate(profile)
+    return from_orm_fast(AIProfileResponse, profile)
 
 
 # TODO: Add LLM provider integration (OpenAI, Anthropic, etc.)
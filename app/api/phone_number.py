@@ -8,13 +8,20 @@ All endpoints enforce tenant isolation and validation.
 from uuid import UUID
 from typing import Annotated, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.config.database import get_db
 from app.models import Tenant, PhoneNumber
-from app.schemas import PhoneNumberCreate, PhoneNumberUpdate, PhoneNumberResponse
+from app.schemas import (
+    PhoneNumberCreate,
+    PhoneNumberUpdate,
+    PhoneNumberResponse,
+    PhoneNumberListAdapter,
+    from_orm_fast,
+    response_columns,
+)
 from app.services.auth import CurrentUser, get_current_user
 
 
@@ -100,7 +107,7 @@ async def create_phone_number(
             detail="Phone number already exists"
         )
     
-    return PhoneNumberResponse.model_validate(new_phone)
+    return from_orm_fast(PhoneNumberResponse, new_phone)
 
 
 @router.get("/tenants/{tenant_id}/phone-numbers", response_model=List[PhoneNumberResponse])
@@ -108,7 +115,7 @@ async def list_phone_numbers(
     tenant_id: UUID,
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[CurrentUser, Depends(get_current_user)]
-) -> List[PhoneNumberResponse]:
+) -> Response:
     """
     List all phone numbers for a tenant.
     
@@ -118,7 +125,7 @@ async def list_phone_numbers(
         current_user: Current authenticated user
         
     Returns:
-        List[PhoneNumberResponse]: List of phone numbers
+        Response: JSON list of PhoneNumberResponse
         
     Raises:
         HTTPException: 403 if tenant_id doesn't match user's tenant
@@ -132,7 +139,7 @@ async def list_phone_numbers(
         )
     
     # Validate tenant exists
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    tenant = db.query(Tenant.id).filter(Tenant.id == tenant_id).first()
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -140,11 +147,17 @@ async def list_phone_numbers(
         )
     
     # Get all phone numbers for tenant
-    phone_numbers = db.query(PhoneNumber).filter(
+    # Select only the response columns and build responses from rows
+    phone_numbers = db.query(*response_columns(PhoneNumberResponse, PhoneNumber)).filter(
         PhoneNumber.tenant_id == tenant_id
     ).all()
     
-    return [PhoneNumberResponse.model_validate(phone) for phone in phone_numbers]
+    return Response(
+        content=PhoneNumberListAdapter.dump_json(
+            [from_orm_fast(PhoneNumberResponse, phone) for phone in phone_numbers]
+        ),
+        media_type="application/json"
+    )
 
 
 @router.patch(
@@ -221,7 +234,7 @@ async def update_phone_number(
     db.commit()
     db.refresh(phone_number)
     
-    return PhoneNumberResponse.model_validate(phone_number)
+    return from_orm_fast(PhoneNumberResponse, phone_number)
 
 
 # TODO: Add telephony provider integration (Twilio, Telnyx, etc.)
@@ -11,19 +11,23 @@ The sandbox endpoint:
 - Returns mock responses with session management
 """
 
-import uuid
+import base64
+import os
+import time
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
-from app.models import Tenant, BusinessProfile
-from app.schemas import SandboxSimulateRequest, SandboxSimulateResponse
+from app.models import BusinessProfile
+from app.schemas import SandboxSimulateRequest, SandboxSimulateResponse, is_open_at
 from app.services import (
     LanguageDetectionService,
     LanguageSwitchDetector,
-    RuntimeContextBuilder
+    RuntimeContextBuilder,
+    get_primary_language
 )
 
 
@@ -35,6 +39,31 @@ language_detector = LanguageDetectionService()
 language_switcher = LanguageSwitchDetector()
 context_builder = RuntimeContextBuilder()
 
+# RFC 4648 base32 -> Crockford base32 (keeps ASCII order == numeric order)
+_CROCKFORD_TRANSLATION = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567",
+    "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+)
+
+
+def _new_session_id() -> str:
+    """
+    Generate a time-sortable session ID (UUIDv7, Crockford base32).
+    
+    Layout follows RFC 9562 UUIDv7: 48-bit Unix millisecond timestamp,
+    then version/variant bits and 74 random bits. Encoded as 26 uppercase
+    Crockford base32 characters, so IDs sort lexically by creation time.
+    
+    Returns:
+        str: 26-character session ID
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    encoded = base64.b32encode(value.to_bytes(16, "big")).decode("ascii").rstrip("=")
+    return encoded.translate(_CROCKFORD_TRANSLATION)
+
 
 @router.post("/sandbox/simulate", response_model=SandboxSimulateResponse)
 async def simulate_agent_response(
@@ -68,12 +97,12 @@ async def simulate_agent_response(
         "This is a mock response based on assembled prompt. No AI inference performed."
     """
     # Generate session_id if not provided
-    session_id = request.session_id or str(uuid.uuid4())
+    session_id = request.session_id or _new_session_id()
     
-    # Fetch tenant
-    tenant = db.query(Tenant).filter(Tenant.id == request.tenant_id).first()
+    # Fetch tenant primary language (cached in-process)
+    primary_language = get_primary_language(db, request.tenant_id)
     
-    if not tenant:
+    if primary_language is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tenant not found"
@@ -86,7 +115,16 @@ async def simulate_agent_response(
     
     # Convert business profile to dict for context builder
     business_profile_dict = None
+    profile_version = None
+    open_now = None
     if business_profile:
+        profile_version = (business_profile.id, business_profile.updated_at)
+        # Profiles carry no timezone; hours are read as server-local time
+        open_now = is_open_at(
+            business_profile.business_hours_open_min,
+            business_profile.business_hours_close_min,
+            datetime.now()
+        )
         business_profile_dict = {
             "business_name": business_profile.business_name,
             "business_type": business_profile.business_type,
@@ -102,7 +140,7 @@ async def simulate_agent_response(
     detection_result = language_detector.detect_language(
         text=request.user_text,
         session_id=session_id,
-        primary_language=tenant.primary_language.value
+        primary_language=primary_language.value
     )
     detected_language = detection_result["detected_language"]
     
@@ -124,7 +162,9 @@ async def simulate_agent_response(
     assembled_context = context_builder.build_context(
         business_profile=business_profile_dict,
         speaking_language=speaking_language,
-        user_text=request.user_text
+        user_text=request.user_text,
+        profile_version=profile_version,
+        open_now=open_now
     )
     
     # Step 4: Return SIMULATED response
@@ -14,8 +14,9 @@ from sqlalchemy.orm import Session
 
 from app.config.database import get_db
 from app.models import Tenant
-from app.schemas import TenantCreate, TenantUpdate, TenantResponse
+from app.schemas import TenantCreate, TenantUpdate, TenantResponse, from_orm_fast
 from app.services.auth import get_current_user, CurrentUser
+from app.services.tenant_cache import invalidate_primary_language
 
 
 router = APIRouter(tags=["tenants"])
@@ -50,7 +51,7 @@ async def create_tenant(
     db.commit()
     db.refresh(new_tenant)
     
-    return TenantResponse.model_validate(new_tenant)
+    return from_orm_fast(TenantResponse, new_tenant)
 
 
 @router.get("/me", response_model=TenantResponse)
@@ -81,7 +82,7 @@ async def get_current_tenant(
             detail="Tenant not found"
         )
     
-    return TenantResponse.model_validate(tenant)
+    return from_orm_fast(TenantResponse, tenant)
 
 
 @router.get("/tenants/{tenant_id}", response_model=TenantResponse)
@@ -122,7 +123,7 @@ async def get_tenant(
             detail="Tenant not found"
         )
     
-    return TenantResponse.model_validate(tenant)
+    return from_orm_fast(TenantResponse, tenant)
 
 
 @router.patch("/tenants/{tenant_id}", response_model=TenantResponse)
@@ -181,7 +182,10 @@ async def update_tenant(
     db.commit()
     db.refresh(tenant)
     
-    return TenantResponse.model_validate(tenant)
+    if "primary_language" in update_data:
+        invalidate_primary_language(tenant_id)
+    
+    return from_orm_fast(TenantResponse, tenant)
 
 
 # TODO: Add tenant deletion endpoint (soft delete only)
@@ -5,24 +5,77 @@ Sets up SQLAlchemy engine and session for PostgreSQL database.
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from app.config import settings
 
+# Connection budget per worker process: the sync engine (API endpoints) may
+# open up to 20 + 40 = 60 connections and the async engine (get_current_user
+# on every authenticated request, AI loop profile loads) up to 10 + 20 = 30,
+# i.e. 90 per worker. workers x 90 must stay below Postgres max_connections
+# (default 100, less superuser_reserved_connections); raise max_connections
+# or put PgBouncer in front before running more than one worker.
+SYNC_POOL_SIZE, SYNC_MAX_OVERFLOW = 20, 40
+ASYNC_POOL_SIZE, ASYNC_MAX_OVERFLOW = 10, 20
+
 # Create database engine with production-ready pooling configuration for AI call infrastructure (audio streaming implementation pending)
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,      # Verify connections before using
-    pool_size=10,            # Connection pool size
-    max_overflow=20,         # Max connections beyond pool_size
-    pool_recycle=3600,       # Recycle connections after 1 hour
-    echo=settings.debug,     # Log SQL queries in debug mode
+    pool_pre_ping=True,                # Verify connections before using
+    pool_size=SYNC_POOL_SIZE,          # Connection pool size
+    max_overflow=SYNC_MAX_OVERFLOW,    # Max connections beyond pool_size
+    pool_recycle=3600,                 # Recycle connections after 1 hour
+    echo=settings.debug,               # Log SQL queries in debug mode
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _async_database_url(database_url: str) -> URL:
+    """
+    Build the asyncpg URL from the libpq-style DATABASE_URL.
+    
+    asyncpg rejects libpq query parameters (sslmode, connect_timeout,
+    application_name, ...), so they are dropped; sslmode is carried
+    over as asyncpg's equivalent ssl parameter.
+    
+    Args:
+        database_url: Sync (psycopg2) database URL
+        
+    Returns:
+        URL: Same database with the postgresql+asyncpg driver
+    """
+    url = make_url(database_url)
+    query = {}
+    sslmode = url.query.get("sslmode") or url.query.get("ssl")
+    if sslmode:
+        query["ssl"] = sslmode
+    return url.set(drivername="postgresql+asyncpg", query=query)
+
+
+# Async engine (asyncpg) for dependencies that run on the event loop,
+# e.g. get_current_user, so they don't block it or hop to the threadpool
+async_engine = create_async_engine(
+    _async_database_url(settings.database_url),
+    pool_pre_ping=True,
+    pool_size=ASYNC_POOL_SIZE,
+    max_overflow=ASYNC_MAX_OVERFLOW,
+    pool_recycle=3600,
+    echo=settings.debug,
+)
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
 # Base class for all models using SQLAlchemy 2.0 style
 class Base(DeclarativeBase):
     """Base class for all database models."""
@@ -41,3 +94,14 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency function to get an async database session.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
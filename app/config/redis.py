@@ -118,6 +118,8 @@ async def get_redis_client() -> redis.Redis:
 # Call turns: "call:{call_id}:turns" -> Integer turn count
 # Call started: "call:{call_id}:started_at" -> Unix timestamp
 # Call lock: "call:{call_id}:lock" -> Lock for atomic operations
+# Greeting: "greeting:{ai_profile_id}:{sha1(system_prompt)}" -> Greeting text (24h)
+# TTS audio: "tts:{sha1(text)}:{voice}:slin" -> Base64 PCM 16-bit 8kHz mono (24h)
 #
 # TTL: All call-related keys should expire after call ends + 1 hour
 # This prevents memory leaks from abandoned calls.
@@ -45,6 +45,10 @@ class Settings(BaseSettings):
     
     # AI Service Settings (OPTIONAL with defaults)
     stt_model: str = Field(default="whisper-1", env="STT_MODEL")
+    stt_backend: str = Field(default="openai", env="STT_BACKEND")  # "openai" or "local"
+    stt_local_model: str = Field(default="small.en", env="STT_LOCAL_MODEL")
+    stt_local_cpu_threads: int = Field(default=4, env="STT_LOCAL_CPU_THREADS")
+    stt_local_workers: int = Field(default=2, env="STT_LOCAL_WORKERS")
     llm_model: str = Field(default="gpt-4", env="LLM_MODEL")
     tts_model: str = Field(default="tts-1", env="TTS_MODEL")
     tts_voice: str = Field(default="alloy", env="TTS_VOICE")
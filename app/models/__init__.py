@@ -13,10 +13,10 @@ from datetime import datetime, timezone
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
-    Column, String, Boolean, DateTime, Text, ForeignKey, Integer,
-    Enum, UniqueConstraint, Index, JSON
+    Column, String, Boolean, DateTime, Text, ForeignKey, Integer, SmallInteger,
+    Enum, UniqueConstraint, Index, JSON, text
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 
 from app.config.database import Base
@@ -98,7 +98,13 @@ class User(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_user_supabase_user_id", "supabase_user_id"),
+        # Covering index: the per-request auth lookup is an index-only scan
+        Index(
+            "idx_users_supabase_uid_covering",
+            "supabase_user_id",
+            unique=True,
+            postgresql_include=["id", "tenant_id", "role", "email"]
+        ),
         Index("idx_user_email", "email"),
         Index("idx_user_tenant_id", "tenant_id"),
     )
@@ -248,6 +254,12 @@ class BusinessProfile(Base):
     
     # Operating parameters - stored as JSON
     business_hours = Column(JSON, nullable=False, default=lambda: {})  # e.g., {"monday": "9-5", "tuesday": "9-5"}
+    # Business hours as minutes-since-midnight, indexed by weekday (0=Monday).
+    # Derived server-side from business_hours on write; open == close means closed
+    # that day, and a close past 1440 runs overnight into the next day.
+    # Read with app.schemas.is_open_at().
+    business_hours_open_min = Column(ARRAY(SmallInteger, dimensions=1), nullable=True)
+    business_hours_close_min = Column(ARRAY(SmallInteger, dimensions=1), nullable=True)
     booking_enabled = Column(Boolean, nullable=False, default=False)
     
     # Agent behavior rules - stored as JSON
@@ -277,6 +289,10 @@ class CallSummary(Base):
     - Always tenant_id scoped
     - Stores structured summary data (not raw transcripts)
     - Used for notifications and dashboard display
+    
+    The long summary text lives in CallSummaryText so list scans of this
+    table stay on small rows. It is never loaded implicitly; detail views
+    must request it with joinedload(CallSummary.summary_body).
     """
     __tablename__ = "call_summaries"
     
@@ -284,8 +300,7 @@ class CallSummary(Base):
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     call_id = Column(UUID(as_uuid=True), ForeignKey("calls.id", ondelete="CASCADE"), nullable=False, unique=True)
     
-    # Summary content
-    summary_text = Column(Text, nullable=False)
+    # Summary content (summary_text is stored in call_summary_texts)
     caller_intent = Column(String(255), nullable=True)
     resolution_status = Column(String(100), nullable=True)  # e.g., "resolved", "needs_callback", "transferred"
     
@@ -296,6 +311,14 @@ class CallSummary(Base):
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     
+    # Relationships
+    summary_body = relationship(
+        "CallSummaryText",
+        uselist=False,
+        lazy="noload",
+        cascade="all, delete-orphan"
+    )
+    
     # Indexes
     __table_args__ = (
         Index("idx_call_summary_tenant_id", "tenant_id"),
@@ -304,6 +327,25 @@ class CallSummary(Base):
     )
 
 
+class CallSummaryText(Base):
+    """
+    CallSummaryText model - Long-form text of a call summary.
+    
+    STRICT TENANT ISOLATION: Each summary text belongs to exactly one tenant.
+    
+    Split out of CallSummary so the frequently scanned summary rows stay
+    small. One-to-one with CallSummary (call_summary_id is the primary key).
+    """
+    __tablename__ = "call_summary_texts"
+    
+    call_summary_id = Column(UUID(as_uuid=True), ForeignKey("call_summaries.id", ondelete="CASCADE"), primary_key=True)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    summary_text = Column(Text, nullable=False)
+    
+    # Indexes
+    __table_args__ = (
+        Index("idx_call_summary_text_tenant_id", "tenant_id"),
+    )
 
 
 class NotificationLog(Base):
@@ -338,7 +380,13 @@ class NotificationLog(Base):
     __table_args__ = (
         Index("idx_notification_log_tenant_id", "tenant_id"),
         Index("idx_notification_log_call_id", "call_id"),
-        Index("idx_notification_log_status", "status"),
+        # Partial index: only covers the retry backlog, not the 'sent' majority
+        Index(
+            "idx_notif_pending",
+            "tenant_id",
+            "sent_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
 
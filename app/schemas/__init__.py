@@ -6,13 +6,52 @@ All schemas respect tenant isolation boundaries.
 """
 
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple, Type, TypeVar, Any
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.models import TenantStatus, TenantPlan, CallDirection, CallStatus, AIRole, PrimaryLanguage, UserRole
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def from_orm_fast(cls: Type[ModelT], obj: Any) -> ModelT:
+    """
+    Build a response schema from a trusted ORM object without validation.
+    
+    Uses model_construct() to copy attributes straight off the SQLAlchemy
+    row. Only use this for response models populated from our own database;
+    request schemas (*Create, *Update) must keep full validation.
+    
+    Args:
+        cls: Response schema class (e.g. TenantResponse)
+        obj: ORM instance to read attributes from
+        
+    Returns:
+        Instance of cls populated from obj
+    """
+    return cls.model_construct(**{f: getattr(obj, f) for f in cls.model_fields})
+
+
+def response_columns(cls: Type[BaseModel], orm_model: Any) -> List[Any]:
+    """
+    List the ORM columns needed to populate a response schema.
+    
+    Lets list endpoints select only the columns a response needs
+    (db.query(*response_columns(...))) and build responses from the
+    returned rows with from_orm_fast(), skipping full ORM entity loading.
+    
+    Args:
+        cls: Response schema class
+        orm_model: SQLAlchemy model class with matching attribute names
+        
+    Returns:
+        List of column attributes in schema field order
+    """
+    return [getattr(orm_model, f) for f in cls.model_fields]
+
+
 # Tenant Schemas
 class TenantBase(BaseModel):
     """Base tenant schema."""
@@ -184,6 +223,128 @@ class CurrentUserResponse(BaseModel):
     email: str
 
 
+# Business hours parsing
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+def _parse_clock(value: str) -> int:
+    """Parse "9", "9:30" or "09:30" into minutes since midnight."""
+    hours, sep, minutes = value.strip().partition(":")
+    if not hours.isdigit() or (sep and not (minutes.isdigit() and len(minutes) == 2)):
+        raise ValueError(f"Invalid time: {value}")
+    total = int(hours) * 60 + (int(minutes) if sep else 0)
+    if (sep and int(minutes) >= 60) or not 0 <= total <= 24 * 60:
+        raise ValueError(f"Invalid time: {value}")
+    return total
+
+
+def parse_business_hours(business_hours: Dict[str, str]) -> Optional[Tuple[List[int], List[int]]]:
+    """
+    Convert {"monday": "9-5", ...} into open/close minute arrays.
+    
+    Arrays are indexed by weekday (0=Monday) and hold minutes since midnight.
+    Days that are missing or marked "closed" get open == close == 0.
+    When both ends are bare 12-hour values (1-12, no minutes) and the close
+    is before the open, the close is read as PM ("9-5" -> 09:00-17:00).
+    Any other close before the open is an overnight range and is stored past
+    midnight ("22-6" -> 1320-1800, i.e. 22:00 until 06:00 the next day).
+    Equal open and close times ("12-12", "0-0") are ambiguous and rejected.
+    
+    Args:
+        business_hours: Day name -> "HH[:MM]-HH[:MM]" mapping
+        
+    Returns:
+        (open_min, close_min) lists of length 7, or None if any entry
+        cannot be parsed (free-form hours are kept as-is in business_hours)
+    """
+    open_min = [0] * 7
+    close_min = [0] * 7
+    
+    for day, hours in business_hours.items():
+        day_key = day.strip().lower()
+        index = next((i for i, name in enumerate(WEEKDAYS) if name.startswith(day_key)), None)
+        if index is None or len(day_key) < 3:
+            return None
+        
+        hours = (hours or "").strip().lower()
+        if hours in ("", "closed"):
+            continue
+        
+        try:
+            start, end = hours.split("-")
+            opens, closes = _parse_clock(start), _parse_clock(end)
+        except ValueError:
+            return None
+        
+        if closes == opens:
+            # "12-12", "0-0": 12 or 24 hours? Keep as free-form
+            return None
+        if closes < opens:
+            if _is_bare_12h(start) and _is_bare_12h(end):
+                closes += 12 * 60
+            else:
+                closes += 24 * 60
+        open_min[index] = opens
+        close_min[index] = closes
+    
+    return open_min, close_min
+
+
+def _is_bare_12h(value: str) -> bool:
+    """True for a bare hour ("9", "12") that could be a 12-hour clock value."""
+    value = value.strip()
+    return value.isdigit() and 1 <= int(value) <= 12
+
+
+def is_open_at(
+    open_min: Optional[List[int]],
+    close_min: Optional[List[int]],
+    when: datetime
+) -> Optional[bool]:
+    """
+    Check the weekday minute arrays for whether the business is open.
+    
+    A close past 1440 runs into the next day, so the previous day's range
+    is checked too ("22-6" on Monday covers Tuesday 00:00-06:00).
+    
+    Args:
+        open_min: BusinessProfile.business_hours_open_min
+        close_min: BusinessProfile.business_hours_close_min
+        when: Local datetime to check
+        
+    Returns:
+        True/False if hours are configured, None if they are not
+    """
+    if not open_min or not close_min or len(open_min) != 7 or len(close_min) != 7:
+        return None
+    
+    weekday = when.weekday()
+    now_min = when.hour * 60 + when.minute
+    if open_min[weekday] <= now_min < close_min[weekday]:
+        return True
+    return now_min + 24 * 60 < close_min[weekday - 1]
+
+
+def business_hours_arrays(business_hours: Dict[str, str]) -> Dict[str, Optional[List[int]]]:
+    """
+    Derive the business_hours_open_min/close_min column values.
+    
+    These columns are computed server-side only; clients never send them.
+    
+    Args:
+        business_hours: Day name -> "HH[:MM]-HH[:MM]" mapping
+        
+    Returns:
+        Dict with business_hours_open_min and business_hours_close_min
+        (both None if the hours are free-form)
+    """
+    open_min, close_min = parse_business_hours(business_hours) or (None, None)
+    return {
+        "business_hours_open_min": open_min,
+        "business_hours_close_min": close_min,
+    }
+
+
 # BusinessProfile Schemas
 class BusinessProfileBase(BaseModel):
     """Base business profile schema."""
@@ -218,6 +379,8 @@ class BusinessProfileResponse(BusinessProfileBase):
     """Schema for business profile response."""
     id: UUID
     tenant_id: UUID
+    business_hours_open_min: Optional[List[int]] = Field(None, description="Derived from business_hours")
+    business_hours_close_min: Optional[List[int]] = Field(None, description="Derived from business_hours")
     created_at: datetime
     updated_at: datetime
     
@@ -249,7 +412,10 @@ class SandboxSimulateRequest(BaseModel):
     """
     tenant_id: UUID = Field(..., description="Tenant ID for configuration lookup")
     user_text: str = Field(..., min_length=1, description="User input text")
-    session_id: Optional[str] = Field(None, description="Optional session ID (auto-generated if not provided)")
+    session_id: Optional[str] = Field(
+        None,
+        description="Optional session ID (auto-generated if not provided: 26-char Crockford base32 UUIDv7, time-sortable)"
+    )
 
 
 class SandboxSimulateResponse(BaseModel):
@@ -267,6 +433,14 @@ class SandboxSimulateResponse(BaseModel):
     )
 
 
+# Pre-built serializers for hot read endpoints.
+# Handlers return Response(content=Adapter.dump_json(...)) to serialize straight
+# to JSON bytes instead of going through jsonable_encoder.
+PhoneNumberListAdapter = TypeAdapter(List[PhoneNumberResponse])
+AIProfileListAdapter = TypeAdapter(List[AIProfileResponse])
+AgentConfigAdapter = TypeAdapter(AgentConfigResponse)
+
+
 # TODO: Future schemas to be added (all must respect tenant_id boundaries):
 # TODO: - CallRecordingResponse (tenant_id, call_id, recording_url)
 # TODO: - CallTranscriptResponse (tenant_id, call_id, transcript_text)
@@ -5,6 +5,8 @@ These services provide simulated AI functionality without real LLM calls:
 - Language detection (simulated)
 - Language switching detection (simulated)
 - Runtime context building (prompt assembly, no LLM)
+- Cached tenant lookups (primary_language)
+- Cached AI profile lookups for the live call path
 
 All responses are clearly marked as simulated/mock.
 """
@@ -12,9 +14,15 @@ All responses are clearly marked as simulated/mock.
 from app.services.language_detection import LanguageDetectionService
 from app.services.language_switch import LanguageSwitchDetector
 from app.services.runtime_context import RuntimeContextBuilder
+from app.services.tenant_cache import get_primary_language, invalidate_primary_language
+from app.services.ai_profile_cache import get_ai_profile, invalidate_ai_profile
 
 __all__ = [
     "LanguageDetectionService",
     "LanguageSwitchDetector",
     "RuntimeContextBuilder",
+    "get_primary_language",
+    "invalidate_primary_language",
+    "get_ai_profile",
+    "invalidate_ai_profile",
 ]
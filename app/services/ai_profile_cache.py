@@ -0,0 +1,87 @@
+"""
+In-process AI profile cache for the live call path.
+
+Every inbound call loads its AIProfile (system prompt + role) before the
+greeting can be generated. Profiles are few per tenant and rarely edited,
+so this module caches them in memory with a short TTL, keyed by
+(tenant_id, ai_profile_id). Misses are loaded through an AsyncSession so
+the event loop is never blocked by the database round-trip.
+
+WARNING: The cache is per-process. Every write path that changes an AI
+profile MUST call invalidate_ai_profile() so this process serves fresh
+data; other workers converge within the TTL.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import AIProfile, AIRole
+
+
+@dataclass(slots=True, frozen=True)
+class CachedAIProfile:
+    """Immutable snapshot of the AIProfile fields used during a call."""
+    system_prompt: str
+    role: AIRole
+
+
+# (tenant_id, ai_profile_id) -> CachedAIProfile (only existing profiles are cached)
+_ai_profile_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)
+_ai_profile_lock = threading.Lock()
+
+
+async def get_ai_profile(
+    db: AsyncSession,
+    tenant_id: UUID,
+    ai_profile_id: UUID
+) -> Optional[CachedAIProfile]:
+    """
+    Get a tenant's AI profile, served from cache when possible.
+
+    Args:
+        db: Async database session (used on cache miss)
+        tenant_id: Tenant UUID
+        ai_profile_id: AI profile UUID
+
+    Returns:
+        CachedAIProfile, or None if the profile does not exist for this tenant
+    """
+    key = (str(tenant_id), str(ai_profile_id))
+    with _ai_profile_lock:
+        cached = _ai_profile_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(AIProfile.system_prompt, AIProfile.role).where(
+            AIProfile.id == ai_profile_id,
+            AIProfile.tenant_id == tenant_id
+        )
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    # Normalized once so the LLM prompt prefix and greeting cache key never drift
+    profile = CachedAIProfile(system_prompt=row.system_prompt.strip(), role=row.role)
+    with _ai_profile_lock:
+        _ai_profile_cache[key] = profile
+    return profile
+
+
+def invalidate_ai_profile(tenant_id: UUID, ai_profile_id: UUID) -> None:
+    """
+    Drop a cached AI profile.
+
+    Args:
+        tenant_id: Tenant UUID
+        ai_profile_id: AI profile UUID
+    """
+    with _ai_profile_lock:
+        _ai_profile_cache.pop((str(tenant_id), str(ai_profile_id)), None)
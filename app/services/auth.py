@@ -1,55 +1,169 @@
 """
 Authentication service for Supabase JWT verification.
 
-Implements JWT token verification with JWK caching and user lookup.
+Implements JWT token verification (HS256 secret or cached JWKS per kid)
+with verified-payload caching and user lookup.
 """
 
+import asyncio
+import json
 import jwt
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple
+from cachetools import TTLCache
 from fastapi import HTTPException, status, Depends, Header
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.config.database import get_db
+from app.config.database import get_async_db
 from app.models import User
 
 logger = logging.getLogger(__name__)
 
-# JWK cache (simple in-memory cache for production should use Redis)
-# WARNING: This in-memory cache will not work correctly in multi-process
-# deployments (e.g., multiple Gunicorn workers). For production, implement
-# Redis-based caching or use a shared cache mechanism.
-_jwk_cache: Optional[Dict[str, Any]] = None
-_jwk_cache_time: Optional[datetime] = None
-_jwk_cache_ttl = timedelta(hours=1)
+# JWKS cache: kid -> (PyJWK, algorithm) for asymmetric (RS256/ES256) Supabase tokens.
+# HS256 tokens are verified with settings.supabase_jwt_secret and never
+# touch this cache. Per-process; each worker fetches the JWKS on its own.
+_JWKS_TTL_SECONDS = 3600
+_JWKS_MIN_REFRESH_INTERVAL_SECONDS = 60  # Throttle forced refreshes for unknown kids
+_JWKS_FETCH_TIMEOUT_SECONDS = 5
+_JWK_DEFAULT_ALGORITHMS = {"RSA": "RS256", "EC": "ES256", "OKP": "EdDSA"}  # When a JWK has no "alg"
+_jwks_by_kid: Dict[str, Tuple[jwt.PyJWK, str]] = {}
+_jwks_fetched_at: Optional[float] = None  # time.monotonic() of last fetch attempt
+_jwks_etag: Optional[str] = None
+_jwks_lock = threading.Lock()
 
+# Verified JWT payload cache: signature tail -> decoded payload.
+# The key is the last _JWT_CACHE_KEY_CHARS of the signature segment. The
+# signature is unique per token and unforgeable, so no hashing is needed.
+# Clients reuse the same bearer token until it expires, so a hit skips the
+# HMAC verification and JSON decode. Entries are also rejected once the
+# token's own "exp" claim has passed. Invalid tokens are never cached.
+_JWT_CACHE_KEY_CHARS = 32
+_jwt_payload_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_jwt_payload_cache_lock = threading.Lock()
 
-def _fetch_jwks() -> Dict[str, Any]:
+# supabase_user_id -> CurrentUser (cache-aside for the per-request user lookup).
+# The TTL is the only invalidation: users are provisioned and changed outside
+# this API, so a role, tenant or email change (or a deleted user) can keep
+# authenticating with the old values for up to 120s. That window is accepted.
+_user_cache: TTLCache = TTLCache(maxsize=50_000, ttl=120)
+_user_cache_lock = threading.RLock()
+
+# DEV_AUTH_BYPASS user, looked up once per process (dev only; staleness is fine)
+_dev_user_cache: Optional["CurrentUser"] = None
+
+
+def _jwks_needs_refresh(force: bool = False) -> bool:
     """
-    Fetch JWKs from Supabase.
+    Check whether the JWKS cache is due for a refresh.
     
-    In production, this should be cached in Redis.
-    For now, using simple in-memory cache.
+    Args:
+        force: Unknown kid seen; refresh unless the throttle interval hasn't elapsed
+        
+    Returns:
+        True if _fetch_jwks() would hit the network
     """
-    global _jwk_cache, _jwk_cache_time
+    if _jwks_fetched_at is None:
+        return True
+    age = time.monotonic() - _jwks_fetched_at
+    return age >= (_JWKS_MIN_REFRESH_INTERVAL_SECONDS if force else _JWKS_TTL_SECONDS)
+
+
+def _fetch_jwks(force: bool = False) -> Dict[str, Tuple[jwt.PyJWK, str]]:
+    """
+    Get Supabase signing keys by kid, refreshing the cache when stale.
+    
+    Blocking (urllib); call it through asyncio.to_thread from async code.
     
-    # Check if cache is valid
-    if _jwk_cache and _jwk_cache_time:
-        if datetime.now() - _jwk_cache_time < _jwk_cache_ttl:
-            return _jwk_cache
+    Revalidates with If-None-Match so an unchanged key set costs a 304.
+    If a refresh fails, the previously fetched keys keep being served
+    (TTL renewal) so a JWKS outage doesn't reject valid tokens.
     
-    # For Phase 8, we'll use the JWT secret directly (HS256)
-    # In production with Supabase, you'd fetch from /.well-known/jwks.json
-    # For now, return a simple marker that we're using HS256
-    _jwk_cache = {"alg": "HS256"}
-    _jwk_cache_time = datetime.now()
+    Args:
+        force: Refresh even if the TTL hasn't elapsed (used for unknown kids)
+        
+    Returns:
+        Dict mapping kid to (PyJWK, algorithm name)
+    """
+    global _jwks_by_kid, _jwks_fetched_at, _jwks_etag
+    
+    now = time.monotonic()
+    if not _jwks_needs_refresh(force):
+        return _jwks_by_kid
     
-    return _jwk_cache
+    with _jwks_lock:
+        # Another thread may have refreshed while we waited
+        if _jwks_fetched_at is not None and _jwks_fetched_at > now:
+            return _jwks_by_kid
+        
+        url = f"{settings.supabase_url.rstrip('/')}/auth/v1/.well-known/jwks.json"
+        request = urllib.request.Request(url)
+        if _jwks_etag:
+            request.add_header("If-None-Match", _jwks_etag)
+        
+        try:
+            with urllib.request.urlopen(request, timeout=_JWKS_FETCH_TIMEOUT_SECONDS) as response:
+                keys = {}
+                for jwk_data in json.loads(response.read()).get("keys", []):
+                    kid = jwk_data.get("kid")
+                    algorithm = jwk_data.get("alg") or _JWK_DEFAULT_ALGORITHMS.get(jwk_data.get("kty"))
+                    if not kid or not algorithm:
+                        continue
+                    try:
+                        keys[kid] = (jwt.PyJWK(jwk_data, algorithm=algorithm), algorithm)
+                    except jwt.PyJWKError as e:
+                        logger.warning(f"Skipping unusable JWK {kid}: {e}")
+                _jwks_by_kid = keys
+                _jwks_etag = response.headers.get("ETag")
+                logger.info(f"Fetched JWKS ({len(_jwks_by_kid)} keys)")
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                logger.error(f"JWKS fetch failed: HTTP {e.code}")
+        except Exception as e:
+            logger.error(f"JWKS fetch failed: {e}")
+        
+        _jwks_fetched_at = time.monotonic()
+        return _jwks_by_kid
 
 
-def verify_jwt_token(token: str) -> Dict[str, Any]:
+async def _get_signing_key(kid: Optional[str]) -> Tuple[jwt.PyJWK, str]:
+    """
+    Look up the signing key for a token's kid header.
+    
+    Cache hits are served on the event loop; refreshes run the blocking
+    fetch in a worker thread.
+    
+    Args:
+        kid: Key ID from the token header
+        
+    Returns:
+        Tuple of (PyJWK, algorithm name) for the kid
+        
+    Raises:
+        jwt.InvalidTokenError: If the kid is missing or unknown
+    """
+    if not kid:
+        raise jwt.InvalidTokenError("Token header has no kid")
+    
+    keys = _jwks_by_kid
+    if _jwks_needs_refresh():
+        keys = await asyncio.to_thread(_fetch_jwks)
+    entry = keys.get(kid)
+    if entry is None and _jwks_needs_refresh(force=True):
+        # Possibly a rotated key: refresh once (throttled) and retry
+        entry = (await asyncio.to_thread(_fetch_jwks, True)).get(kid)
+    if entry is None:
+        raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+    return entry
+
+
+async def verify_jwt_token(token: str) -> Dict[str, Any]:
     """
     Verify Supabase JWT token.
     
@@ -62,20 +176,50 @@ def verify_jwt_token(token: str) -> Dict[str, Any]:
     Raises:
         HTTPException: 401 if token is invalid or expired
     """
+    # Only well-formed tokens (header.payload.signature) use the cache;
+    # anything else goes straight to PyJWT and fails there
+    cache_key = None
+    if token.count(".") == 2:
+        signature = token[token.rfind(".") + 1:]
+        if len(signature) >= _JWT_CACHE_KEY_CHARS:
+            cache_key = signature[-_JWT_CACHE_KEY_CHARS:]
+    
+    if cache_key is not None:
+        with _jwt_payload_cache_lock:
+            cached = _jwt_payload_cache.get(cache_key)
+        if cached is not None:
+            exp = cached.get("exp")
+            if exp is None or exp > time.time():
+                return cached
+            with _jwt_payload_cache_lock:
+                _jwt_payload_cache.pop(cache_key, None)
+    
     try:
-        # Fetch JWKs (cached)
-        _fetch_jwks()
+        # HS256 tokens are signed with the project JWT secret; asymmetric
+        # tokens are verified against the cached JWKS key for their kid
+        header = jwt.get_unverified_header(token)
+        if header.get("alg") == "HS256":
+            key = settings.supabase_jwt_secret
+            algorithms = ["HS256"]
+        else:
+            signing_key, algorithm = await _get_signing_key(header.get("kid"))
+            key = signing_key.key
+            algorithms = [algorithm]
         
-        # Decode and verify token using Supabase JWT secret
+        # Decode and verify token
         # Note: Supabase uses "authenticated" as the audience by default
         # but we disable strict audience verification to support different Supabase configurations
         payload = jwt.decode(
             token,
-            settings.supabase_jwt_secret,
-            algorithms=["HS256"],
+            key,
+            algorithms=algorithms,
             options={"verify_aud": False}  # Relaxed for Supabase compatibility
         )
         
+        if cache_key is not None:
+            with _jwt_payload_cache_lock:
+                _jwt_payload_cache[cache_key] = payload
+        
         return payload
         
     except jwt.ExpiredSignatureError:
@@ -101,22 +245,23 @@ def verify_jwt_token(token: str) -> Dict[str, Any]:
         )
 
 
+@dataclass(slots=True, frozen=True)
 class CurrentUser:
     """
     Current authenticated user information.
     
     Contains user_id, tenant_id, and role from database lookup.
+    Immutable, so one instance can be shared from the user cache.
     """
-    def __init__(self, user_id: str, tenant_id: str, role: str, email: str):
-        self.user_id = user_id
-        self.tenant_id = tenant_id
-        self.role = role
-        self.email = email
+    user_id: str
+    tenant_id: str
+    role: str
+    email: str
 
 
 async def get_current_user(
     authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> CurrentUser:
     """
     FastAPI dependency to get current authenticated user.
@@ -126,7 +271,7 @@ async def get_current_user(
     
     Args:
         authorization: Authorization header with Bearer token
-        db: Database session
+        db: Async database session
         
     Returns:
         CurrentUser: Current user information
@@ -134,19 +279,25 @@ async def get_current_user(
     Raises:
         HTTPException: 401 if not authenticated or user not found
     """
+    global _dev_user_cache
+    
     # DEV_AUTH_BYPASS mode (ONLY if explicitly enabled)
     if settings.dev_auth_bypass:
         logger.warning("DEV_AUTH_BYPASS is enabled - bypassing authentication")
+        if _dev_user_cache is not None:
+            return _dev_user_cache
         # Return a mock user for development
         # In real usage, you'd query for the first user or use a specific test user
-        test_user = db.query(User).first()
+        result = await db.execute(select(User).limit(1))
+        test_user = result.scalar_one_or_none()
         if test_user:
-            return CurrentUser(
+            _dev_user_cache = CurrentUser(
                 user_id=str(test_user.id),
                 tenant_id=str(test_user.tenant_id),
                 role=test_user.role.value,
                 email=test_user.email
             )
+            return _dev_user_cache
         # If no users exist, raise error
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -173,7 +324,7 @@ async def get_current_user(
     token = parts[1]
     
     # Verify JWT token
-    payload = verify_jwt_token(token)
+    payload = await verify_jwt_token(token)
     
     # Extract supabase_user_id from payload
     supabase_user_id = payload.get("sub")
@@ -185,8 +336,19 @@ async def get_current_user(
             detail="Invalid token payload",
         )
     
+    # Serve from the user cache when possible
+    with _user_cache_lock:
+        cached_user = _user_cache.get(supabase_user_id)
+    if cached_user is not None:
+        return cached_user
+    
     # Look up user in database
-    user = db.query(User).filter(User.supabase_user_id == supabase_user_id).first()
+    # Select only the covering-index columns (index-only scan, no ORM hydration)
+    result = await db.execute(
+        select(User.id, User.tenant_id, User.role, User.email)
+        .where(User.supabase_user_id == supabase_user_id)
+    )
+    user = result.one_or_none()
     
     if not user:
         raise HTTPException(
@@ -194,10 +356,14 @@ async def get_current_user(
             detail="User not found. Please complete registration.",
         )
     
-    # Return current user info
-    return CurrentUser(
+    current_user = CurrentUser(
         user_id=str(user.id),
         tenant_id=str(user.tenant_id),
         role=user.role.value,
         email=user.email
     )
+    with _user_cache_lock:
+        _user_cache[supabase_user_id] = current_user
+    
+    # Return current user info
+    return current_user
@@ -9,11 +9,50 @@ session-based detection logic with fallback to primary_language.
 """
 
 from typing import Dict, Optional, Any
-import random
+from random import random as _random
+import re
+
+from cachetools import TTLCache
 
 # Confidence threshold for language detection
 LANGUAGE_DETECTION_CONFIDENCE_THRESHOLD = 0.65
 
+# Session cache bounds: entries expire after an hour of inactivity
+SESSION_CACHE_MAXSIZE = 100_000
+SESSION_CACHE_TTL_SECONDS = 3600
+
+# Romanized language keywords (MOCK), in detection priority order.
+# Matched as whole words via set intersection with the text's tokens.
+DETECTION_TOKENS: Dict[str, frozenset[str]] = {
+    "hi": frozenset({"namaste", "kaise", "aap", "hai"}),
+    "mr": frozenset({"kasa", "tumhi", "aahe"}),
+    "gu": frozenset({"kem", "tamne", "chhe"}),
+}
+
+# Native-script keywords (MOCK). Substring-matched, since \w does not
+# cover Indic vowel signs and would split these words apart.
+DETECTION_SCRIPT_KEYWORDS: Dict[str, tuple[str, ...]] = {
+    "hi": ("मैं", "हूं"),
+    "mr": ("मी", "आहे"),
+    "gu": ("હું", "છું"),
+}
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Devanagari or Gujarati characters; gates the native-script keyword scan
+_INDIC_SCRIPT_PATTERN = re.compile(r"[\u0900-\u097F\u0A80-\u0AFF]")
+
+# script keyword -> language code
+_SCRIPT_KEYWORD_LANGUAGE: Dict[str, str] = {
+    keyword: lang
+    for lang, keywords in DETECTION_SCRIPT_KEYWORDS.items()
+    for keyword in keywords
+}
+
+_SCRIPT_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, _SCRIPT_KEYWORD_LANGUAGE)))
+
+_NO_LANGUAGES: frozenset[str] = frozenset()
+
 
 class LanguageDetectionService:
     """
@@ -25,12 +64,15 @@ class LanguageDetectionService:
     Session-based logic:
     - Detects language once per session_id
     - Falls back to primary_language if confidence < LANGUAGE_DETECTION_CONFIDENCE_THRESHOLD
-    - Caches detection result per session
+    - Caches detection result per session (bounded, expires after SESSION_CACHE_TTL_SECONDS)
     """
     
     def __init__(self):
         """Initialize the simulated language detection service."""
-        self._session_cache: Dict[str, Dict[str, Any]] = {}
+        self._session_cache: TTLCache = TTLCache(
+            maxsize=SESSION_CACHE_MAXSIZE,
+            ttl=SESSION_CACHE_TTL_SECONDS
+        )
     
     def detect_language(
         self,
@@ -59,8 +101,9 @@ class LanguageDetectionService:
             This is a MOCK implementation. No actual language detection is performed.
         """
         # Check if we already detected for this session
-        if session_id in self._session_cache:
-            return self._session_cache[session_id]
+        cached = self._session_cache.get(session_id)
+        if cached is not None:
+            return cached
         
         # SIMULATED detection logic
         # In a real implementation, this would use an NLP model
@@ -99,28 +142,30 @@ class LanguageDetectionService:
         """
         # Simple heuristic: check for language-specific keywords (MOCK)
         text_lower = text.lower()
+        tokens = set(_TOKEN_PATTERN.findall(text_lower))
         
-        # Hindi detection (mock)
-        hindi_keywords = ["namaste", "kaise", "aap", "hai", "मैं", "हूं"]
-        if any(keyword in text_lower for keyword in hindi_keywords):
-            return "hi", random.uniform(0.7, 0.95)
-        
-        # Marathi detection (mock)
-        marathi_keywords = ["kasa", "tumhi", "aahe", "मी", "आहे"]
-        if any(keyword in text_lower for keyword in marathi_keywords):
-            return "mr", random.uniform(0.7, 0.95)
+        # isascii() is O(1) on CPython (flag on the string object), so
+        # romanized/English text never runs the script scan
+        script_languages = _NO_LANGUAGES
+        if not text_lower.isascii() and _INDIC_SCRIPT_PATTERN.search(text_lower):
+            script_languages = {
+                _SCRIPT_KEYWORD_LANGUAGE[keyword]
+                for keyword in _SCRIPT_KEYWORD_PATTERN.findall(text_lower)
+            }
         
-        # Gujarati detection (mock)
-        gujarati_keywords = ["kem", "tamne", "chhe", "હું", "છું"]
-        if any(keyword in text_lower for keyword in gujarati_keywords):
-            return "gu", random.uniform(0.7, 0.95)
+        # Hindi > Marathi > Gujarati when several languages match
+        for lang, keywords in DETECTION_TOKENS.items():
+            if lang in script_languages or not tokens.isdisjoint(keywords):
+                return lang, 0.7 + 0.25 * _random()
         
         # Default to English with variable confidence
-        # Sometimes return low confidence to test fallback logic
-        if random.random() < 0.3:  # 30% chance of low confidence
-            return "en", random.uniform(0.4, 0.64)
-        else:
-            return "en", random.uniform(0.75, 0.95)
+        # Sometimes return low confidence to test fallback logic.
+        # One draw decides both the branch and the (uniform) confidence.
+        draw = _random()
+        if draw < 0.3:  # 30% chance of low confidence, uniform in [0.4, 0.64)
+            return "en", 0.4 + 0.24 * (draw / 0.3)
+        else:  # uniform in [0.75, 0.95)
+            return "en", 0.75 + 0.2 * ((draw - 0.3) / 0.7)
     
     def clear_session(self, session_id: str) -> None:
         """
@@ -129,8 +174,7 @@ class LanguageDetectionService:
         Args:
             session_id: Session identifier to clear
         """
-        if session_id in self._session_cache:
-            del self._session_cache[session_id]
+        self._session_cache.pop(session_id, None)
     
     def get_session_language(self, session_id: str) -> Optional[str]:
         """
@@ -142,6 +186,7 @@ class LanguageDetectionService:
         Returns:
             Language code if cached, None otherwise
         """
-        if session_id in self._session_cache:
-            return self._session_cache[session_id]["detected_language"]
+        cached = self._session_cache.get(session_id)
+        if cached is not None:
+            return cached["detected_language"]
         return None
@@ -8,8 +8,38 @@ The service simulates detection of explicit language change requests and manages
 session-specific speaking_language (locked after change).
 """
 
+import re
+from dataclasses import dataclass
 from typing import Dict, Optional, Any
 
+from cachetools import TTLCache
+
+# Session state bounds: entries expire after an hour of inactivity
+SESSION_CACHE_MAXSIZE = 100_000
+SESSION_CACHE_TTL_SECONDS = 3600
+
+# Explicit language switch phrases (MOCK)
+SWITCH_PATTERNS: Dict[str, tuple[str, ...]] = {
+    "en": ("speak english", "switch to english", "in english", "english please"),
+    "hi": ("hindi mein bolo", "speak hindi", "in hindi", "hindi please"),
+    "mr": ("marathi mein bolo", "speak marathi", "in marathi", "marathi please"),
+    "gu": ("gujarati mein bolo", "speak gujarati", "in gujarati", "gujarati please"),
+}
+
+# One case-insensitive pattern per language, tried in SWITCH_PATTERNS order so
+# the first language listed wins when a text mentions several (en first)
+_SWITCH_REGEXES: tuple[tuple[str, re.Pattern], ...] = tuple(
+    (lang, re.compile("|".join(map(re.escape, patterns)), re.IGNORECASE))
+    for lang, patterns in SWITCH_PATTERNS.items()
+)
+
+
+@dataclass(slots=True)
+class _SessionState:
+    """Per-session speaking language and lock flag."""
+    language: str
+    locked: bool = False
+
 
 class LanguageSwitchDetector:
     """
@@ -22,12 +52,16 @@ class LanguageSwitchDetector:
     - Detects explicit language change requests
     - Updates session-specific speaking_language
     - Locks speaking_language after explicit change (cannot auto-switch)
+    - Session state is bounded and expires after SESSION_CACHE_TTL_SECONDS
     """
     
     def __init__(self):
         """Initialize the simulated language switch detector."""
-        self._session_speaking_language: Dict[str, str] = {}
-        self._session_locked: Dict[str, bool] = {}
+        # session_id -> _SessionState
+        self._sessions: TTLCache = TTLCache(
+            maxsize=SESSION_CACHE_MAXSIZE,
+            ttl=SESSION_CACHE_TTL_SECONDS
+        )
     
     def detect_language_switch_request(
         self,
@@ -55,42 +89,31 @@ class LanguageSwitchDetector:
         Note:
             This is a MOCK implementation. No actual language detection is performed.
         """
-        text_lower = text.lower()
-        
         # Initialize session state if needed
-        if session_id not in self._session_speaking_language:
-            self._session_speaking_language[session_id] = current_language
-            self._session_locked[session_id] = False
+        state = self._sessions.get(session_id)
+        if state is None:
+            state = _SessionState(current_language)
         
         # SIMULATED switch detection logic
         # In a real implementation, this would use NLP to understand intent
-        switch_patterns = {
-            "en": ["speak english", "switch to english", "in english", "english please"],
-            "hi": ["hindi mein bolo", "speak hindi", "in hindi", "hindi please"],
-            "mr": ["marathi mein bolo", "speak marathi", "in marathi", "marathi please"],
-            "gu": ["gujarati mein bolo", "speak gujarati", "in gujarati", "gujarati please"],
-        }
-        
-        switch_requested = False
-        target_language = None
-        
-        # Check for explicit language switch patterns
-        for lang, patterns in switch_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
-                switch_requested = True
-                target_language = lang
-                break
+        target_language = next(
+            (lang for lang, regex in _SWITCH_REGEXES if regex.search(text)), None
+        )
+        switch_requested = target_language is not None
         
         # Update session state if switch was requested
         if switch_requested:
-            self._session_speaking_language[session_id] = target_language
-            self._session_locked[session_id] = True  # Lock after explicit change
+            state.language = target_language
+            state.locked = True  # Lock after explicit change
+        
+        # Store (also refreshes the entry's TTL)
+        self._sessions[session_id] = state
         
         return {
             "switch_requested": switch_requested,
             "target_language": target_language,
-            "speaking_language": self._session_speaking_language[session_id],
-            "is_locked": self._session_locked[session_id]
+            "speaking_language": state.language,
+            "is_locked": state.locked
         }
     
     def get_speaking_language(self, session_id: str, default: str = "en") -> str:
@@ -104,7 +127,8 @@ class LanguageSwitchDetector:
         Returns:
             Current speaking language for the session
         """
-        return self._session_speaking_language.get(session_id, default)
+        state = self._sessions.get(session_id)
+        return state.language if state is not None else default
     
     def is_language_locked(self, session_id: str) -> bool:
         """
@@ -116,7 +140,8 @@ class LanguageSwitchDetector:
         Returns:
             True if language is locked, False otherwise
         """
-        return self._session_locked.get(session_id, False)
+        state = self._sessions.get(session_id)
+        return state.locked if state is not None else False
     
     def set_speaking_language(self, session_id: str, language: str, lock: bool = False) -> None:
         """
@@ -127,9 +152,13 @@ class LanguageSwitchDetector:
             language: Language code to set
             lock: Whether to lock the language
         """
-        self._session_speaking_language[session_id] = language
+        state = self._sessions.get(session_id)
+        if state is None:
+            self._sessions[session_id] = _SessionState(language, lock)
+            return
+        state.language = language
         if lock:
-            self._session_locked[session_id] = True
+            state.locked = True
     
     def clear_session(self, session_id: str) -> None:
         """
@@ -138,7 +167,4 @@ class LanguageSwitchDetector:
         Args:
             session_id: Session identifier to clear
         """
-        if session_id in self._session_speaking_language:
-            del self._session_speaking_language[session_id]
-        if session_id in self._session_locked:
-            del self._session_locked[session_id]
+        self._sessions.pop(session_id, None)
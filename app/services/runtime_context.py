@@ -10,7 +10,50 @@ The service builds runtime context from:
 - Business profile configuration
 """
 
-from typing import Dict, Optional, List, Any
+from typing import Dict, Final, Hashable, Optional, List, Any
+
+from cachetools import LRUCache
+
+# Max cached (business_profile, speaking_language) prompt prefixes
+CONTEXT_PREFIX_CACHE_SIZE = 1024
+
+# Universal rules that apply to all agents regardless of business profile or language
+_GLOBAL_RULES: Final[str] = "\n".join([
+    "1. Always be polite and professional",
+    "2. Never share customer data with third parties",
+    "3. Escalate to human if unable to help",
+    "4. Follow business-specific escalation rules",
+    "5. Respect business hours and booking policies",
+    "6. Never make forbidden statements",
+])
+
+# Language-appropriate greeting and response patterns
+_LANGUAGE_TEMPLATES: Final[Dict[str, str]] = {
+    "en": (
+        "Greetings: Hello, Hi, Good morning/afternoon/evening\n"
+        "Acknowledgment: I understand, Got it, Sure\n"
+        "Questions: How can I help? What would you like to know?\n"
+        "Closing: Thank you, Have a great day, Goodbye"
+    ),
+    "hi": (
+        "Greetings: नमस्ते, नमस्कार\n"
+        "Acknowledgment: मैं समझता हूं, ठीक है\n"
+        "Questions: मैं आपकी कैसे मदद कर सकता हूं?\n"
+        "Closing: धन्यवाद, शुभ दिन"
+    ),
+    "mr": (
+        "Greetings: नमस्कार\n"
+        "Acknowledgment: मला समजले, ठीक आहे\n"
+        "Questions: मी तुमची कशी मदत करू शकतो?\n"
+        "Closing: धन्यवाद, शुभ दिन"
+    ),
+    "gu": (
+        "Greetings: નમસ્તે, નમસ્કાર\n"
+        "Acknowledgment: હું સમજું છું, બરાબર\n"
+        "Questions: હું તમને કેવી રીતે મદદ કરી શકું?\n"
+        "Closing: આભાર, શુભ દિવસ"
+    )
+}
 
 
 class RuntimeContextBuilder:
@@ -29,13 +72,16 @@ class RuntimeContextBuilder:
     
     def __init__(self):
         """Initialize the runtime context builder."""
-        pass
+        # (profile_version, speaking_language) -> assembled static prefix
+        self._prefix_cache: LRUCache = LRUCache(maxsize=CONTEXT_PREFIX_CACHE_SIZE)
     
     def build_context(
         self,
         business_profile: Optional[Dict[str, Any]],
         speaking_language: str = "en",
-        user_text: Optional[str] = None
+        user_text: Optional[str] = None,
+        profile_version: Optional[Hashable] = None,
+        open_now: Optional[bool] = None
     ) -> str:
         """
         Assemble runtime context from configuration (NO LLM CALL).
@@ -47,6 +93,11 @@ class RuntimeContextBuilder:
             business_profile: Business profile configuration dict
             speaking_language: Language code for response templates
             user_text: Optional user input text to include in context
+            profile_version: Identifies this version of business_profile, e.g.
+                (profile id, updated_at); the static prefix is only cached
+                when it is given (or there is no profile)
+            open_now: Whether the business is open right now (see
+                app.schemas.is_open_at); omitted from the context if None
             
         Returns:
             Assembled prompt text as string
@@ -54,7 +105,53 @@ class RuntimeContextBuilder:
         Note:
             This does NOT call any LLM. It only assembles configuration into text.
         """
-        # Start building the context
+        # Static prefix (rules, template, profile) is cached per profile version;
+        # an edited profile has a new version and simply misses
+        if business_profile and profile_version is None:
+            prefix = self._build_static_prefix(business_profile, speaking_language)
+        else:
+            cache_key = (profile_version, speaking_language)
+            prefix = self._prefix_cache.get(cache_key)
+            if prefix is None:
+                prefix = self._build_static_prefix(business_profile, speaking_language)
+                self._prefix_cache[cache_key] = prefix
+        
+        context_parts = [prefix]
+        
+        # Open/closed status changes minute to minute, so it is never cached
+        if open_now is not None:
+            context_parts.append("=== CURRENT STATUS ===")
+            context_parts.append(f"Open now: {'Yes' if open_now else 'No (outside business hours)'}")
+            context_parts.append("")
+        
+        # User input (if provided)
+        if user_text:
+            context_parts.append("=== USER INPUT ===")
+            context_parts.append(user_text)
+            context_parts.append("")
+        
+        # Assembly note
+        context_parts.append("=== ASSEMBLY NOTE ===")
+        context_parts.append("This context was assembled from configuration.")
+        context_parts.append("NO AI inference has been performed.")
+        
+        return "\n".join(context_parts)
+    
+    def _build_static_prefix(
+        self,
+        business_profile: Optional[Dict[str, Any]],
+        speaking_language: str
+    ) -> str:
+        """
+        Assemble the request-independent part of the context.
+        
+        Args:
+            business_profile: Business profile configuration dict
+            speaking_language: Language code for response templates
+            
+        Returns:
+            Global rules, language template and business profile sections as text
+        """
         context_parts = []
         
         # Global rules section
@@ -73,20 +170,10 @@ class RuntimeContextBuilder:
             context_parts.append(self._format_business_profile(business_profile))
             context_parts.append("")
         
-        # User input (if provided)
-        if user_text:
-            context_parts.append("=== USER INPUT ===")
-            context_parts.append(user_text)
-            context_parts.append("")
-        
-        # Assembly note
-        context_parts.append("=== ASSEMBLY NOTE ===")
-        context_parts.append("This context was assembled from configuration.")
-        context_parts.append("NO AI inference has been performed.")
-        
         return "\n".join(context_parts)
     
-    def _get_global_rules(self) -> str:
+    @staticmethod
+    def _get_global_rules() -> str:
         """
         Get global agent rules.
         
@@ -96,17 +183,10 @@ class RuntimeContextBuilder:
         Returns:
             Global rules as text
         """
-        rules = [
-            "1. Always be polite and professional",
-            "2. Never share customer data with third parties",
-            "3. Escalate to human if unable to help",
-            "4. Follow business-specific escalation rules",
-            "5. Respect business hours and booking policies",
-            "6. Never make forbidden statements",
-        ]
-        return "\n".join(rules)
+        return _GLOBAL_RULES
     
-    def _get_language_template(self, language: str) -> str:
+    @staticmethod
+    def _get_language_template(language: str) -> str:
         """
         Get language-specific response templates.
         
@@ -118,33 +198,7 @@ class RuntimeContextBuilder:
         Returns:
             Language template as text
         """
-        templates = {
-            "en": (
-                "Greetings: Hello, Hi, Good morning/afternoon/evening\n"
-                "Acknowledgment: I understand, Got it, Sure\n"
-                "Questions: How can I help? What would you like to know?\n"
-                "Closing: Thank you, Have a great day, Goodbye"
-            ),
-            "hi": (
-                "Greetings: नमस्ते, नमस्कार\n"
-                "Acknowledgment: मैं समझता हूं, ठीक है\n"
-                "Questions: मैं आपकी कैसे मदद कर सकता हूं?\n"
-                "Closing: धन्यवाद, शुभ दिन"
-            ),
-            "mr": (
-                "Greetings: नमस्कार\n"
-                "Acknowledgment: मला समजले, ठीक आहे\n"
-                "Questions: मी तुमची कशी मदत करू शकतो?\n"
-                "Closing: धन्यवाद, शुभ दिन"
-            ),
-            "gu": (
-                "Greetings: નમસ્તે, નમસ્કાર\n"
-                "Acknowledgment: હું સમજું છું, બરાબર\n"
-                "Questions: હું તમને કેવી રીતે મદદ કરી શકું?\n"
-                "Closing: આભાર, શુભ દિવસ"
-            )
-        }
-        return templates.get(language, templates["en"])
+        return _LANGUAGE_TEMPLATES.get(language, _LANGUAGE_TEMPLATES["en"])
     
     def _format_business_profile(self, profile: Dict[str, Any]) -> str:
         """
@@ -156,45 +210,32 @@ class RuntimeContextBuilder:
         Returns:
             Formatted business profile as text
         """
-        parts = []
-        
-        # Business identity
-        if "business_name" in profile:
-            parts.append(f"Business Name: {profile['business_name']}")
-        if "business_type" in profile:
-            parts.append(f"Business Type: {profile['business_type']}")
-        
-        # Services
-        if "services" in profile and profile["services"]:
-            services_str = ", ".join(profile["services"])
-            parts.append(f"Services Offered: {services_str}")
-        
-        # Service areas
-        if "service_areas" in profile and profile["service_areas"]:
-            areas_str = ", ".join(profile["service_areas"])
-            parts.append(f"Service Areas: {areas_str}")
-        
-        # Business hours
-        if "business_hours" in profile and profile["business_hours"]:
-            parts.append("Business Hours:")
-            for day, hours in profile["business_hours"].items():
-                parts.append(f"  {day}: {hours}")
-        
-        # Booking
-        if "booking_enabled" in profile:
-            status = "Enabled" if profile["booking_enabled"] else "Disabled"
-            parts.append(f"Booking: {status}")
-        
-        # Escalation rules
-        if "escalation_rules" in profile and profile["escalation_rules"]:
-            parts.append("Escalation Rules:")
-            for condition, action in profile["escalation_rules"].items():
-                parts.append(f"  {condition}: {action}")
-        
-        # Forbidden statements
-        if "forbidden_statements" in profile and profile["forbidden_statements"]:
-            parts.append("Forbidden Statements:")
-            for statement in profile["forbidden_statements"]:
-                parts.append(f"  - {statement}")
-        
-        return "\n".join(parts)
+        services = profile.get("services")
+        service_areas = profile.get("service_areas")
+        business_hours = profile.get("business_hours")
+        escalation_rules = profile.get("escalation_rules")
+        forbidden_statements = profile.get("forbidden_statements")
+        
+        return "\n".join(filter(None, (
+            # Business identity
+            f"Business Name: {profile['business_name']}" if "business_name" in profile else None,
+            f"Business Type: {profile['business_type']}" if "business_type" in profile else None,
+            # Services and areas
+            f"Services Offered: {', '.join(services)}" if services else None,
+            f"Service Areas: {', '.join(service_areas)}" if service_areas else None,
+            # Business hours
+            "Business Hours:\n" + "\n".join(
+                f"  {day}: {hours}" for day, hours in business_hours.items()
+            ) if business_hours else None,
+            # Booking
+            f"Booking: {'Enabled' if profile['booking_enabled'] else 'Disabled'}"
+            if "booking_enabled" in profile else None,
+            # Escalation rules
+            "Escalation Rules:\n" + "\n".join(
+                f"  {condition}: {action}" for condition, action in escalation_rules.items()
+            ) if escalation_rules else None,
+            # Forbidden statements
+            "Forbidden Statements:\n" + "\n".join(
+                f"  - {statement}" for statement in forbidden_statements
+            ) if forbidden_statements else None,
+        )))
@@ -0,0 +1,64 @@
+"""
+In-process tenant lookup cache.
+
+Tenant.primary_language is read on every agent brain request (to pick
+prompts and templates) but changes rarely. This module caches the
+tenant_id -> primary_language mapping in memory with a short TTL so
+hot paths skip the tenants round-trip.
+
+WARNING: The cache is per-process. Every write path that changes a
+tenant's primary_language MUST call invalidate_primary_language() so
+this process serves fresh data; other workers converge within the TTL.
+"""
+
+import threading
+from typing import Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy.orm import Session
+
+from app.models import Tenant, PrimaryLanguage
+
+# tenant_id -> PrimaryLanguage (only existing tenants are cached)
+_primary_language_cache: TTLCache = TTLCache(maxsize=8192, ttl=300)
+_primary_language_lock = threading.Lock()
+
+
+def get_primary_language(db: Session, tenant_id: UUID) -> Optional[PrimaryLanguage]:
+    """
+    Get a tenant's primary language, served from cache when possible.
+
+    This is the only authorized accessor for primary_language on hot paths.
+
+    Args:
+        db: Database session (used on cache miss)
+        tenant_id: Tenant UUID
+
+    Returns:
+        PrimaryLanguage for the tenant, or None if the tenant does not exist
+    """
+    key = str(tenant_id)
+    with _primary_language_lock:
+        cached = _primary_language_cache.get(key)
+    if cached is not None:
+        return cached
+
+    row = db.query(Tenant.primary_language).filter(Tenant.id == tenant_id).first()
+    if row is None:
+        return None
+
+    with _primary_language_lock:
+        _primary_language_cache[key] = row.primary_language
+    return row.primary_language
+
+
+def invalidate_primary_language(tenant_id: UUID) -> None:
+    """
+    Drop a tenant's cached primary language.
+
+    Args:
+        tenant_id: Tenant UUID
+    """
+    with _primary_language_lock:
+        _primary_language_cache.pop(str(tenant_id), None)
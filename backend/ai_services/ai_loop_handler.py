@@ -9,11 +9,13 @@ This module orchestrates the complete AI conversation loop:
 5. Stream response back to caller via ARI
 
 All operations are non-blocking and handle failures gracefully.
+The process should run on uvloop (see main.py); the handler itself is
+loop-agnostic and times every step with the running loop's clock.
 
 Usage:
-    from backend.ai_services.ai_loop_handler import AILoopHandler
+    from backend.ai_services.ai_loop_handler import get_ai_loop_handler
     
-    handler = AILoopHandler()
+    handler = get_ai_loop_handler()  # One shared instance per process
     await handler.handle_inbound_call(
         call_id=call_id,
         channel_id=channel_id,
@@ -22,9 +24,13 @@ Usage:
     )
 """
 
+from __future__ import annotations
+
 import logging
-import time
-from typing import Optional
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, Awaitable, Final, List, Dict, Mapping, NamedTuple, TypeVar
 from uuid import UUID
 import asyncio
 
@@ -32,19 +38,97 @@ from backend.ai_services.stt import STTService, STTServiceError
 from backend.ai_services.llm import LLMService, LLMServiceError
 from backend.ai_services.tts import TTSService, TTSServiceError
 from backend.ai_services.ari_client import ARIClient, ARIClientError
-from backend.ai_services.conversation_state import ConversationStateManager, ConversationStateError
-from app.models import AIProfile
-from sqlalchemy.orm import Session
+from backend.ai_services.conversation_state import ConversationStateManager
+from backend.ai_services.response_cache import ResponseCache
+from app.config.database import AsyncSessionLocal
+from app.services.ai_profile_cache import CachedAIProfile, get_ai_profile
 
 
 logger = logging.getLogger(__name__)
 
+# Streaming LLM -> TTS chunking: flush the text buffer to TTS at a sentence
+# end, at a comma once the clause has a few words, or after MAX tokens
+_SENTENCE_END = re.compile(r"[.?!]\s*$")
+_CLAUSE_END = re.compile(r",\s*$")
+MIN_CLAUSE_WORDS = 4
+MAX_CHUNK_TOKENS = 80
+
+# Responses that admit the AI can't help end the call
+_CONFUSION = re.compile(r"i don't understand|i'm not sure|i can't help", re.IGNORECASE)
+
+
+def is_sentence_boundary(buffer: str, token_count: int) -> bool:
+    """
+    Decide whether buffered LLM text should be flushed to TTS.
+    
+    Args:
+        buffer: Text accumulated since the last flush
+        token_count: Number of streamed tokens in the buffer
+        
+    Returns:
+        bool: True if the buffer ends a speakable chunk
+    """
+    if token_count >= MAX_CHUNK_TOKENS:
+        return True
+    if _SENTENCE_END.search(buffer):
+        return True
+    return bool(_CLAUSE_END.search(buffer)) and len(buffer.split()) >= MIN_CLAUSE_WORDS
+
+
+# Fallback responses for failures (fail-fast, no retry), keyed by exit reason
+_ERROR_RESPONSES: Final[Mapping[str, str]] = MappingProxyType({
+    "stt_failure": "I'm sorry, I'm having trouble hearing you. Goodbye.",
+    "llm_failure": "I apologize, I'm having technical difficulties. Goodbye.",
+    "tts_failure": "I'm experiencing audio issues. Goodbye.",
+    "max_turns": "Thank you for calling. I hope I was able to help you today. Goodbye!",
+    "max_duration": "I apologize, but we've reached the maximum call duration. Thank you for calling!",
+    "silence": "I haven't heard from you. Thank you for calling. Goodbye.",
+    "confusion": "I'm sorry, I'm unable to help with that. Goodbye.",
+    "timeout": "I apologize for the delay. Goodbye.",
+    "stt_timeout": "I apologize for the delay. Goodbye.",
+    "llm_timeout": "I apologize for the delay. Goodbye.",
+    "tts_timeout": "I apologize for the delay. Goodbye.",
+    "general_error": "I apologize for the inconvenience. Goodbye."
+})
+_DEFAULT_GOODBYE: Final[str] = "Thank you for calling. Goodbye!"
+_DEFAULT_EXIT: Final[str] = "default"  # _ERROR_AUDIO key for _DEFAULT_GOODBYE
+_FALLBACK_GREETING: Final[str] = "Hello! How can I help you today?"
+
+# Failed-turn exception type -> (exit reason, log label); matched along the MRO
+_TURN_FAILURES: Final[Mapping[type, tuple[str, str]]] = MappingProxyType({
+    asyncio.TimeoutError: ("timeout", "Timeout exceeded"),
+    STTServiceError: ("stt_failure", "STT failure"),
+    LLMServiceError: ("llm_failure", "LLM failure"),
+    TTSServiceError: ("tts_failure", "TTS failure"),
+})
+_GENERAL_FAILURE: Final[tuple[str, str]] = ("general_error", "Error in conversation turn")
+
+# Exit reason -> telephony PCM, filled once by AILoopHandler.warm_error_audio()
+_ERROR_AUDIO: Dict[str, bytes] = {}
+
+
+class _Goodbye(NamedTuple):
+    """Pipeline message: speak the response for this exit reason, then end the loop."""
+    reason: str
+    context: str
+
 
 class AILoopHandlerError(Exception):
     """Raised when AI loop handler fails."""
     pass
 
 
+class _StepTimeout(asyncio.TimeoutError):
+    """A pipeline step exceeded its budget; reason names the stage's exit reason."""
+    
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+T = TypeVar("T")
+
+
 class AILoopHandler:
     """
     Orchestrates the complete AI audio loop for live calls.
@@ -66,6 +150,10 @@ class AILoopHandler:
         - NEVER expose technical errors to caller
         - ALWAYS log detailed errors and exit reasons for debugging
     
+    Connection Reuse:
+        All handlers in a process share one ARIClient whose session and event
+        WebSocket stay open between calls; close_shared_ari() at shutdown.
+    
     Configuration:
         All settings from app.config.settings:
         - OpenAI API keys
@@ -74,28 +162,35 @@ class AILoopHandler:
         - Conversation limits
     """
     
+    __slots__ = (
+        "stt",
+        "llm",
+        "tts",
+        "ari",
+        "state_mgr",
+        "response_cache",
+        "per_step_timeout",
+        "total_loop_timeout",
+        "_state_writes",
+    )
+    
+    # Process-wide ARI client (persistent connection shared across calls)
+    _shared_ari: ARIClient | None = None
+    
     def __init__(self):
         """Initialize AI loop handler with all services."""
         self.stt = STTService()
         self.llm = LLMService()
         self.tts = TTSService()
-        self.ari = ARIClient()
+        if AILoopHandler._shared_ari is None:
+            AILoopHandler._shared_ari = ARIClient()
+        self.ari = AILoopHandler._shared_ari
         self.state_mgr = ConversationStateManager()
+        self.response_cache = ResponseCache()
+        # call_id -> newest background state write (see _defer_state_write)
+        self._state_writes: Dict[str, asyncio.Task] = {}
         
-        # Fallback responses for failures (fail-fast, no retry)
-        self.error_responses = {
-            "stt_failure": "I'm sorry, I'm having trouble hearing you. Goodbye.",
-            "llm_failure": "I apologize, I'm having technical difficulties. Goodbye.",
-            "tts_failure": "I'm experiencing audio issues. Goodbye.",
-            "max_turns": "Thank you for calling. I hope I was able to help you today. Goodbye!",
-            "max_duration": "I apologize, but we've reached the maximum call duration. Thank you for calling!",
-            "silence": "I haven't heard from you. Thank you for calling. Goodbye.",
-            "confusion": "I'm sorry, I'm unable to help with that. Goodbye.",
-            "timeout": "I apologize for the delay. Goodbye.",
-            "general_error": "I apologize for the inconvenience. Goodbye."
-        }
-        
-        # Timeout discipline (in seconds)
+        # Timeout discipline (in seconds), enforced by _bounded()
         self.per_step_timeout = 1.2  # Each step must complete within 1.2s
         self.total_loop_timeout = 1.5  # Total loop must complete within 1.5s
         
@@ -106,8 +201,7 @@ class AILoopHandler:
         call_id: str,
         channel_id: str,
         tenant_id: UUID,
-        ai_profile_id: UUID,
-        db: Session
+        ai_profile_id: UUID
     ) -> None:
         """
         Handle complete AI conversation loop for an inbound call.
@@ -124,28 +218,28 @@ class AILoopHandler:
             channel_id: Asterisk channel ID (for ARI)
             tenant_id: Tenant owning this call
             ai_profile_id: AI profile to use
-            db: Database session for AI profile lookup
             
         This method is designed to be fire-and-forget - it handles all errors
         internally and never crashes.
         """
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         logger.info(
-            f"[AI LOOP] Starting AI loop: call_id={call_id}, "
-            f"channel_id={channel_id}, tenant_id={tenant_id}"
+            "[AI LOOP] Starting AI loop: call_id=%s, channel_id=%s, tenant_id=%s",
+            call_id, channel_id, tenant_id
         )
         
         try:
-            # Step 1: Initialize conversation state
-            logger.info("[AI LOOP] Step 1: Initializing conversation state")
-            await self.state_mgr.initialize_call(call_id, tenant_id, ai_profile_id)
-            
-            # Step 2: Get AI profile from database
-            logger.info("[AI LOOP] Step 2: Loading AI profile")
-            ai_profile = db.query(AIProfile).filter(
-                AIProfile.id == ai_profile_id,
-                AIProfile.tenant_id == tenant_id
-            ).first()
+            # Steps 1-3 are independent round-trips (Redis, Postgres, ARI);
+            # run them concurrently so time-to-first-audio pays only the slowest
+            logger.info(
+                "[AI LOOP] Steps 1-3: Initializing state, loading AI profile, connecting to ARI"
+            )
+            _, ai_profile, _ = await asyncio.gather(
+                self.state_mgr.initialize_call(call_id, tenant_id, ai_profile_id),
+                self._load_profile(tenant_id, ai_profile_id),
+                self.ari.ensure_connected()
+            )
             
             if not ai_profile:
                 raise AILoopHandlerError(
@@ -153,26 +247,28 @@ class AILoopHandler:
                 )
             
             system_prompt = ai_profile.system_prompt
-            logger.info(f"[AI LOOP] AI profile loaded: role={ai_profile.role}")
+            logger.info("[AI LOOP] AI profile loaded: role=%s", ai_profile.role)
             
-            # Step 3: Connect to ARI
-            logger.info("[AI LOOP] Step 3: Connecting to ARI")
-            await self.ari.connect()
-            
-            # Step 4: Answer the call
-            logger.info("[AI LOOP] Step 4: Answering call")
-            await self.ari.answer_call(channel_id)
-            
-            # Step 5: Send greeting (first audio)
-            logger.info("[AI LOOP] Step 5: Generating greeting")
-            greeting = await self._generate_greeting(system_prompt)
-            await self._play_response(channel_id, greeting, call_id, "greeting")
+            # Steps 4-5: Answer the call while the greeting is generated and
+            # synthesized, then play it (first audio)
+            logger.info("[AI LOOP] Steps 4-5: Answering call, preparing greeting")
+            greeting_queue: asyncio.Queue = asyncio.Queue()
+            greeting_task = asyncio.create_task(
+                self._prefetch_greeting(system_prompt, ai_profile_id, greeting_queue)
+            )
+            try:
+                await self.ari.answer_call(channel_id)
+                await self._play_greeting(channel_id, greeting_queue)
+                await greeting_task
+            except BaseException:
+                greeting_task.cancel()
+                raise
             
             # Log time-to-first-audio
-            time_to_first_audio = time.time() - start_time
-            logger.info(
-                f"[AI LOOP] Time to first audio: {time_to_first_audio:.2f}s"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[AI LOOP] Time to first audio: %.2fs", loop.time() - start_time
+                )
             
             # Step 6: Main conversation loop
             logger.info("[AI LOOP] Step 6: Entering main conversation loop")
@@ -189,41 +285,199 @@ class AILoopHandler:
         except Exception as e:
             # Critical failure - log and end call
             logger.error(
-                f"[AI LOOP] Critical error in AI loop: {type(e).__name__}: {e}",
+                "[AI LOOP] Critical error in AI loop: %s: %s",
+                type(e).__name__, e,
                 exc_info=True
             )
             await self._end_call_gracefully(call_id, channel_id, "failed")
         
         finally:
-            # Cleanup
-            total_duration = time.time() - start_time
-            logger.info(
-                f"[AI LOOP] AI loop completed: call_id={call_id}, "
-                f"duration={total_duration:.2f}s"
-            )
-            await self.ari.disconnect()
+            # Cleanup (channel only; the shared ARI connection stays open)
+            await self.ari.cleanup_channel(channel_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[AI LOOP] AI loop completed: call_id=%s, duration=%.2fs",
+                    call_id, loop.time() - start_time
+                )
     
-    async def _generate_greeting(self, system_prompt: str) -> str:
+    @classmethod
+    async def close_shared_ari(cls) -> None:
+        """Close the process-wide ARI connection (call at shutdown)."""
+        if cls._shared_ari is not None:
+            await cls._shared_ari.disconnect()
+            cls._shared_ari = None
+    
+    async def _load_profile(
+        self,
+        tenant_id: UUID,
+        ai_profile_id: UUID
+    ) -> CachedAIProfile | None:
         """
-        Generate initial greeting using LLM.
+        Load the call's AI profile (cached; misses use a non-blocking session).
+        
+        Args:
+            tenant_id: Tenant owning this call
+            ai_profile_id: AI profile to use
+            
+        Returns:
+            CachedAIProfile, or None if not found for this tenant
+        """
+        async with AsyncSessionLocal() as db:
+            return await get_ai_profile(db, tenant_id, ai_profile_id)
+    
+    async def _generate_greeting(self, system_prompt: str, ai_profile_id: UUID) -> str:
+        """
+        Generate initial greeting using LLM, reusing a cached one when available.
         
         Args:
             system_prompt: AI profile system prompt
+            ai_profile_id: AI profile UUID (greeting cache key)
             
         Returns:
             str: Greeting text
         """
+        cached = await self.response_cache.get_greeting(ai_profile_id, system_prompt)
+        if cached:
+            return cached
+        
         try:
             messages = [{"role": "user", "content": "Start the conversation with a greeting"}]
-            greeting = await self.llm.generate_response(
-                messages=messages,
-                system_prompt=system_prompt,
-                max_tokens=50
+            greeting = await self._bounded(
+                self.llm.generate_response(
+                    messages=messages,
+                    system_prompt=system_prompt,
+                    max_tokens=50
+                ),
+                "llm_timeout"
+            )
+        except (LLMServiceError, asyncio.TimeoutError):
+            # Fallback greeting (not cached, so the next call retries the LLM)
+            return _FALLBACK_GREETING
+        
+        await self.response_cache.set_greeting(ai_profile_id, system_prompt, greeting)
+        return greeting
+    
+    async def _prefetch_greeting(
+        self,
+        system_prompt: str,
+        ai_profile_id: UUID,
+        out: asyncio.Queue
+    ) -> None:
+        """
+        Produce the profile's greeting as telephony PCM into a queue.
+        
+        Runs concurrently with answering the call. A warm profile's audio
+        comes from one Redis GET; otherwise the greeting text is generated
+        (or fetched from cache) and synthesis is streamed into the queue,
+        so playback can start from the first frame once the call is answered.
+        Freshly synthesized audio is cached after the sentinel is queued.
+        
+        Args:
+            system_prompt: AI profile system prompt
+            ai_profile_id: AI profile UUID (greeting cache key)
+            out: Receives PCM chunks, then None; or the exception on failure
+        """
+        voice = self.tts.voice
+        try:
+            audio_data = await self.response_cache.get_greeting_audio(
+                ai_profile_id, system_prompt, voice
+            )
+            if audio_data is not None:
+                out.put_nowait(audio_data)
+                out.put_nowait(None)
+                return
+            
+            greeting = await self._generate_greeting(system_prompt, ai_profile_id)
+            audio_data = await self.response_cache.get_tts(greeting, voice)
+            synthesized = audio_data is None
+            if not synthesized:
+                out.put_nowait(audio_data)
+            else:
+                played = bytearray()
+                async for pcm in self._speech_stream(greeting, self.per_step_timeout):
+                    played.extend(pcm)
+                    out.put_nowait(pcm)
+                audio_data = bytes(played)
+        except Exception as e:
+            out.put_nowait(e)
+            return
+        out.put_nowait(None)
+        
+        if synthesized:
+            await self.response_cache.set_tts(greeting, voice, audio_data)
+        if greeting != _FALLBACK_GREETING:
+            await self.response_cache.set_greeting_audio(
+                ai_profile_id, system_prompt, voice, audio_data
             )
-            return greeting
-        except LLMServiceError:
-            # Fallback greeting
-            return "Hello! How can I help you today?"
+    
+    async def _play_greeting(self, channel_id: str, pcm_queue: asyncio.Queue) -> None:
+        """
+        Play the greeting prepared by _prefetch_greeting().
+        
+        Args:
+            channel_id: Asterisk channel ID
+            pcm_queue: Queue filled by _prefetch_greeting()
+        """
+        frames = await self.ari.play_pcm_stream(channel_id, self._drain_speech(pcm_queue))
+        logger.info("[AI LOOP] Response played (greeting): frames=%d", frames)
+    
+    async def warm_error_audio(self) -> None:
+        """
+        Pre-synthesize the fallback responses to telephony PCM.
+        
+        Intended to run once at startup so failure paths play audio without
+        a TTS round-trip. Failures are logged and ignored; missing entries
+        fall back to regular synthesis.
+        """
+        for reason, text in (*_ERROR_RESPONSES.items(), (_DEFAULT_EXIT, _DEFAULT_GOODBYE)):
+            if reason in _ERROR_AUDIO:
+                continue
+            try:
+                _ERROR_AUDIO[reason] = await self._synthesize_cached(text)
+            except Exception as e:
+                logger.warning("[AI LOOP] Failed to pre-warm audio for %s: %s", reason, e)
+    
+    async def _synthesize_cached(self, text: str) -> bytes:
+        """
+        Synthesize speech, serving repeated phrases from the response cache.
+        
+        Args:
+            text: Text to speak
+            
+        Returns:
+            bytes: Telephony PCM (16-bit 8kHz mono)
+            
+        Raises:
+            TTSServiceError: If synthesis fails on a cache miss
+        """
+        voice = self.tts.voice
+        audio_data = await self.response_cache.get_tts(text, voice)
+        if audio_data is not None:
+            return audio_data
+        
+        audio_data = b"".join([pcm async for pcm in self._speech_stream(text)])
+        await self.response_cache.set_tts(text, voice, audio_data)
+        return audio_data
+    
+    def _speech_stream(
+        self,
+        text: str,
+        first_chunk_timeout: float = 15.0
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream synthesized speech as telephony PCM.
+        
+        Args:
+            text: Text to speak
+            first_chunk_timeout: Maximum wait for the first audio (seconds)
+            
+        Returns:
+            Async iterator of PCM 16-bit 8kHz mono chunks
+        """
+        return self.ari.resample_to_telephony(
+            self.tts.synthesize_stream(text, first_chunk_timeout=first_chunk_timeout),
+            self.tts.pcm_sample_rate
+        )
     
     async def _conversation_loop(
         self,
@@ -234,8 +488,12 @@ class AILoopHandler:
         """
         Main conversation loop with ARI External Media audio streaming.
         
-        Wires audio input/output to existing STT/LLM/TTS/StateManager,
-        honoring fail-fast behavior and timeout discipline from COMMIT 1.
+        Runs as a three-stage pipeline connected by bounded queues:
+        capture (ARI audio -> segments) -> STT (segments -> transcripts)
+        -> response (LLM/TTS/playback). Capturing and transcribing the next
+        utterance overlaps with answering the current one. Upstream stages
+        stop by sending None (or a _Goodbye) downstream; the response
+        stage owns playback and ends the loop, cancelling the others.
         
         Args:
             call_id: Unique call identifier
@@ -244,238 +502,539 @@ class AILoopHandler:
         """
         logger.info("[AI LOOP] Starting conversation loop with audio streaming")
         
-        max_iterations = 50  # Safety limit
-        iteration = 0
+        # Bounded queues give backpressure between stages
+        audio_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        text_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
         
-        # Accumulate audio chunks for STT
-        audio_buffer = bytearray()
-        buffer_duration_ms = 0
-        max_buffer_duration_ms = 3000  # 3 seconds max buffer
+        upstream = [
+            asyncio.create_task(self._capture_worker(call_id, channel_id, audio_queue)),
+            asyncio.create_task(self._stt_worker(call_id, audio_queue, text_queue)),
+        ]
         
         try:
-            # Stream audio from caller via ARI External Media
-            async for audio_chunk in self.ari.stream_audio_from_caller(channel_id):
+            await self._response_worker(call_id, channel_id, system_prompt, text_queue)
+        except asyncio.CancelledError:
+            logger.info("[AI LOOP] Conversation loop cancelled: call_id=%s", call_id)
+            raise
+        finally:
+            for task in upstream:
+                task.cancel()
+            await asyncio.gather(*upstream, return_exceptions=True)
+        
+        logger.info("[AI LOOP] Conversation loop ended")
+    
+    async def _capture_worker(
+        self,
+        call_id: str,
+        channel_id: str,
+        audio_queue: asyncio.Queue
+    ) -> None:
+        """
+        Pipeline stage 1: capture caller utterances for STT.
+        
+        Utterances are cut by the ARI client's end-of-turn VAD, so each one is
+        handed off as soon as the caller pauses. Also enforces the conversation
+        end conditions, checked once per utterance.
+        
+        Args:
+            call_id: Unique call identifier
+            channel_id: Asterisk channel ID
+            audio_queue: Output queue of utterance bytes, then None/_Goodbye
+        """
+        max_iterations = 50  # Safety limit (utterances)
+        iteration = 0
+        
+        try:
+            # Stream utterances from caller via ARI External Media
+            async for utterance in self.ari.stream_utterances_from_caller(channel_id):
                 iteration += 1
-                loop_start_time = time.time()
                 
-                try:
-                    # Check if conversation should end
-                    should_end, reason = await self.state_mgr.should_end_conversation(call_id)
-                    if should_end:
-                        logger.info(
-                            f"[AI LOOP] Conversation ending: reason={reason}"
-                        )
-                        # Set exit reason in state
-                        await self.state_mgr.set_exit_reason(call_id, reason)
-                        # Send goodbye message
-                        goodbye = self.error_responses.get(reason, "Thank you for calling. Goodbye!")
-                        await self._play_response(channel_id, goodbye, call_id, "goodbye")
-                        break
-                    
-                    # Safety limit
-                    if iteration >= max_iterations:
-                        logger.warning(f"[AI LOOP] Max iterations reached: {max_iterations}")
-                        await self.state_mgr.set_exit_reason(call_id, "max_turns")
-                        break
-                    
-                    # Accumulate audio chunks
-                    audio_buffer.extend(audio_chunk)
-                    buffer_duration_ms += self.ari.chunk_duration_ms
-                    
-                    # Process when buffer reaches optimal size or max duration
-                    if buffer_duration_ms >= max_buffer_duration_ms:
-                        # Step 1: Transcribe audio with STT (with timeout)
-                        step_start = time.time()
-                        caller_text = await asyncio.wait_for(
-                            self.stt.transcribe_audio(bytes(audio_buffer)),
-                            timeout=self.per_step_timeout
-                        )
-                        stt_duration = time.time() - step_start
-                        logger.info(f"[AI LOOP] STT completed: {stt_duration:.3f}s, text_len={len(caller_text)}")
-                        
-                        # Check for silence or empty transcription
-                        if not caller_text or caller_text.strip() == "":
-                            silence_count = await self.state_mgr.increment_silence_count(call_id)
-                            logger.info(f"[AI LOOP] Silence detected: count={silence_count}")
-                            
-                            if silence_count == 1:
-                                # First silence: prompt once
-                                prompt = "Are you still there?"
-                                await self._play_response(channel_id, prompt, call_id, "silence_prompt")
-                            elif silence_count >= 2:
-                                # Second silence: exit immediately
-                                logger.info("[AI LOOP] Second silence, exiting")
-                                await self.state_mgr.set_exit_reason(call_id, "silence")
-                                goodbye = self.error_responses["silence"]
-                                await self._play_response(channel_id, goodbye, call_id, "goodbye")
-                                break
-                            
-                            # Reset buffer and continue
-                            audio_buffer.clear()
-                            buffer_duration_ms = 0
-                            continue
-                        
-                        # Reset silence counter on valid input
-                        await self.state_mgr.reset_silence_count(call_id)
-                        
-                        # Add user turn to state
-                        await self.state_mgr.add_turn(call_id, "user", caller_text)
-                        
-                        # Step 2: Generate AI response with LLM (with timeout)
-                        step_start = time.time()
-                        history = await self.state_mgr.get_conversation_history(call_id)
-                        
-                        ai_response = await asyncio.wait_for(
-                            self.llm.generate_response(history, system_prompt),
-                            timeout=self.per_step_timeout
-                        )
-                        llm_duration = time.time() - step_start
-                        logger.info(f"[AI LOOP] LLM completed: {llm_duration:.3f}s, response_len={len(ai_response)}")
-                        
-                        # Check for confusion indicators
-                        confusion_phrases = ["i don't understand", "i'm not sure", "i can't help"]
-                        if any(phrase in ai_response.lower() for phrase in confusion_phrases):
-                            logger.info("[AI LOOP] Confusion detected, exiting")
-                            await self.state_mgr.set_exit_reason(call_id, "confusion")
-                            await self._play_response(channel_id, ai_response, call_id, "confusion")
-                            break
-                        
-                        # Step 3: Synthesize and play response (with timeout)
-                        step_start = time.time()
-                        await asyncio.wait_for(
-                            self._play_response(channel_id, ai_response, call_id, "response"),
-                            timeout=self.per_step_timeout
-                        )
-                        tts_duration = time.time() - step_start
-                        logger.info(f"[AI LOOP] TTS/Play completed: {tts_duration:.3f}s")
-                        
-                        # Reset buffer
-                        audio_buffer.clear()
-                        buffer_duration_ms = 0
-                        
-                        # Check total loop timeout
-                        loop_duration = time.time() - loop_start_time
-                        if loop_duration > self.total_loop_timeout:
-                            logger.warning(
-                                f"[AI LOOP] Loop timeout exceeded: {loop_duration:.3f}s > {self.total_loop_timeout}s"
-                            )
-                            await self.state_mgr.set_exit_reason(call_id, "timeout")
-                            goodbye = self.error_responses["timeout"]
-                            await self._play_response(channel_id, goodbye, call_id, "goodbye")
-                            break
-                    
-                except asyncio.TimeoutError:
-                    # Timeout - fail-fast, set exit reason, end call
-                    logger.error(f"[AI LOOP] Timeout exceeded")
-                    await self.state_mgr.set_exit_reason(call_id, "timeout")
-                    try:
-                        error_response = self.error_responses["timeout"]
-                        await self._play_response(channel_id, error_response, call_id, "error")
-                    except Exception:
-                        pass
-                    break
-                    
-                except STTServiceError as e:
-                    # STT failure - fail-fast, set exit reason, end call
-                    logger.error(f"[AI LOOP] STT failure: {type(e).__name__}: {e}")
-                    await self.state_mgr.set_exit_reason(call_id, "stt_failure")
-                    try:
-                        error_response = self.error_responses["stt_failure"]
-                        await self._play_response(channel_id, error_response, call_id, "error")
-                    except Exception:
-                        pass
-                    break
-                    
-                except LLMServiceError as e:
-                    # LLM failure - fail-fast, set exit reason, end call
-                    logger.error(f"[AI LOOP] LLM failure: {type(e).__name__}: {e}")
-                    await self.state_mgr.set_exit_reason(call_id, "llm_failure")
-                    try:
-                        error_response = self.error_responses["llm_failure"]
-                        await self._play_response(channel_id, error_response, call_id, "error")
-                    except Exception:
-                        pass
-                    break
-                    
-                except TTSServiceError as e:
-                    # TTS failure - fail-fast, set exit reason, end call
-                    logger.error(f"[AI LOOP] TTS failure: {type(e).__name__}: {e}")
-                    await self.state_mgr.set_exit_reason(call_id, "tts_failure")
-                    try:
-                        error_response = self.error_responses["tts_failure"]
-                        await self._play_response(channel_id, error_response, call_id, "error")
-                    except Exception:
-                        pass
-                    break
-                    
-                except Exception as e:
-                    # General error - fail-fast, set exit reason, end call
-                    logger.error(
-                        f"[AI LOOP] Error in conversation turn: {type(e).__name__}: {e}"
+                # Check if conversation should end
+                should_end, reason = await self.state_mgr.should_end_conversation(call_id)
+                if should_end:
+                    logger.info("[AI LOOP] Conversation ending: reason=%s", reason)
+                    # Set exit reason in state
+                    self._defer_state_write(call_id, self.state_mgr.set_exit_reason(call_id, reason))
+                    # Send goodbye message (spoken by the response stage)
+                    await audio_queue.put(_Goodbye(reason, "goodbye"))
+                    return
+                
+                # Safety limit
+                if iteration >= max_iterations:
+                    logger.warning("[AI LOOP] Max iterations reached: %d", max_iterations)
+                    self._defer_state_write(
+                        call_id, self.state_mgr.set_exit_reason(call_id, "max_turns")
                     )
-                    await self.state_mgr.set_exit_reason(call_id, "general_error")
-                    # Try to apologize to caller
-                    try:
-                        error_response = self.error_responses["general_error"]
-                        await self._play_response(channel_id, error_response, call_id, "error")
-                    except Exception:
-                        pass
                     break
-                    
+                
+                await audio_queue.put(utterance)
+        
         except asyncio.CancelledError:
-            logger.info(f"[AI LOOP] Conversation loop cancelled: call_id={call_id}")
             raise
         except Exception as e:
-            # Outer exception handler for audio streaming failures
+            # Audio streaming failures
             logger.error(
-                f"[AI LOOP] Audio streaming error: {type(e).__name__}: {e}"
+                "[AI LOOP] Audio streaming error: %s: %s",
+                type(e).__name__, e
+            )
+            self._defer_state_write(
+                call_id, self.state_mgr.set_exit_reason(call_id, "general_error")
             )
-            await self.state_mgr.set_exit_reason(call_id, "general_error")
         
-        logger.info("[AI LOOP] Conversation loop ended")
+        await audio_queue.put(None)
+    
+    async def _stt_worker(
+        self,
+        call_id: str,
+        audio_queue: asyncio.Queue,
+        text_queue: asyncio.Queue
+    ) -> None:
+        """
+        Pipeline stage 2: transcribe audio segments.
+        
+        Args:
+            call_id: Unique call identifier
+            audio_queue: Input queue from the capture stage
+            text_queue: Output queue of (transcript, STT seconds), then None/_Goodbye
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await audio_queue.get()
+            if item is None or isinstance(item, _Goodbye):
+                await text_queue.put(item)
+                return
+            
+            segment = item
+            try:
+                # Transcribe audio with STT (with timeout)
+                step_start = loop.time()
+                caller_text = await self._bounded(
+                    self.stt.transcribe_audio(segment), "stt_timeout"
+                )
+                stt_duration = loop.time() - step_start
+                logger.info(
+                    "[AI LOOP] STT completed: %.3fs, text_len=%d", stt_duration, len(caller_text)
+                )
+            except Exception as e:
+                # Fail-fast: record exit reason, apology is spoken downstream
+                reason = self._record_turn_failure(call_id, e)
+                await text_queue.put(_Goodbye(reason, "error"))
+                return
+            
+            await text_queue.put((caller_text, stt_duration))
+    
+    async def _response_worker(
+        self,
+        call_id: str,
+        channel_id: str,
+        system_prompt: str,
+        text_queue: asyncio.Queue
+    ) -> None:
+        """
+        Pipeline stage 3: silence handling, LLM response and playback.
+        
+        Each turn gets one deadline, total_loop_timeout after the turn started
+        (less the time STT took upstream), that every step up to the first
+        response token must meet. Time spent queued behind the previous
+        reply's playback doesn't count against it.
+        
+        Args:
+            call_id: Unique call identifier
+            channel_id: Asterisk channel ID
+            system_prompt: AI profile system prompt
+            text_queue: Input queue from the STT stage
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await text_queue.get()
+            if item is None:
+                return
+            if isinstance(item, _Goodbye):
+                try:
+                    await self._play_exit_response(channel_id, item.reason, call_id, item.context)
+                except Exception:
+                    pass
+                return
+            
+            caller_text, stt_duration = item
+            deadline = loop.time() + self.total_loop_timeout - stt_duration
+            try:
+                # Check for silence or empty transcription
+                if not caller_text or caller_text.strip() == "":
+                    await self._drain_state_writes(call_id)
+                    silence_count = await self.state_mgr.increment_silence_count(call_id)
+                    logger.info("[AI LOOP] Silence detected: count=%d", silence_count)
+                    
+                    if silence_count == 1:
+                        # First silence: prompt once
+                        prompt = "Are you still there?"
+                        await self._play_response(channel_id, prompt, call_id, "silence_prompt")
+                    elif silence_count >= 2:
+                        # Second silence: exit immediately
+                        logger.info("[AI LOOP] Second silence, exiting")
+                        self._defer_state_write(
+                            call_id, self.state_mgr.set_exit_reason(call_id, "silence")
+                        )
+                        await self._play_exit_response(channel_id, "silence", call_id, "goodbye")
+                        return
+                    continue
+                
+                # Reset silence counter, add user turn and fetch history (one round-trip);
+                # a deferred silence-prompt turn must land first or the script's update loses it
+                step_start = loop.time()
+                await self._drain_state_writes(call_id)
+                history = await self.state_mgr.begin_user_turn(call_id, caller_text)
+                
+                # Stream LLM response into sentence-chunked TTS/playback
+                ai_response = await self._stream_response(
+                    channel_id, history, system_prompt, deadline
+                )
+                stream_duration = loop.time() - step_start
+                logger.info(
+                    "[AI LOOP] LLM/TTS/Play streamed: %.3fs, response_len=%d",
+                    stream_duration, len(ai_response)
+                )
+                await self._drain_state_writes(call_id)
+                await self.state_mgr.add_turn(call_id, "assistant", ai_response)
+                
+                # Check for confusion indicators (response already spoken)
+                if _CONFUSION.search(ai_response):
+                    logger.info("[AI LOOP] Confusion detected, exiting")
+                    self._defer_state_write(
+                        call_id, self.state_mgr.set_exit_reason(call_id, "confusion")
+                    )
+                    return
+            
+            except Exception as e:
+                # Fail-fast: set exit reason, apologize, end call
+                reason = self._record_turn_failure(call_id, e)
+                try:
+                    await self._play_exit_response(channel_id, reason, call_id, "error")
+                except Exception:
+                    pass
+                return
+    
+    def _record_turn_failure(self, call_id: str, error: Exception) -> str:
+        """
+        Log a failed conversation turn and record its exit reason (in the background).
+        
+        Args:
+            call_id: Unique call identifier
+            error: Exception raised by a pipeline stage
+            
+        Returns:
+            str: Exit reason (key into _ERROR_RESPONSES)
+        """
+        reason, label = next(
+            (_TURN_FAILURES[cls] for cls in type(error).__mro__ if cls in _TURN_FAILURES),
+            _GENERAL_FAILURE
+        )
+        if isinstance(error, _StepTimeout):
+            reason = error.reason
+        logger.error("[AI LOOP] %s: %s: %s", label, type(error).__name__, error)
+        
+        self._defer_state_write(call_id, self.state_mgr.set_exit_reason(call_id, reason))
+        return reason
+    
+    def _defer_state_write(self, call_id: str, write: Awaitable[None]) -> None:
+        """
+        Run a best-effort state write in the background.
+        
+        Exit-path writes don't change what the caller hears, so playback
+        doesn't wait on their Redis round-trips. Writes for a call run one
+        after another in submission order (each is a read-modify-write of
+        the same key). Every inline state write awaits _drain_state_writes
+        first so it can't interleave with them, and _end_call_gracefully
+        drains them before cleanup.
+        
+        Args:
+            call_id: Unique call identifier
+            write: ConversationStateManager coroutine
+        """
+        task = asyncio.create_task(
+            self._chain_state_write(self._state_writes.get(call_id), write)
+        )
+        self._state_writes[call_id] = task
+        
+        def release(done: asyncio.Task) -> None:
+            if self._state_writes.get(call_id) is done:
+                del self._state_writes[call_id]
+        
+        task.add_done_callback(release)
+    
+    @staticmethod
+    async def _chain_state_write(
+        previous: asyncio.Task | None,
+        write: Awaitable[None]
+    ) -> None:
+        """Await the call's previous background write, then this one."""
+        if previous is not None:
+            await asyncio.wait({previous})
+        try:
+            await write
+        except Exception as e:
+            logger.error("[AI LOOP] Background state write failed: %s: %s", type(e).__name__, e)
+    
+    async def _drain_state_writes(self, call_id: str) -> None:
+        """Wait for the call's background state writes to finish."""
+        pending = self._state_writes.get(call_id)
+        if pending is not None:
+            await asyncio.wait({pending})
+    
+    async def _stream_response(
+        self,
+        channel_id: str,
+        history: List[Dict[str, str]],
+        system_prompt: str,
+        deadline: float
+    ) -> str:
+        """
+        Stream the LLM reply to the caller chunk by chunk.
+        
+        LLM tokens are buffered and flushed at sentence boundaries; each chunk
+        is synthesized in its own streaming task as soon as it is flushed,
+        while a single player coroutine plays the chunks strictly in order.
+        The first sentence plays from its first TTS frame, while the rest of
+        the reply is still being generated and synthesized.
+        
+        Args:
+            channel_id: Asterisk channel ID
+            history: Conversation history for the LLM
+            system_prompt: AI profile system prompt
+            deadline: Event loop time by which the first token must arrive
+            
+        Returns:
+            str: Full response text (for state and exit checks)
+            
+        Raises:
+            LLMServiceError, TTSServiceError, ARIClientError, asyncio.TimeoutError:
+                On any stage failure; pending synthesis and playback are cancelled
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        player = asyncio.create_task(self._play_queued_chunks(channel_id, queue))
+        pending: List[asyncio.Task] = []
+        
+        def flush(text: str) -> None:
+            text = text.strip()
+            if text:
+                pcm_queue: asyncio.Queue = asyncio.Queue()
+                pending.append(asyncio.create_task(self._prefetch_speech(text, pcm_queue)))
+                queue.put_nowait(pcm_queue)
+        
+        parts: List[str] = []
+        buffer = ""
+        token_count = 0
+        loop = asyncio.get_running_loop()
+        step_start = loop.time()
+        budget = min(self.per_step_timeout, deadline - step_start)
+        if budget <= 0:
+            raise _StepTimeout("timeout")
+        try:
+            async for token in self.llm.stream_response(
+                history, system_prompt, first_token_timeout=budget
+            ):
+                if not parts:
+                    logger.info("[AI LOOP] LLM TTFT: %.3fs", loop.time() - step_start)
+                parts.append(token)
+                buffer += token
+                token_count += 1
+                if is_sentence_boundary(buffer, token_count):
+                    flush(buffer)
+                    buffer = ""
+                    token_count = 0
+                    # Surface playback/TTS failures without waiting for the LLM
+                    if player.done():
+                        await player
+            flush(buffer)
+            queue.put_nowait(None)
+            await player
+        except BaseException:
+            player.cancel()
+            for task in pending:
+                task.cancel()
+            raise
+        
+        return "".join(parts).strip()
+    
+    async def _prefetch_speech(self, text: str, out: asyncio.Queue) -> None:
+        """
+        Stream synthesized PCM for one response chunk into a queue.
+        
+        Args:
+            text: Text to speak
+            out: Receives PCM chunks, then None; or the exception on failure
+        """
+        try:
+            async for pcm in self._speech_stream(text, self.per_step_timeout):
+                out.put_nowait(pcm)
+        except Exception as e:
+            out.put_nowait(e)
+            return
+        out.put_nowait(None)
+    
+    @staticmethod
+    async def _drain_speech(pcm_queue: asyncio.Queue) -> AsyncIterator[bytes]:
+        """Yield PCM from a _prefetch_speech queue, re-raising its failure."""
+        while True:
+            item = await pcm_queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    
+    async def _play_queued_chunks(self, channel_id: str, queue: asyncio.Queue) -> None:
+        """
+        Play synthesized response chunks in order until a None sentinel.
+        
+        Args:
+            channel_id: Asterisk channel ID
+            queue: Queue of per-chunk PCM queues (see _prefetch_speech), then None
+        """
+        while True:
+            pcm_queue = await queue.get()
+            if pcm_queue is None:
+                return
+            await self.ari.play_pcm_stream(channel_id, self._drain_speech(pcm_queue))
     
     async def _play_response(
         self,
         channel_id: str,
         text: str,
         call_id: str,
-        context: str = "response"
-    ) -> None:
+        context: str = "response",
+        record_turn: bool = True
+    ) -> bytes:
         """
         Synthesize and play response to caller.
         
+        Cached audio is played directly. Otherwise synthesis is streamed into
+        playback so the caller hears the first frame as soon as TTS produces
+        it, and the complete audio is cached afterwards.
+        
         Args:
             channel_id: Asterisk channel ID
             text: Text to speak
             call_id: Call ID for state tracking
             context: Context for logging
+            record_turn: Add the response to conversation state (except greetings)
+            
+        Returns:
+            bytes: The PCM that was played (empty if playback failed silently)
         """
         try:
-            # Synthesize speech
-            audio_data = await self.tts.synthesize_speech(text)
+            voice = self.tts.voice
+            audio_data = await self.response_cache.get_tts(text, voice)
             
-            # Play via ARI External Media
-            await self.ari.play_audio_to_caller(channel_id, audio_data, format="mp3")
+            if audio_data is not None:
+                # Play via ARI External Media
+                await self.ari.play_audio_to_caller(channel_id, audio_data, format="pcm")
+            else:
+                played = bytearray()
+                
+                async def speech() -> AsyncIterator[bytes]:
+                    async for pcm in self._speech_stream(text, self.per_step_timeout):
+                        played.extend(pcm)
+                        yield pcm
+                
+                await self.ari.play_pcm_stream(channel_id, speech())
+                audio_data = bytes(played)
+                await self.response_cache.set_tts(text, voice, audio_data)
             
             logger.info(
-                f"[AI LOOP] Response played ({context}): "
-                f"text_length={len(text)}, audio_size={len(audio_data)}"
+                "[AI LOOP] Response played (%s): text_length=%d, audio_size=%d",
+                context, len(text), len(audio_data)
             )
             
             # Add to conversation state if not greeting
-            if context != "greeting":
+            if record_turn and context != "greeting":
+                await self._drain_state_writes(call_id)
                 await self.state_mgr.add_turn(call_id, "assistant", text)
             
+            return audio_data
+            
         except TTSServiceError as e:
-            logger.error(f"[AI LOOP] TTS failed for {context}: {e}")
+            logger.error("[AI LOOP] TTS failed for %s: %s", context, e)
+            raise  # Re-raise for fail-fast behavior
+        except asyncio.TimeoutError as e:
+            logger.error("[AI LOOP] Step budget exceeded for %s: %s", context, e)
             raise  # Re-raise for fail-fast behavior
         except ARIClientError as e:
-            logger.error(f"[AI LOOP] ARI playback failed for {context}: {e}")
+            logger.error("[AI LOOP] ARI playback failed for %s: %s", context, e)
             raise  # Re-raise for fail-fast behavior
         except Exception as e:
             logger.error(
-                f"[AI LOOP] Failed to play response ({context}): {e}"
+                "[AI LOOP] Failed to play response (%s): %s",
+                context, e
             )
+            return b""
+    
+    async def _bounded(
+        self,
+        aw: Awaitable[T],
+        reason: str,
+        timeout: float | None = None,
+        deadline: float | None = None
+    ) -> T:
+        """
+        Await an external call within its latency budget.
+        
+        Args:
+            aw: Coroutine or task to await (cancelled on timeout)
+            reason: Exit reason to record if the budget is exceeded
+            timeout: Budget in seconds (default: per_step_timeout)
+            deadline: Event loop time to finish by, if earlier than the budget
+            
+        Returns:
+            The awaitable's result
+            
+        Raises:
+            _StepTimeout: If the budget is exceeded
+        """
+        when = asyncio.get_running_loop().time() + (
+            self.per_step_timeout if timeout is None else timeout
+        )
+        if deadline is not None:
+            when = min(when, deadline)
+        try:
+            async with asyncio.timeout_at(when):
+                return await aw
+        except TimeoutError:
+            raise _StepTimeout(reason) from None
+    
+    async def _play_exit_response(
+        self,
+        channel_id: str,
+        reason: str,
+        call_id: str,
+        context: str
+    ) -> None:
+        """
+        Speak the fixed response for an exit reason.
+        
+        Plays pre-synthesized PCM when warm_error_audio() has run, otherwise
+        synthesizes the text like any other response. Unknown reasons share
+        the default goodbye and its pre-synthesized audio.
+        
+        Args:
+            channel_id: Asterisk channel ID
+            reason: Exit reason (key into _ERROR_RESPONSES)
+            call_id: Call ID for state tracking
+            context: Context for logging
+        """
+        text = _ERROR_RESPONSES.get(reason)
+        if text is None:
+            reason, text = _DEFAULT_EXIT, _DEFAULT_GOODBYE
+        pcm_data = _ERROR_AUDIO.get(reason)
+        if pcm_data is None:
+            await self._play_response(channel_id, text, call_id, context, record_turn=False)
+        else:
+            await self.ari.play_audio_to_caller(channel_id, pcm_data, format="pcm")
+            logger.info(
+                "[AI LOOP] Response played (%s, pre-synthesized): reason=%s", context, reason
+            )
+        # Queued behind the exit reason write (same state key)
+        self._defer_state_write(call_id, self.state_mgr.add_turn(call_id, "assistant", text))
     
     async def _end_call_gracefully(
         self,
@@ -486,39 +1045,75 @@ class AILoopHandler:
         """
         End call gracefully with cleanup.
         
+        The hangup and the state cleanup are independent, so they overlap.
+        
         Args:
             call_id: Unique call identifier
             channel_id: Asterisk channel ID
             reason: Reason for ending
         """
-        try:
-            # Get state to log exit reason if available
-            state = await self.state_mgr.get_state(call_id)
-            exit_reason = state.get("ai_exit_reason") if state else None
-            
-            # Mark as ending in state
-            await self.state_mgr.mark_ending(call_id, reason=exit_reason or reason)
-            
-            # Hang up call
-            await self.ari.hangup_call(channel_id)
-            
-            # Clean up state
-            await self.state_mgr.end_call(call_id)
-            
-            logger.info(
-                f"[AI LOOP] Call ended gracefully: reason={reason}, "
-                f"ai_exit_reason={exit_reason or 'not set'}"
-            )
+        hangup, exit_reason = await asyncio.gather(
+            self.ari.hangup_call(channel_id),
+            self._finish_call_state(call_id, reason),
+            return_exceptions=True
+        )
+        for result in (hangup, exit_reason):
+            if isinstance(result, BaseException):
+                logger.error("[AI LOOP] Error during graceful end: %s", result)
+        if isinstance(exit_reason, BaseException):
+            exit_reason = None
+        
+        logger.info(
+            "[AI LOOP] Call ended gracefully: reason=%s, ai_exit_reason=%s",
+            reason, exit_reason or "not set"
+        )
+    
+    async def _finish_call_state(self, call_id: str, reason: str) -> str | None:
+        """
+        Mark the call as ending and delete its state.
+        
+        Args:
+            call_id: Unique call identifier
+            reason: Reason for ending (used if no exit reason was recorded)
             
-        except Exception as e:
-            logger.error(f"[AI LOOP] Error during graceful end: {e}")
+        Returns:
+            The recorded ai_exit_reason, if any
+        """
+        # Background writes may still be recording the exit reason
+        await self._drain_state_writes(call_id)
+        
+        # Get state to log exit reason if available
+        state = await self.state_mgr.get_state(call_id)
+        exit_reason = state.get("ai_exit_reason") if state else None
+        
+        # Mark as ending in state
+        await self.state_mgr.mark_ending(call_id, reason=exit_reason or reason)
+        
+        # Clean up state
+        await self.state_mgr.end_call(call_id)
+        return exit_reason
+
+
+@lru_cache(maxsize=1)
+def get_ai_loop_handler() -> AILoopHandler:
+    """
+    Get the process-wide AILoopHandler.
+    
+    The handler keeps no per-call state, so one instance (and its OpenAI
+    clients, Redis-backed state manager and ARI connection) serves every
+    concurrent call instead of being rebuilt per call.
+    
+    Returns:
+        AILoopHandler: Shared handler instance
+    """
+    return AILoopHandler()
 
 
 # Implementation Complete:
 # ✅ ARI External Media audio streaming (COMMIT 2 - PHASE 6)
 # ✅ PCM audio capture in 100-300ms chunks
 # ✅ Minimal deterministic VAD (not ML-based)
-# ✅ Immediate response playback (no sentence buffering)
+# ✅ Streamed LLM -> sentence-chunked TTS -> ordered playback
 # ✅ Wired to existing STT/LLM/TTS/StateManager
 # ✅ Honors COMMIT 1 fail-fast and timeout discipline
 # ✅ Observability: time_to_first_audio_ms, chunk timings, exit reasons
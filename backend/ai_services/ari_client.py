@@ -9,7 +9,7 @@ Usage:
     from backend.ai_services.ari_client import ARIClient
     
     ari = ARIClient()
-    await ari.connect()
+    await ari.ensure_connected()  # Idempotent; reuses the live connection
     
     # Answer call and setup audio
     await ari.answer_call(channel_id)
@@ -19,20 +19,20 @@ Usage:
         # Process audio chunk
         pass
     
-    # Play AI response
-    await ari.play_audio_to_caller(channel_id, audio_bytes)
+    # Play AI response (telephony PCM; pass format="mp3" etc. to decode first)
+    await ari.play_audio_to_caller(channel_id, pcm_bytes)
     
     await ari.disconnect()
 """
 
+import audioop
 import logging
-from typing import Optional, AsyncGenerator
+from typing import Optional, AsyncGenerator, AsyncIterator, Dict, List, Tuple
 import asyncio
 import aiohttp
 from urllib.parse import urljoin
+import random
 import struct
-import io
-from pydub import AudioSegment
 
 from app.config.settings import settings
 
@@ -45,6 +45,118 @@ class ARIClientError(Exception):
     pass
 
 
+class _PlaybackClock:
+    """
+    Deadline-based pacing for one playback.
+    
+    Frame n is due at start + (duration of frames 0..n-1), so sleep
+    overshoot doesn't accumulate into drift the way fixed sleeps do. If
+    playback falls behind (e.g. the audio source stalled), the clock
+    re-anchors at the current time instead of bursting to catch up.
+    """
+    
+    max_lag = 0.05  # seconds behind schedule before re-anchoring
+    
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._due = self._loop.time()
+    
+    async def wait(self, duration: float) -> None:
+        """Advance the schedule by duration and sleep until it is due."""
+        self._due += duration
+        delay = self._due - self._loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        elif delay < -self.max_lag:
+            logger.warning(f"[ARI] Playback behind real time by {-delay * 1000:.0f}ms")
+            self._due = self._loop.time()
+
+
+class _RTPSender:
+    """
+    Paced RTP sender for one channel's External Media stream.
+    
+    External Media exchanges RTP with Asterisk, so playback goes out as
+    20ms UDP datagrams on one connected socket instead of an HTTP request
+    per chunk. slin payloads are sent big-endian (network order), as
+    Asterisk expects for signed linear over RTP.
+    """
+    
+    _HEADER = struct.Struct("!BBHII")  # V/P/X/CC, M/PT, sequence, timestamp, SSRC
+    
+    def __init__(
+        self,
+        transport: asyncio.DatagramTransport,
+        payload_type: int,
+        sample_rate: int,
+        sample_width: int,
+        packet_size: int
+    ):
+        self.transport = transport
+        self.payload_type = payload_type
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.packet_size = packet_size  # Payload bytes per packet
+        # One reusable packet buffer: the header is packed and the payload
+        # copied in place (sendto copies anything it has to queue)
+        self._packet = bytearray(self._HEADER.size + packet_size)
+        self._packet_view = memoryview(self._packet)
+        self.sequence = random.getrandbits(16)
+        self.timestamp = random.getrandbits(32)
+        self.ssrc = random.getrandbits(32)
+        self.marker = True  # Set on the first packet of the stream
+    
+    @classmethod
+    async def open(
+        cls,
+        host: str,
+        port: int,
+        payload_type: int,
+        sample_rate: int,
+        sample_width: int,
+        packet_size: int
+    ) -> "_RTPSender":
+        """Create a UDP socket connected to Asterisk's RTP address."""
+        transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=(host, port)
+        )
+        return cls(transport, payload_type, sample_rate, sample_width, packet_size)
+    
+    def send_packet(self, payload: bytes | memoryview) -> None:
+        """Send one RTP packet of little-endian PCM (at most packet_size bytes)."""
+        self._HEADER.pack_into(
+            self._packet, 0,
+            0x80,
+            (0x80 if self.marker else 0) | self.payload_type,
+            self.sequence,
+            self.timestamp,
+            self.ssrc
+        )
+        end = self._HEADER.size + len(payload)
+        self._packet[self._HEADER.size:end] = audioop.byteswap(payload, self.sample_width)
+        self.transport.sendto(self._packet_view[:end])
+        self.marker = False
+        self.sequence = (self.sequence + 1) & 0xFFFF
+        self.timestamp = (self.timestamp + len(payload) // self.sample_width) & 0xFFFFFFFF
+    
+    async def send_paced(
+        self,
+        pcm: bytes | bytearray | memoryview,
+        clock: _PlaybackClock
+    ) -> None:
+        """Send PCM as consecutive packets, each paced to its real-time duration."""
+        bytes_per_second = self.sample_rate * self.sample_width
+        pcm = memoryview(pcm)  # Packet payloads are views, not copies
+        for i in range(0, len(pcm), self.packet_size):
+            payload = pcm[i:i + self.packet_size]
+            self.send_packet(payload)
+            await clock.wait(len(payload) / bytes_per_second)
+    
+    async def close(self) -> None:
+        """Close the socket (awaitable, like other external media connections)."""
+        self.transport.close()
+
+
 class ARIClient:
     """
     Asterisk REST Interface (ARI) client for audio streaming via External Media.
@@ -73,6 +185,8 @@ class ARIClient:
     
     Audio Streaming:
         - Uses ARI External Media for bidirectional audio
+        - Playback as paced 20ms RTP packets when Asterisk reports the
+          channel's RTP address (HTTP per chunk otherwise)
         - PCM 16-bit, 8kHz mono (telephony standard)
         - 100-300ms chunks for low latency
         - Immediate response playback (no sentence buffering)
@@ -83,6 +197,13 @@ class ARIClient:
         self.base_url = settings.ari_url
         self.username = settings.ari_username
         self.password = settings.ari_password
+        # Endpoint prefixes, built once; per-request URLs are plain f-strings
+        self.ari_root = urljoin(self.base_url, "/ari")
+        self.channels_url = f"{self.ari_root}/channels"
+        self.events_url = (
+            self.ari_root.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+            + "/events?app=vca"
+        )
         self.session: Optional[aiohttp.ClientSession] = None
         self.ws_connection = None
         
@@ -96,10 +217,33 @@ class ARIClient:
         # VAD configuration (deterministic, not ML-based)
         self.silence_threshold = 500  # RMS threshold for silence detection
         self.silence_duration_ms = 1500  # 1.5s silence triggers exit
-        self.max_silence_chunks = int(self.silence_duration_ms / self.chunk_duration_ms)
+        # Silence is accumulated in samples, so the exit point doesn't depend on chunk size
+        self.max_silence_samples = self.sample_rate * self.silence_duration_ms // 1000
+        
+        # Utterance segmentation (end-of-turn detection on the same VAD)
+        self.end_of_turn_ms = 600  # Silence after speech that ends an utterance
+        self.max_utterance_ms = 3000  # Hard cap on one utterance
+        self.speech_pad_ms = 200  # Silence kept around speech when trimming an utterance
+        
+        # RTP playback: 20ms packets to the address Asterisk reports for
+        # the External Media channel
+        self.rtp_packet_ms = 20
+        self.rtp_packet_size = self.sample_rate * self.rtp_packet_ms // 1000 * self.sample_width
+        self.rtp_payload_type = 118  # Must match Asterisk's rtpmap for the media format
         
-        # External media connections (channel_id -> connection)
-        self.external_media_connections = {}
+        # External media connections (channel_id -> RTP sender)
+        self.external_media_connections: Dict[str, _RTPSender] = {}
+        
+        # Persistent connection: one session + event WebSocket shared by all
+        # calls, re-established in the background when the socket drops
+        self._connect_lock = asyncio.Lock()
+        self._supervisor_task: Optional[asyncio.Task] = None
+        self.reconnect_initial_delay = 0.5  # seconds
+        self.reconnect_max_delay = 30.0  # seconds
+        # HTTP pool: idle keep-alive connections survive the gap between calls
+        # (aiohttp's default is 15s), so answer/playback skip the TCP handshake
+        self.http_pool_limit = 100
+        self.http_keepalive_timeout = 300.0  # seconds
         
         logger.info(
             f"ARIClient initialized: url={self.base_url}, "
@@ -116,13 +260,17 @@ class ARIClient:
             ARIClientError: If connection fails
         """
         try:
-            # Create HTTP session with auth
-            auth = aiohttp.BasicAuth(self.username, self.password)
-            self.session = aiohttp.ClientSession(auth=auth)
+            # Create HTTP session with auth (kept across WebSocket reconnects)
+            if self.session is None or self.session.closed:
+                auth = aiohttp.BasicAuth(self.username, self.password)
+                connector = aiohttp.TCPConnector(
+                    limit=self.http_pool_limit,
+                    keepalive_timeout=self.http_keepalive_timeout
+                )
+                self.session = aiohttp.ClientSession(auth=auth, connector=connector)
             
             # Establish WebSocket connection for ARI events
-            ws_url = f"{self.base_url.replace('http://', 'ws://')}/ari/events?app=vca"
-            self.ws_connection = await self.session.ws_connect(ws_url)
+            self.ws_connection = await self.session.ws_connect(self.events_url)
             
             logger.info("[ARI] Connected successfully with WebSocket events")
             
@@ -131,6 +279,57 @@ class ARIClient:
             logger.error(f"[ARI] {error_msg}")
             raise ARIClientError(error_msg)
     
+    def is_connected(self) -> bool:
+        """Return True if the HTTP session and event WebSocket are both open."""
+        return (
+            self.session is not None and not self.session.closed
+            and self.ws_connection is not None and not self.ws_connection.closed
+        )
+    
+    async def ensure_connected(self) -> None:
+        """
+        Connect to ARI unless already connected.
+        
+        Idempotent and safe to call concurrently from many calls: only the
+        first caller pays the handshake. Also starts the background task
+        that re-establishes the WebSocket if Asterisk drops it.
+        
+        Raises:
+            ARIClientError: If connection fails
+        """
+        if not self.is_connected():
+            async with self._connect_lock:
+                if not self.is_connected():
+                    await self.connect()
+        
+        if self._supervisor_task is None or self._supervisor_task.done():
+            self._supervisor_task = asyncio.create_task(self._supervise_connection())
+    
+    async def _supervise_connection(self) -> None:
+        """
+        Keep the event WebSocket alive, reconnecting with exponential backoff.
+        
+        Runs until cancelled by disconnect().
+        """
+        delay = self.reconnect_initial_delay
+        while True:
+            ws = self.ws_connection
+            if ws is not None and not ws.closed:
+                # Drain ARI events; the loop ends when the socket closes
+                async for _ in ws:
+                    pass
+                logger.warning("[ARI] Event WebSocket closed, reconnecting")
+            
+            try:
+                async with self._connect_lock:
+                    if not self.is_connected():
+                        await self.connect()
+                delay = self.reconnect_initial_delay
+            except ARIClientError:
+                logger.warning(f"[ARI] Reconnect failed, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.reconnect_max_delay)
+    
     async def disconnect(self) -> None:
         """
         Disconnect from ARI and close all connections.
@@ -138,6 +337,11 @@ class ARIClient:
         Closes HTTP session, WebSocket, and external media connections.
         """
         try:
+            # Stop reconnecting before tearing the connection down
+            if self._supervisor_task is not None:
+                self._supervisor_task.cancel()
+                self._supervisor_task = None
+            
             # Close external media connections
             for channel_id, conn in self.external_media_connections.items():
                 try:
@@ -160,6 +364,25 @@ class ARIClient:
         except Exception as e:
             logger.error(f"[ARI] Error during disconnect: {type(e).__name__}: {e}")
     
+    async def cleanup_channel(self, channel_id: str) -> None:
+        """
+        Release per-channel resources once a call is over.
+        
+        Closes the channel's external media connection but leaves the shared
+        session and event WebSocket open for other calls. Best-effort: errors
+        are logged, never raised.
+        
+        Args:
+            channel_id: Asterisk channel ID
+        """
+        conn = self.external_media_connections.pop(channel_id, None)
+        if conn is None:
+            return
+        try:
+            await conn.close()
+        except Exception as e:
+            logger.warning(f"[ARI] Error closing external media for {channel_id}: {e}")
+    
     async def answer_call(self, channel_id: str) -> None:
         """
         Answer a call via ARI and setup external media for audio streaming.
@@ -175,7 +398,7 @@ class ARIClient:
                 raise ARIClientError("Not connected to ARI")
             
             # Answer the call
-            url = urljoin(self.base_url, f"/ari/channels/{channel_id}/answer")
+            url = f"{self.channels_url}/{channel_id}/answer"
             async with self.session.post(url) as response:
                 if response.status != 204:
                     error = await response.text()
@@ -206,7 +429,7 @@ class ARIClient:
                 raise ARIClientError("Not connected to ARI")
             
             # Create external media connection
-            url = urljoin(self.base_url, f"/ari/channels/{channel_id}/externalMedia")
+            url = f"{self.channels_url}/{channel_id}/externalMedia"
             params = {
                 "app": "vca",
                 "external_host": "127.0.0.1:8000",  # VCA application host
@@ -214,11 +437,26 @@ class ARIClient:
             }
             
             async with self.session.post(url, params=params) as response:
-                if response.status != 204:
+                if response.status not in (200, 204):
                     error = await response.text()
                     raise ARIClientError(f"External media setup failed: {response.status} {error}")
+                media_channel = await response.json() if response.status == 200 else {}
+            
+            # Asterisk reports where it receives RTP for the External Media channel;
+            # without that address playback falls back to HTTP
+            channel_vars = media_channel.get("channelvars") or {}
+            rtp_host = channel_vars.get("UNICASTRTP_LOCAL_ADDRESS")
+            rtp_port = channel_vars.get("UNICASTRTP_LOCAL_PORT")
+            if rtp_host and rtp_port:
+                self.external_media_connections[channel_id] = await _RTPSender.open(
+                    rtp_host, int(rtp_port), self.rtp_payload_type,
+                    self.sample_rate, self.sample_width, self.rtp_packet_size
+                )
             
-            logger.info(f"[ARI] External media setup complete: channel={channel_id}")
+            logger.info(
+                f"[ARI] External media setup complete: channel={channel_id}, "
+                f"rtp={f'{rtp_host}:{rtp_port}' if rtp_host and rtp_port else 'none'}"
+            )
             
         except Exception as e:
             error_msg = f"Failed to setup external media: {type(e).__name__}: {e}"
@@ -243,6 +481,92 @@ class ARIClient:
         Yields:
             bytes: PCM audio chunks (16-bit, 8kHz mono)
             
+        Raises:
+            ARIClientError: If streaming fails
+        """
+        async for chunk, _ in self._stream_vad_chunks(channel_id, chunk_size):
+            yield chunk
+    
+    async def stream_utterances_from_caller(
+        self,
+        channel_id: str
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Stream caller audio segmented into utterances.
+        
+        An utterance is handed off as soon as the caller pauses for
+        end_of_turn_ms after speaking, or when it reaches max_utterance_ms,
+        so turn latency tracks the caller instead of a fixed buffer length.
+        Silence beyond speech_pad_ms before and after the speech is trimmed
+        so STT only receives the voiced span. A window with no speech at all
+        is still yielded at max_utterance_ms, as empty bytes, so the caller's
+        silence is noticed downstream without a transcription request.
+        
+        Args:
+            channel_id: Asterisk channel ID
+            
+        Yields:
+            bytes: PCM audio for one utterance (16-bit, 8kHz mono)
+            
+        Raises:
+            ARIClientError: If streaming fails
+        """
+        end_of_turn_samples = self.sample_rate * self.end_of_turn_ms // 1000
+        max_chunks = max(1, self.max_utterance_ms // self.chunk_duration_ms)
+        
+        pad_chunks = self.speech_pad_ms // self.chunk_duration_ms
+        
+        # Chunks are kept as-is and joined once per utterance (a single copy)
+        chunks: List[bytes] = []
+        trailing_silence = 0  # In samples, like the silence exit
+        # Index range of the voiced chunks (start is None until speech)
+        speech_start: Optional[int] = None
+        speech_end = 0
+        
+        async for chunk, is_silence in self._stream_vad_chunks(channel_id):
+            if not is_silence:
+                if speech_start is None:
+                    speech_start = len(chunks)
+                speech_end = len(chunks) + 1
+            chunks.append(chunk)
+            if is_silence:
+                trailing_silence += len(chunk) // self.sample_width
+            else:
+                trailing_silence = 0
+            
+            end_of_turn = speech_start is not None and trailing_silence >= end_of_turn_samples
+            if end_of_turn or len(chunks) >= max_chunks:
+                if speech_start is None:
+                    yield b""
+                else:
+                    start = max(0, speech_start - pad_chunks)
+                    yield b"".join(chunks[start:speech_end + pad_chunks])
+                chunks = []
+                trailing_silence = 0
+                speech_start = None
+        
+        # Stream ended mid-utterance (e.g. silence exit): flush any speech
+        if speech_start is not None:
+            yield b"".join(chunks[max(0, speech_start - pad_chunks):speech_end + pad_chunks])
+    
+    async def _stream_vad_chunks(
+        self,
+        channel_id: str,
+        chunk_size: Optional[int] = None
+    ) -> AsyncGenerator[Tuple[bytes, bool], None]:
+        """
+        Capture caller audio chunks together with their VAD result.
+        
+        Shared by the chunk and utterance streams so RMS is computed once per
+        chunk. Ends the stream after silence_duration_ms of continuous silence.
+        
+        Args:
+            channel_id: Asterisk channel ID
+            chunk_size: Audio chunk size in bytes (default: 200ms chunks)
+            
+        Yields:
+            (chunk, is_silence): PCM audio chunk (16-bit, 8kHz mono) and its VAD result
+            
         Raises:
             ARIClientError: If streaming fails
         """
@@ -254,7 +578,7 @@ class ARIClient:
             f"chunk_size={chunk_size}B"
         )
         
-        silence_chunks = 0
+        silence_samples = 0
         total_chunks = 0
         
         try:
@@ -263,7 +587,7 @@ class ARIClient:
             
             # Listen for audio data from external media
             # This would typically be an RTP stream or WebSocket connection
-            url = urljoin(self.base_url, f"/ari/channels/{channel_id}/externalMedia")
+            url = f"{self.channels_url}/{channel_id}/externalMedia"
             
             async with self.session.get(url, params={"format": "slin"}) as response:
                 if response.status != 200:
@@ -277,14 +601,14 @@ class ARIClient:
                     is_silence = self._is_silence(chunk)
                     
                     if is_silence:
-                        silence_chunks += 1
+                        silence_samples += len(chunk) // self.sample_width
                         logger.debug(
-                            f"[ARI] Silence detected: chunk={total_chunks}, "
-                            f"silence_count={silence_chunks}/{self.max_silence_chunks}"
+                            "[ARI] Silence detected: chunk=%d, silence_samples=%d/%d",
+                            total_chunks, silence_samples, self.max_silence_samples
                         )
                         
                         # Aggressive silence exit
-                        if silence_chunks >= self.max_silence_chunks:
+                        if silence_samples >= self.max_silence_samples:
                             logger.info(
                                 f"[ARI] Silence threshold reached, ending stream: "
                                 f"channel={channel_id}"
@@ -292,10 +616,10 @@ class ARIClient:
                             break
                     else:
                         # Reset silence counter on voice activity
-                        silence_chunks = 0
+                        silence_samples = 0
                     
                     # Yield audio chunk for processing
-                    yield chunk
+                    yield chunk, is_silence
                     
         except asyncio.CancelledError:
             logger.info(f"[ARI] Audio capture cancelled: channel={channel_id}")
@@ -307,7 +631,7 @@ class ARIClient:
         finally:
             logger.info(
                 f"[ARI] Audio capture ended: channel={channel_id}, "
-                f"total_chunks={total_chunks}, final_silence={silence_chunks}"
+                f"total_chunks={total_chunks}, final_silence_samples={silence_samples}"
             )
     
     def _is_silence(self, audio_chunk: bytes) -> bool:
@@ -325,18 +649,19 @@ class ARIClient:
         if not audio_chunk or len(audio_chunk) == 0:
             return True
         
-        # Calculate RMS (Root Mean Square) energy
-        # PCM 16-bit samples
+        # Calculate RMS (Root Mean Square) energy of the 16-bit samples,
+        # in audioop's C loop rather than a per-sample Python generator
         try:
-            samples = struct.unpack(f'<{len(audio_chunk) // 2}h', audio_chunk)
-            rms = (sum(s * s for s in samples) / len(samples)) ** 0.5
-            
-            is_silence = rms < self.silence_threshold
-            
-            if is_silence:
-                logger.debug(f"[ARI] Silence: RMS={rms:.0f} < {self.silence_threshold}")
-            
-            return is_silence
+            odd_bytes = len(audio_chunk) % self.sample_width
+            if odd_bytes:
+                audio_chunk = audio_chunk[:-odd_bytes]
+            # RMS never exceeds the peak amplitude, so a quiet peak proves
+            # silence with a compare-only scan and skips the multiply-accumulate
+            if audioop.max(audio_chunk, self.sample_width) < self.silence_threshold:
+                return True
+            rms = audioop.rms(audio_chunk, self.sample_width)
+            
+            return rms < self.silence_threshold
         except Exception as e:
             logger.warning(f"[ARI] VAD error: {e}, treating as silence")
             return True
@@ -344,57 +669,58 @@ class ARIClient:
     async def play_audio_to_caller(
         self,
         channel_id: str,
-        audio_data: bytes,
-        format: str = "mp3"
+        audio_data: bytes | AsyncIterator[bytes],
+        format: str = "pcm"
     ) -> None:
         """
         Play audio to caller via External Media.
         
         Immediate response playback with no sentence buffering.
         Converts audio to PCM 16-bit 8kHz mono and streams to channel.
+        Accepts either a complete buffer or a stream of chunks (e.g. a TTS
+        HTTP response body), so upstream never has to buffer a whole clip.
         
         Args:
             channel_id: Asterisk channel ID
-            audio_data: Audio bytes to play (MP3 or other format)
-            format: Audio format (default: mp3)
+            audio_data: Audio to play (telephony PCM, or MP3 etc.), as bytes
+                or an async iterator of byte chunks
+            format: Audio format (default: pcm); "pcm" means already converted
+                telephony PCM and skips decoding, anything else is decoded
+                with ffmpeg and played as it decodes
             
         Raises:
             ARIClientError: If playback fails
         """
+        streamed = not isinstance(audio_data, (bytes, bytearray, memoryview))
         logger.info(
             f"[ARI] Starting audio playback: channel={channel_id}, "
-            f"size={len(audio_data)}B, format={format}"
+            f"size={'stream' if streamed else f'{len(audio_data)}B'}, format={format}"
         )
         
         try:
-            # Convert audio to PCM format for External Media
-            pcm_data = await self._convert_to_pcm(audio_data, format)
-            
-            # Stream audio to channel via External Media
-            url = urljoin(self.base_url, f"/ari/channels/{channel_id}/externalMedia")
-            
-            # Send PCM data in chunks for streaming
-            chunk_size = self.chunk_size
-            total_chunks = 0
-            
-            for i in range(0, len(pcm_data), chunk_size):
-                chunk = pcm_data[i:i + chunk_size]
-                
-                # Send chunk to external media
-                async with self.session.post(
-                    url,
-                    data=chunk,
-                    headers={"Content-Type": "audio/l16"}
-                ) as response:
-                    if response.status not in [200, 204]:
-                        raise ARIClientError(
-                            f"Audio playback failed: {response.status}"
-                        )
+            if streamed and format == "pcm":
+                total_chunks = await self.play_pcm_stream(channel_id, audio_data)
+            elif format != "pcm":
+                # Decode and send concurrently: frames go out as ffmpeg emits them
+                total_chunks = await self.play_pcm_stream(
+                    channel_id, self._iter_pcm_chunks(audio_data, format)
+                )
+            else:
+                # Stream audio to channel via External Media
+                url = f"{self.channels_url}/{channel_id}/externalMedia"
                 
-                total_chunks += 1
+                # Send PCM data in chunks for streaming
+                chunk_size = self.chunk_size
+                total_chunks = 0
+                clock = _PlaybackClock()
                 
-                # Small delay to simulate real-time playback
-                await asyncio.sleep(self.chunk_duration_ms / 1000)
+                # Zero-copy frame views (aiohttp and sendto accept any buffer)
+                pcm_view = memoryview(audio_data)
+                for i in range(0, len(audio_data), chunk_size):
+                    await self._send_pcm_chunk(
+                        channel_id, url, pcm_view[i:i + chunk_size], clock
+                    )
+                    total_chunks += 1
             
             logger.info(
                 f"[ARI] Audio playback complete: channel={channel_id}, "
@@ -406,40 +732,213 @@ class ARIClient:
             logger.error(f"[ARI] {error_msg}")
             raise ARIClientError(error_msg)
     
-    async def _convert_to_pcm(self, audio_data: bytes, format: str) -> bytes:
+    async def play_pcm_stream(
+        self,
+        channel_id: str,
+        chunks: AsyncIterator[bytes]
+    ) -> int:
         """
-        Convert audio to PCM 16-bit 8kHz mono for telephony.
+        Play telephony PCM to caller as it arrives.
+        
+        Incoming chunks of any size are re-framed to chunk_size and sent as
+        soon as a full frame is buffered, so playback starts with the first
+        frame instead of after the whole response is synthesized.
         
         Args:
-            audio_data: Audio bytes in source format
-            format: Source format (mp3, wav, etc.)
+            channel_id: Asterisk channel ID
+            chunks: PCM 16-bit 8kHz mono chunks (see resample_to_telephony)
             
         Returns:
-            bytes: PCM audio data
+            int: Number of frames sent
+            
+        Raises:
+            ARIClientError: If playback fails (errors from chunks propagate as-is)
         """
-        try:
-            # Use pydub for audio format conversion
-            audio = AudioSegment.from_file(io.BytesIO(audio_data), format=format)
+        url = f"{self.channels_url}/{channel_id}/externalMedia"
+        chunk_size = self.chunk_size
+        buffer = bytearray()
+        total_chunks = 0
+        clock = _PlaybackClock()
+        
+        async for pcm in chunks:
+            buffer.extend(pcm)
+            while len(buffer) >= chunk_size:
+                # The slice is already a copy; no extra bytes() round-trip
+                await self._send_pcm_chunk(channel_id, url, buffer[:chunk_size], clock)
+                del buffer[:chunk_size]
+                total_chunks += 1
+        
+        if buffer:
+            await self._send_pcm_chunk(channel_id, url, buffer, clock)
+            total_chunks += 1
+        
+        logger.info(
+            f"[ARI] Streamed playback complete: channel={channel_id}, "
+            f"chunks={total_chunks}"
+        )
+        return total_chunks
+    
+    async def resample_to_telephony(
+        self,
+        chunks: AsyncIterator[bytes],
+        sample_rate: int
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Convert a stream of 16-bit mono PCM to the telephony sample rate.
+        
+        Resampler state is carried across chunks, so chunk boundaries are
+        seamless; an odd trailing byte is held until the next chunk.
+        
+        Args:
+            chunks: PCM 16-bit mono chunks at sample_rate
+            sample_rate: Source sample rate in Hz
             
-            # Convert to telephony format: 16-bit PCM, 8kHz, mono
-            audio = audio.set_frame_rate(self.sample_rate)
-            audio = audio.set_channels(self.channels)
-            audio = audio.set_sample_width(self.sample_width)
+        Yields:
+            bytes: PCM 16-bit 8kHz mono
+        """
+        state = None
+        carry = b""
+        async for chunk in chunks:
+            data = carry + chunk if carry else chunk
+            usable = len(data) - len(data) % self.sample_width
+            carry = data[usable:]
+            if not usable:
+                continue
+            converted, state = audioop.ratecv(
+                data[:usable], self.sample_width, self.channels,
+                sample_rate, self.sample_rate, state
+            )
+            if converted:
+                yield converted
+    
+    def pcm_to_telephony(self, pcm: bytes, sample_rate: int) -> bytes:
+        """
+        Convert a complete 16-bit mono PCM buffer to the telephony sample rate.
+        
+        One-shot counterpart of resample_to_telephony() for whole utterances,
+        e.g. TTSService.synthesize_speech() output.
+        
+        Args:
+            pcm: PCM 16-bit mono at sample_rate
+            sample_rate: Source sample rate in Hz
             
-            # Export as raw PCM
-            pcm_data = audio.raw_data
+        Returns:
+            bytes: PCM 16-bit 8kHz mono
+        """
+        pcm = pcm[:len(pcm) - len(pcm) % self.sample_width]
+        if sample_rate == self.sample_rate or not pcm:
+            return pcm
+        converted, _ = audioop.ratecv(
+            pcm, self.sample_width, self.channels, sample_rate, self.sample_rate, None
+        )
+        return converted
+    
+    async def _send_pcm_chunk(
+        self,
+        channel_id: str,
+        url: str,
+        chunk: bytes | bytearray | memoryview,
+        clock: _PlaybackClock
+    ) -> None:
+        """
+        Send one PCM frame to external media, paced to real time.
+        
+        Uses the channel's RTP sender when one was set up, otherwise one
+        HTTP request per frame.
+        
+        Args:
+            channel_id: Asterisk channel ID
+            url: External media URL for the channel (HTTP fallback)
+            chunk: PCM frame (at most chunk_size bytes)
+            clock: Pacing clock of the current playback
             
-            logger.debug(
-                f"[ARI] Audio converted: format={format}, "
-                f"pcm_size={len(pcm_data)}B"
-            )
+        Raises:
+            ARIClientError: If the frame is rejected
+        """
+        rtp = self.external_media_connections.get(channel_id)
+        if rtp is not None:
+            await rtp.send_paced(chunk, clock)
+            return
+        
+        async with self.session.post(
+            url,
+            data=chunk,
+            headers={"Content-Type": "audio/l16"}
+        ) as response:
+            if response.status not in [200, 204]:
+                raise ARIClientError(
+                    f"Audio playback failed: {response.status}"
+                )
+        
+        # Pace to real time: the frame's own duration, on the playback clock
+        await clock.wait(len(chunk) / (self.sample_rate * self.sample_width))
+    
+    async def _iter_pcm_chunks(
+        self,
+        audio_data: bytes | AsyncIterator[bytes],
+        format: str
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Decode audio to PCM 16-bit 8kHz mono, yielding it as it is decoded.
+        
+        ffmpeg runs as an asyncio subprocess (source audio on stdin, raw
+        telephony PCM on stdout), so playback starts with the first decoded
+        frame instead of after the whole file, and the event loop never
+        blocks on the decode.
+        
+        Args:
+            audio_data: Audio in source format, as bytes or an async iterator
+                of chunks (fed to ffmpeg as they arrive)
+            format: Source format (mp3, wav, etc.)
             
-            return pcm_data
+        Yields:
+            bytes: PCM audio chunks (up to chunk_size bytes)
             
-        except Exception as e:
-            error_msg = f"Audio conversion failed: {type(e).__name__}: {e}"
-            logger.error(f"[ARI] {error_msg}")
-            raise ARIClientError(error_msg)
+        Raises:
+            ARIClientError: If ffmpeg is unavailable or the decode fails
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-loglevel", "error",
+                "-f", format, "-i", "pipe:0",
+                "-f", "s16le", "-ac", str(self.channels), "-ar", str(self.sample_rate),
+                "pipe:1",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except OSError as e:
+            raise ARIClientError(f"Audio conversion failed: cannot start ffmpeg: {e}")
+        
+        async def feed() -> None:
+            try:
+                if isinstance(audio_data, (bytes, bytearray, memoryview)):
+                    process.stdin.write(audio_data)
+                else:
+                    async for chunk in audio_data:
+                        process.stdin.write(chunk)
+                        await process.stdin.drain()
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # ffmpeg exited early; its exit status says why
+            finally:
+                process.stdin.close()
+        
+        feeder = asyncio.create_task(feed())
+        try:
+            while chunk := await process.stdout.read(self.chunk_size):
+                yield chunk
+            
+            await feeder
+            stderr = await process.stderr.read()
+            if await process.wait() != 0:
+                error = stderr.decode(errors="replace").strip()
+                raise ARIClientError(f"Audio conversion failed: format={format}: {error}")
+        finally:
+            feeder.cancel()
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
     
     async def hangup_call(self, channel_id: str) -> None:
         """
@@ -455,7 +954,7 @@ class ARIClient:
             if not self.session:
                 raise ARIClientError("Not connected to ARI")
             
-            url = urljoin(self.base_url, f"/ari/channels/{channel_id}")
+            url = f"{self.channels_url}/{channel_id}"
             async with self.session.delete(url) as response:
                 if response.status not in [204, 404]:  # 404 = already hung up
                     error = await response.text()
@@ -477,12 +976,11 @@ class ARIClient:
             bool: True if ARI is healthy, False otherwise
         """
         try:
-            if not self.session:
-                # Try to connect
-                await self.connect()
+            # Try to connect
+            await self.ensure_connected()
             
             # Test API availability
-            url = urljoin(self.base_url, "/ari/asterisk/info")
+            url = f"{self.ari_root}/asterisk/info"
             async with self.session.get(url) as response:
                 return response.status == 200
                 
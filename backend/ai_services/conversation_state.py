@@ -27,7 +27,6 @@ Usage:
 import logging
 import json
 from typing import List, Dict, Optional, Any
-from datetime import datetime, timezone
 from uuid import UUID
 import time
 
@@ -38,6 +37,25 @@ from app.config.settings import settings
 logger = logging.getLogger(__name__)
 
 
+# Start of a user turn, atomically in one round-trip: reset the silence
+# counter, append the user message, bump turn_count, refresh the TTL.
+# KEYS[1] = state key, ARGV[1] = message JSON, ARGV[2] = TTL seconds.
+# Returns the updated state JSON, or nil if the call has no state.
+_BEGIN_USER_TURN_LUA = """
+local raw = redis.call('GET', KEYS[1])
+if not raw then
+    return nil
+end
+local state = cjson.decode(raw)
+state['silence_count'] = 0
+table.insert(state['conversation_history'], cjson.decode(ARGV[1]))
+state['turn_count'] = state['turn_count'] + 1
+local updated = cjson.encode(state)
+redis.call('SETEX', KEYS[1], ARGV[2], updated)
+return updated
+"""
+
+
 class ConversationStateError(Exception):
     """Raised when conversation state operation fails."""
     pass
@@ -74,10 +92,13 @@ class ConversationStateManager:
         self.max_turns = settings.max_conversation_turns
         self.max_duration = settings.max_conversation_duration_seconds
         self.state_ttl = 3600  # 1 hour TTL for all keys
+        # LLM context cap: the last 8 exchanges (user + assistant messages)
+        self.max_history_messages = 16
+        self._begin_user_turn_script = None  # Registered on first use
         
         logger.info(
-            f"ConversationStateManager initialized: "
-            f"max_turns={self.max_turns}, max_duration={self.max_duration}s"
+            "ConversationStateManager initialized: max_turns=%s, max_duration=%ss",
+            self.max_turns, self.max_duration
         )
     
     def _call_key(self, call_id: str) -> str:
@@ -114,7 +135,7 @@ class ConversationStateManager:
                 "conversation_history": [],
                 "state": "active",
                 "silence_count": 0,  # Track consecutive silences
-                "ai_exit_reason": None,  # Track exit reason: silence, confusion, max_turns, max_duration, stt_failure, llm_failure, tts_failure, timeout
+                "ai_exit_reason": None,  # Track exit reason: silence, confusion, max_turns, max_duration, stt_failure, llm_failure, tts_failure, timeout, stt_timeout, llm_timeout, tts_timeout
                 "metadata": {}
             }
             
@@ -127,13 +148,13 @@ class ConversationStateManager:
             )
             
             logger.info(
-                f"[STATE] Call initialized: call_id={call_id}, "
-                f"tenant_id={tenant_id}, ai_profile_id={ai_profile_id}"
+                "[STATE] Call initialized: call_id=%s, tenant_id=%s, ai_profile_id=%s",
+                call_id, tenant_id, ai_profile_id
             )
             
         except Exception as e:
             error_msg = f"Failed to initialize call state: {type(e).__name__}: {e}"
-            logger.error(f"[STATE] {error_msg}")
+            logger.error("[STATE] %s", error_msg)
             raise ConversationStateError(error_msg)
     
     async def get_state(self, call_id: str) -> Optional[Dict[str, Any]]:
@@ -155,7 +176,7 @@ class ConversationStateManager:
             
             state_json = await redis.get(key)
             if not state_json:
-                logger.warning(f"[STATE] No state found for call_id={call_id}")
+                logger.warning("[STATE] No state found for call_id=%s", call_id)
                 return None
             
             state = json.loads(state_json)
@@ -163,7 +184,7 @@ class ConversationStateManager:
             
         except Exception as e:
             error_msg = f"Failed to get call state: {type(e).__name__}: {e}"
-            logger.error(f"[STATE] {error_msg}")
+            logger.error("[STATE] %s", error_msg)
             raise ConversationStateError(error_msg)
     
     async def add_turn(
@@ -212,19 +233,68 @@ class ConversationStateManager:
             )
             
             logger.info(
-                f"[STATE] Turn added: call_id={call_id}, role={role}, "
-                f"turn_count={state['turn_count']}"
+                "[STATE] Turn added: call_id=%s, role=%s, turn_count=%d",
+                call_id, role, state["turn_count"]
             )
             
         except Exception as e:
             error_msg = f"Failed to add turn: {type(e).__name__}: {e}"
-            logger.error(f"[STATE] {error_msg}")
+            logger.error("[STATE] %s", error_msg)
+            raise ConversationStateError(error_msg)
+    
+    async def begin_user_turn(self, call_id: str, content: str) -> List[Dict[str, str]]:
+        """
+        Record a caller utterance and return the LLM history, in one round-trip.
+        
+        Equivalent to reset_silence_count() + add_turn(call_id, "user", ...)
+        + get_conversation_history(), executed atomically as a Lua script
+        instead of five separate Redis commands on the turn's critical path.
+        
+        Args:
+            call_id: Unique call identifier
+            content: Transcribed caller text
+            
+        Returns:
+            list: Conversation history in LLM format, including this turn
+            
+        Raises:
+            ConversationStateError: If the update fails or no state exists
+        """
+        try:
+            redis = await get_redis_client()
+            if self._begin_user_turn_script is None:
+                self._begin_user_turn_script = redis.register_script(_BEGIN_USER_TURN_LUA)
+            
+            message = {"role": "user", "content": content, "timestamp": time.time()}
+            state_json = await self._begin_user_turn_script(
+                keys=[self._call_key(call_id)],
+                args=[json.dumps(message), self.state_ttl]
+            )
+            if not state_json:
+                raise ConversationStateError(f"No state found for call_id={call_id}")
+            
+            state = json.loads(state_json)
+            logger.info(
+                "[STATE] Turn added: call_id=%s, role=user, turn_count=%d",
+                call_id, state["turn_count"]
+            )
+            return self._history_for_llm(state)
+            
+        except Exception as e:
+            error_msg = f"Failed to begin user turn: {type(e).__name__}: {e}"
+            logger.error("[STATE] %s", error_msg)
             raise ConversationStateError(error_msg)
     
     async def get_conversation_history(self, call_id: str) -> List[Dict[str, str]]:
         """
         Get conversation history for LLM context.
         
+        Messages keep their stored order, so each turn's request extends
+        the previous one and the provider's prompt cache covers everything
+        but the new suffix. Consecutive duplicates (e.g. a repeated silence
+        prompt) are collapsed, and only the last max_history_messages are
+        returned to bound the prompt on long calls.
+        
         Args:
             call_id: Unique call identifier
             
@@ -238,13 +308,19 @@ class ConversationStateManager:
         if not state:
             return []
         
+        return self._history_for_llm(state)
+    
+    def _history_for_llm(self, state: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Convert stored history to LLM messages (see get_conversation_history)."""
         # Convert to LLM format (exclude timestamps)
-        history = [
-            {"role": msg["role"], "content": msg["content"]}
-            for msg in state.get("conversation_history", [])
-        ]
+        history: List[Dict[str, str]] = []
+        for msg in state.get("conversation_history", []):
+            message = {"role": msg["role"], "content": msg["content"]}
+            if history and history[-1] == message:
+                continue
+            history.append(message)
         
-        return history
+        return history[-self.max_history_messages:]
     
     async def should_end_conversation(self, call_id: str) -> tuple[bool, Optional[str]]:
         """
@@ -271,8 +347,8 @@ class ConversationStateManager:
         turn_count = state.get("turn_count", 0)
         if turn_count >= self.max_turns:
             logger.info(
-                f"[STATE] Max turns reached: call_id={call_id}, "
-                f"turns={turn_count}/{self.max_turns}"
+                "[STATE] Max turns reached: call_id=%s, turns=%d/%d",
+                call_id, turn_count, self.max_turns
             )
             return (True, "max_turns")
         
@@ -281,8 +357,8 @@ class ConversationStateManager:
         elapsed = time.time() - started_at
         if elapsed >= self.max_duration:
             logger.info(
-                f"[STATE] Max duration reached: call_id={call_id}, "
-                f"duration={elapsed:.0f}s/{self.max_duration}s"
+                "[STATE] Max duration reached: call_id=%s, duration=%.0fs/%ss",
+                call_id, elapsed, self.max_duration
             )
             return (True, "max_duration")
         
@@ -307,13 +383,13 @@ class ConversationStateManager:
                 state["silence_count"] = state.get("silence_count", 0) + 1
                 await redis.setex(key, self.state_ttl, json.dumps(state))
                 logger.info(
-                    f"[STATE] Silence count incremented: call_id={call_id}, "
-                    f"count={state['silence_count']}"
+                    "[STATE] Silence count incremented: call_id=%s, count=%d",
+                    call_id, state["silence_count"]
                 )
                 return state["silence_count"]
             return 0
         except Exception as e:
-            logger.error(f"[STATE] Failed to increment silence: {type(e).__name__}: {e}")
+            logger.error("[STATE] Failed to increment silence: %s: %s", type(e).__name__, e)
             return 0
     
     async def reset_silence_count(self, call_id: str) -> None:
@@ -332,7 +408,7 @@ class ConversationStateManager:
                 state["silence_count"] = 0
                 await redis.setex(key, self.state_ttl, json.dumps(state))
         except Exception as e:
-            logger.error(f"[STATE] Failed to reset silence: {type(e).__name__}: {e}")
+            logger.error("[STATE] Failed to reset silence: %s: %s", type(e).__name__, e)
     
     async def set_exit_reason(self, call_id: str, reason: str) -> None:
         """
@@ -341,7 +417,8 @@ class ConversationStateManager:
         Args:
             call_id: Unique call identifier
             reason: Exit reason (silence, confusion, max_turns, max_duration, 
-                   stt_failure, llm_failure, tts_failure, timeout)
+                   stt_failure, llm_failure, tts_failure, timeout,
+                   stt_timeout, llm_timeout, tts_timeout)
         """
         try:
             redis = await get_redis_client()
@@ -352,10 +429,11 @@ class ConversationStateManager:
                 state["ai_exit_reason"] = reason
                 await redis.setex(key, self.state_ttl, json.dumps(state))
                 logger.info(
-                    f"[STATE] Exit reason set: call_id={call_id}, reason={reason}"
+                    "[STATE] Exit reason set: call_id=%s, reason=%s",
+                    call_id, reason
                 )
         except Exception as e:
-            logger.error(f"[STATE] Failed to set exit reason: {type(e).__name__}: {e}")
+            logger.error("[STATE] Failed to set exit reason: %s: %s", type(e).__name__, e)
     
     async def mark_ending(self, call_id: str, reason: Optional[str] = None) -> None:
         """
@@ -376,11 +454,11 @@ class ConversationStateManager:
                     state["ai_exit_reason"] = reason
                 await redis.setex(key, self.state_ttl, json.dumps(state))
                 logger.info(
-                    f"[STATE] Call marked as ending: call_id={call_id}, "
-                    f"reason={reason or 'not specified'}"
+                    "[STATE] Call marked as ending: call_id=%s, reason=%s",
+                    call_id, reason or "not specified"
                 )
         except Exception as e:
-            logger.error(f"[STATE] Failed to mark ending: {type(e).__name__}: {e}")
+            logger.error("[STATE] Failed to mark ending: %s: %s", type(e).__name__, e)
     
     async def end_call(self, call_id: str) -> None:
         """
@@ -395,14 +473,13 @@ class ConversationStateManager:
             
             # Delete state (cleanup)
             await redis.delete(key)
-            logger.info(f"[STATE] Call state deleted: call_id={call_id}")
+            logger.info("[STATE] Call state deleted: call_id=%s", call_id)
             
         except Exception as e:
-            logger.error(f"[STATE] Failed to end call: {type(e).__name__}: {e}")
+            logger.error("[STATE] Failed to end call: %s: %s", type(e).__name__, e)
 
 
 # TODO: Add support for metadata updates (e.g., caller intent, sentiment)
-# TODO: Add conversation context trimming for long calls (keep recent messages)
 # TODO: Add support for call transfer state (when human handoff is needed)
 # TODO: Add metrics tracking (latencies, error rates per call)
 # TODO: Consider persisting final conversation to database for analytics
@@ -19,11 +19,11 @@ Usage:
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Optional, AsyncIterator
 import asyncio
-from openai import AsyncOpenAI
 
 from app.config.settings import settings
+from backend.ai_services.openai_client import get_openai_client
 
 
 logger = logging.getLogger(__name__)
@@ -53,23 +53,49 @@ class LLMService:
     """
     
     def __init__(self):
-        """Initialize LLM service with OpenAI client."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        """Initialize LLM service with the shared OpenAI client."""
+        self.client = get_openai_client()
         self.model = settings.llm_model
         # LIVE VOICE: No retries - single-attempt fail-fast for production voice calls
         self.max_retries = 0
         self.retry_delay = 0  # No delays
-        self.max_tokens = 150  # Keep responses concise for phone calls
-        self.temperature = 0.7  # Balanced creativity
+        # Phone replies are 1-2 sentences; decode time grows with every output token
+        self.max_tokens = 60
+        self.stop = ["\n\n"]  # A blank line means the model moved past a spoken reply
+        self.temperature = 0.3  # Focused, less meandering answers
+        self.presence_penalty = 0.6  # Discourage restating earlier turns
         
-        logger.info(f"LLMService initialized with model: {self.model} (fail-fast mode)")
+        logger.info("LLMService initialized with model: %s (fail-fast mode)", self.model)
+    
+    @staticmethod
+    def _build_messages(
+        messages: List[Dict[str, str]],
+        system_prompt: str
+    ) -> List[Dict[str, str]]:
+        """
+        Prepend the system prompt to the conversation history.
+        
+        The system message must stay byte-identical across turns of a call
+        (and across calls for the same profile) so the provider's automatic
+        prompt caching can reuse the prefix. Never interpolate per-turn data
+        into it; dynamic content belongs in the message list.
+        
+        Args:
+            messages: Conversation history [{"role": "user/assistant", "content": "..."}]
+            system_prompt: System prompt from AIProfile
+            
+        Returns:
+            List of messages for the chat completions API
+        """
+        return [{"role": "system", "content": system_prompt.strip()}, *messages]
     
     async def generate_response(
         self,
         messages: List[Dict[str, str]],
         system_prompt: str,
         timeout: float = 15.0,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None
     ) -> str:
         """
         Generate AI response using GPT.
@@ -81,6 +107,7 @@ class LLMService:
             system_prompt: System prompt from AIProfile (defines AI behavior)
             timeout: Maximum time to wait for response (seconds)
             max_tokens: Override default max tokens for response
+            stop: Override default stop sequences
             
         Returns:
             str: AI-generated response text
@@ -104,14 +131,12 @@ class LLMService:
             messages = []
         
         logger.info(
-            f"[LLM] Generating response: "
-            f"messages={len(messages)}, system_prompt_len={len(system_prompt)}"
+            "[LLM] Generating response: messages=%d, system_prompt_len=%d",
+            len(messages), len(system_prompt)
         )
         
         # Build full message list with system prompt
-        full_messages = [
-            {"role": "system", "content": system_prompt}
-        ] + messages
+        full_messages = self._build_messages(messages, system_prompt)
         
         # Try generation with retries
         last_error = None
@@ -124,8 +149,9 @@ class LLMService:
                         messages=full_messages,
                         max_tokens=max_tokens or self.max_tokens,
                         temperature=self.temperature,
+                        presence_penalty=self.presence_penalty,
                         n=1,
-                        stop=None
+                        stop=stop or self.stop
                     ),
                     timeout=timeout
                 )
@@ -141,36 +167,117 @@ class LLMService:
                 
                 # Success!
                 logger.info(
-                    f"[LLM] Response generated: "
-                    f"text_length={len(text)}, attempts={attempt + 1}"
+                    "[LLM] Response generated: text_length=%d, attempts=%d",
+                    len(text), attempt + 1
                 )
                 return text
                 
             except asyncio.TimeoutError:
                 last_error = "Response generation timeout"
                 logger.warning(
-                    f"[LLM] Generation timeout after {timeout}s "
-                    f"(attempt {attempt + 1}/{self.max_retries + 1})"
+                    "[LLM] Generation timeout after %ss (attempt %d/%d)",
+                    timeout, attempt + 1, self.max_retries + 1
                 )
                 
             except Exception as e:
                 last_error = f"{type(e).__name__}: {e}"
                 logger.warning(
-                    f"[LLM] Generation failed: {last_error} "
-                    f"(attempt {attempt + 1}/{self.max_retries + 1})"
+                    "[LLM] Generation failed: %s (attempt %d/%d)",
+                    last_error, attempt + 1, self.max_retries + 1
                 )
             
             # Wait before retry (except on last attempt)
             if attempt < self.max_retries:
                 delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                logger.info(f"[LLM] Retrying in {delay}s...")
+                logger.info("[LLM] Retrying in %ss...", delay)
                 await asyncio.sleep(delay)
         
         # All retries exhausted
         error_msg = f"LLM failed after {self.max_retries + 1} attempts: {last_error}"
-        logger.error(f"[LLM] {error_msg}")
+        logger.error("[LLM] %s", error_msg)
         raise LLMServiceError(error_msg)
     
+    async def stream_response(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: str,
+        first_token_timeout: float = 15.0,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream AI response tokens using GPT.
+        
+        Same request as generate_response(), but yields content deltas as
+        they arrive so the caller can start TTS before generation finishes.
+        
+        Args:
+            messages: Conversation history [{"role": "user/assistant", "content": "..."}]
+            system_prompt: System prompt from AIProfile (defines AI behavior)
+            first_token_timeout: Maximum time to wait for the stream to open (seconds)
+            max_tokens: Override default max tokens for response
+            stop: Override default stop sequences
+            
+        Yields:
+            str: Response text deltas (non-empty)
+            
+        Raises:
+            LLMServiceError: If the stream fails to open, errors mid-stream,
+                or produces no content
+        """
+        if not system_prompt or not system_prompt.strip():
+            raise LLMServiceError("System prompt is required")
+        
+        logger.info(
+            "[LLM] Streaming response: messages=%d, system_prompt_len=%d",
+            len(messages), len(system_prompt)
+        )
+        
+        full_messages = self._build_messages(messages, system_prompt)
+        
+        # LIVE VOICE: single attempt, no retries
+        try:
+            stream = await asyncio.wait_for(
+                self.client.chat.completions.create(
+                    model=self.model,
+                    messages=full_messages,
+                    max_tokens=max_tokens or self.max_tokens,
+                    temperature=self.temperature,
+                    presence_penalty=self.presence_penalty,
+                    n=1,
+                    stop=stop or self.stop,
+                    stream=True
+                ),
+                timeout=first_token_timeout
+            )
+        except asyncio.TimeoutError:
+            error_msg = f"Stream open timeout after {first_token_timeout}s"
+            logger.error("[LLM] %s", error_msg)
+            raise LLMServiceError(error_msg)
+        except Exception as e:
+            error_msg = f"Stream open failed: {type(e).__name__}: {e}"
+            logger.error("[LLM] %s", error_msg)
+            raise LLMServiceError(error_msg)
+        
+        text_length = 0
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    text_length += len(delta)
+                    yield delta
+        except Exception as e:
+            error_msg = f"Stream failed: {type(e).__name__}: {e}"
+            logger.error("[LLM] %s", error_msg)
+            raise LLMServiceError(error_msg)
+        
+        if text_length == 0:
+            raise LLMServiceError("Empty response content")
+        
+        logger.info("[LLM] Stream complete: text_length=%d", text_length)
+    
     def create_fallback_response(self, context: str = "general") -> str:
         """
         Create a fallback response when LLM fails.
@@ -208,12 +315,10 @@ class LLMService:
             )
             return bool(response)
         except Exception as e:
-            logger.error(f"[LLM] Health check failed: {type(e).__name__}: {e}")
+            logger.error("[LLM] Health check failed: %s: %s", type(e).__name__, e)
             return False
 
 
-# TODO: Add conversation history management (trim old messages to save tokens)
 # TODO: Add support for function calling for structured actions (transfer, schedule, etc.)
 # TODO: Add conversation context compression for long calls
 # TODO: Add sentiment analysis for caller satisfaction
-# TODO: Consider streaming responses for lower latency
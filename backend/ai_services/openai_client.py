@@ -0,0 +1,88 @@
+"""
+Shared OpenAI client for the STT, LLM, and TTS services.
+
+Each service used to construct its own AsyncOpenAI client, and with it a
+separate httpx connection pool, so a call's STT, LLM and TTS requests
+could not reuse each other's warm TLS connections. All services now share
+one client and one keep-alive pool.
+
+Retries are disabled at the client level: the SDK default (2 retries with
+backoff) would silently spend the live-voice turn budget. The AI loop
+fails fast and handles errors itself.
+
+Usage:
+    from backend.ai_services.openai_client import get_openai_client
+
+    client = get_openai_client()
+    await client.chat.completions.create(...)
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.config.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+# Connection pool sized for concurrent calls (STT + LLM + TTS streams per call)
+MAX_CONNECTIONS = 200
+MAX_KEEPALIVE_CONNECTIONS = 100
+
+# Per-request ceiling; services enforce their own, tighter step timeouts
+REQUEST_TIMEOUT = httpx.Timeout(15.0, connect=1.0)
+
+
+_openai_client: Optional[AsyncOpenAI] = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Get the process-wide AsyncOpenAI client, creating it on first use.
+
+    Returns:
+        AsyncOpenAI: Shared client (max_retries=0, pooled keep-alive connections)
+    """
+    global _openai_client
+
+    if _openai_client is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=REQUEST_TIMEOUT
+        )
+        _openai_client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=http_client,
+            max_retries=0
+        )
+        logger.info(
+            f"Shared OpenAI client initialized: max_connections={MAX_CONNECTIONS}, "
+            f"max_retries=0"
+        )
+
+    return _openai_client
+
+
+async def close_openai_client() -> None:
+    """
+    Close the shared OpenAI client and its connection pool.
+
+    This should be called once at application shutdown.
+    """
+    global _openai_client
+
+    try:
+        if _openai_client is not None:
+            await _openai_client.close()
+            logger.info("Shared OpenAI client closed")
+    except Exception as e:
+        logger.error(f"Error closing OpenAI client: {type(e).__name__}: {e}")
+    finally:
+        _openai_client = None
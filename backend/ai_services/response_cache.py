@@ -0,0 +1,205 @@
+"""
+Redis-backed cache for greetings and synthesized audio.
+
+Greetings depend only on the AI profile's system prompt, and most
+non-conversational replies (silence prompts, goodbyes, error messages)
+are fixed strings. Regenerating them costs an LLM round-trip and a TTS
+round-trip on every call, right on the time-to-first-audio path.
+
+This module caches:
+- Greeting text per (ai_profile_id, system_prompt)
+- Greeting audio per (ai_profile_id, system_prompt, voice), so a warm
+  call plays its first audio after a single Redis GET
+- TTS audio per (text, voice), as telephony PCM ready for playback
+
+Cache failures are never fatal: every method logs and falls back to a
+miss, so the caller simply generates the content as before.
+
+Usage:
+    from backend.ai_services.response_cache import ResponseCache
+
+    cache = ResponseCache()
+    pcm = await cache.get_tts(text, voice)
+    if pcm is None:
+        pcm = ...  # synthesize and convert to 16-bit 8kHz mono
+        await cache.set_tts(text, voice, pcm)
+"""
+
+import base64
+import hashlib
+import logging
+from typing import Optional
+from uuid import UUID
+
+from app.config.redis import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+
+# Cached content is fully determined by its key, so a long TTL is safe;
+# editing a system prompt changes the greeting key.
+GREETING_TTL_SECONDS = 24 * 3600
+TTS_TTL_SECONDS = 24 * 3600
+
+
+def _sha1(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def greeting_key(ai_profile_id: UUID, system_prompt: str) -> str:
+    """Redis key for a cached greeting."""
+    return f"greeting:{ai_profile_id}:{_sha1(system_prompt)}"
+
+
+def greeting_audio_key(ai_profile_id: UUID, system_prompt: str, voice: str) -> str:
+    """Redis key for cached greeting audio (telephony PCM)."""
+    return f"greeting_audio:{ai_profile_id}:{_sha1(system_prompt)}:{voice}:slin"
+
+
+def tts_key(text: str, voice: str) -> str:
+    """Redis key for cached TTS audio (telephony PCM)."""
+    return f"tts:{_sha1(text)}:{voice}:slin"
+
+
+class ResponseCache:
+    """
+    Best-effort cache for greeting text and TTS audio.
+
+    Uses the shared Redis pool from app.config.redis. The pool decodes
+    responses as UTF-8, so audio is stored base64-encoded.
+    """
+
+    async def get_greeting(self, ai_profile_id: UUID, system_prompt: str) -> Optional[str]:
+        """
+        Get a cached greeting.
+
+        Args:
+            ai_profile_id: AI profile UUID
+            system_prompt: Profile system prompt the greeting was generated from
+
+        Returns:
+            Greeting text, or None on miss or Redis failure
+        """
+        try:
+            redis = await get_redis_client()
+            return await redis.get(greeting_key(ai_profile_id, system_prompt))
+        except Exception as e:
+            logger.warning(f"[RESPONSE CACHE] Greeting lookup failed: {e}")
+            return None
+
+    async def set_greeting(self, ai_profile_id: UUID, system_prompt: str, greeting: str) -> None:
+        """
+        Cache a generated greeting.
+
+        Args:
+            ai_profile_id: AI profile UUID
+            system_prompt: Profile system prompt the greeting was generated from
+            greeting: Greeting text
+        """
+        try:
+            redis = await get_redis_client()
+            await redis.setex(
+                greeting_key(ai_profile_id, system_prompt),
+                GREETING_TTL_SECONDS,
+                greeting
+            )
+        except Exception as e:
+            logger.warning(f"[RESPONSE CACHE] Greeting store failed: {e}")
+
+    async def get_greeting_audio(
+        self,
+        ai_profile_id: UUID,
+        system_prompt: str,
+        voice: str
+    ) -> Optional[bytes]:
+        """
+        Get cached greeting audio.
+
+        Args:
+            ai_profile_id: AI profile UUID
+            system_prompt: Profile system prompt the greeting was generated from
+            voice: TTS voice
+
+        Returns:
+            PCM bytes (16-bit 8kHz mono), or None on miss or Redis failure
+        """
+        try:
+            redis = await get_redis_client()
+            encoded = await redis.get(greeting_audio_key(ai_profile_id, system_prompt, voice))
+            if encoded is None:
+                return None
+            return base64.b64decode(encoded)
+        except Exception as e:
+            logger.warning(f"[RESPONSE CACHE] Greeting audio lookup failed: {e}")
+            return None
+
+    async def set_greeting_audio(
+        self,
+        ai_profile_id: UUID,
+        system_prompt: str,
+        voice: str,
+        audio_data: bytes
+    ) -> None:
+        """
+        Cache synthesized greeting audio.
+
+        Args:
+            ai_profile_id: AI profile UUID
+            system_prompt: Profile system prompt the greeting was generated from
+            voice: TTS voice
+            audio_data: PCM bytes (16-bit 8kHz mono)
+        """
+        if not audio_data:
+            return
+        try:
+            redis = await get_redis_client()
+            await redis.setex(
+                greeting_audio_key(ai_profile_id, system_prompt, voice),
+                GREETING_TTL_SECONDS,
+                base64.b64encode(audio_data).decode("ascii")
+            )
+        except Exception as e:
+            logger.warning(f"[RESPONSE CACHE] Greeting audio store failed: {e}")
+
+    async def get_tts(self, text: str, voice: str) -> Optional[bytes]:
+        """
+        Get cached TTS audio.
+
+        Args:
+            text: Spoken text
+            voice: TTS voice
+
+        Returns:
+            PCM bytes (16-bit 8kHz mono), or None on miss or Redis failure
+        """
+        try:
+            redis = await get_redis_client()
+            encoded = await redis.get(tts_key(text, voice))
+            if encoded is None:
+                return None
+            return base64.b64decode(encoded)
+        except Exception as e:
+            logger.warning(f"[RESPONSE CACHE] TTS lookup failed: {e}")
+            return None
+
+    async def set_tts(self, text: str, voice: str, audio_data: bytes) -> None:
+        """
+        Cache synthesized TTS audio.
+
+        Args:
+            text: Spoken text
+            voice: TTS voice
+            audio_data: PCM bytes (16-bit 8kHz mono)
+        """
+        if not audio_data:
+            return
+        try:
+            redis = await get_redis_client()
+            await redis.setex(
+                tts_key(text, voice),
+                TTS_TTL_SECONDS,
+                base64.b64encode(audio_data).decode("ascii")
+            )
+        except Exception as e:
+            logger.warning(f"[RESPONSE CACHE] TTS store failed: {e}")
@@ -16,32 +16,103 @@ Usage:
 """
 
 import logging
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import Any, Optional
 import asyncio
-from openai import AsyncOpenAI
 from io import BytesIO
 
 from app.config.settings import settings
+from backend.ai_services.openai_client import get_openai_client
 
 
 logger = logging.getLogger(__name__)
 
 
+# Caller audio arrives as 8kHz telephony PCM; Whisper models expect 16kHz
+TELEPHONY_SAMPLE_RATE = 8000
+WHISPER_SAMPLE_RATE = 16000
+
+
 class STTServiceError(Exception):
     """Raised when STT service fails."""
     pass
 
 
+# Serializes first-time loads so concurrent callers don't load the model twice
+_local_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _load_local_model(model_size: str, cpu_threads: int, num_workers: int) -> Any:
+    """
+    Load a local INT8 Whisper model once per process and warm it up.
+    
+    Blocking (download, load and a warm-up decode); call it through
+    STTService.load_local_model(), which runs it in a worker thread.
+    
+    The model is shared by every STTService in the process. With
+    num_workers > 1, concurrent calls decode in parallel on separate
+    model replicas (sharing the weights) instead of queueing behind one.
+    
+    Args:
+        model_size: faster-whisper model name (e.g. "small.en")
+        cpu_threads: CTranslate2 intra-op threads per worker
+        num_workers: Concurrent transcriptions the model accepts
+        
+    Returns:
+        faster_whisper.WhisperModel
+        
+    Raises:
+        STTServiceError: If faster-whisper is not installed
+    """
+    try:
+        import numpy as np
+        from faster_whisper import WhisperModel
+    except ImportError as e:
+        raise STTServiceError(
+            "STT_BACKEND=local requires the faster-whisper package"
+        ) from e
+    
+    model = WhisperModel(
+        model_size,
+        device="cpu",
+        compute_type="int8",
+        cpu_threads=cpu_threads,
+        num_workers=num_workers
+    )
+    
+    # The first decode pays one-off allocation costs; keep them off live calls
+    segments, _ = model.transcribe(
+        np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32),
+        beam_size=1,
+        without_timestamps=True
+    )
+    list(segments)
+    
+    logger.info(
+        "[STT] Local model loaded: %s (int8, %d workers x %d threads)",
+        model_size, num_workers, cpu_threads
+    )
+    return model
+
+
 class STTService:
     """
     Speech-to-Text service for real-time call transcription.
     
-    Uses OpenAI Whisper API for transcription with robust error handling.
+    Uses OpenAI Whisper API for transcription with robust error handling,
+    or a local faster-whisper INT8 model when STT_BACKEND=local (decoded in
+    a worker thread so the event loop never blocks, no network round-trip).
     All methods are non-blocking and safe for use in call threads.
     
     Configuration:
         OPENAI_API_KEY: OpenAI API key (required)
         STT_MODEL: Whisper model to use (default: whisper-1)
+        STT_BACKEND: "openai" (default) or "local"
+        STT_LOCAL_MODEL: faster-whisper model for the local backend (default: small.en)
+        STT_LOCAL_CPU_THREADS: CPU threads per local decode (default: 4)
+        STT_LOCAL_WORKERS: Concurrent local decodes across calls (default: 2)
     
     Error Handling:
         - Network errors: Fail-fast (no retries for live voice)
@@ -51,14 +122,47 @@ class STTService:
     """
     
     def __init__(self):
-        """Initialize STT service with OpenAI client."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
-        self.model = settings.stt_model
+        """
+        Initialize STT service with the shared OpenAI client.
+        
+        The local model is not loaded here (this may run on the event loop);
+        see load_local_model().
+        """
+        self.local_model = None
+        if settings.stt_backend == "local":
+            self.client = None
+            self.model = settings.stt_local_model
+        else:
+            self.client = get_openai_client()
+            self.model = settings.stt_model
         # LIVE VOICE: No retries - single-attempt fail-fast for production voice calls
         self.max_retries = 0
         self.retry_delay = 0  # No delays
         
-        logger.info(f"STTService initialized with model: {self.model} (fail-fast mode)")
+        logger.info("STTService initialized with model: %s (fail-fast mode)", self.model)
+    
+    async def load_local_model(self) -> None:
+        """
+        Load the local model in a worker thread (no-op for the OpenAI backend).
+        
+        Meant to be awaited once at startup; transcribe_audio() also calls it
+        so the first call still works if startup skipped it.
+        
+        Raises:
+            STTServiceError: If faster-whisper is not installed
+        """
+        if self.client is not None or self.local_model is not None:
+            return
+        
+        def load() -> Any:
+            with _local_model_lock:
+                return _load_local_model(
+                    settings.stt_local_model,
+                    settings.stt_local_cpu_threads,
+                    settings.stt_local_workers
+                )
+        
+        self.local_model = await asyncio.to_thread(load)
     
     async def transcribe_audio(
         self,
@@ -72,7 +176,8 @@ class STTService:
         This method is non-blocking and includes timeout protection.
         
         Args:
-            audio_data: Raw audio bytes (WAV, MP3, or other supported format)
+            audio_data: Raw audio bytes (WAV, MP3, or other supported format;
+                PCM 16-bit 8kHz mono for the local backend)
             language: Language code (default: "en" for English)
             timeout: Maximum time to wait for transcription (seconds)
             
@@ -90,70 +195,128 @@ class STTService:
         """
         # Validate input
         if not audio_data or len(audio_data) == 0:
-            logger.warning("[STT] Empty audio data provided, returning empty string")
+            logger.debug("[STT] Empty audio data provided, returning empty string")
             return ""
         
         logger.info(
-            f"[STT] Starting transcription: "
-            f"audio_size={len(audio_data)} bytes, language={language}"
+            "[STT] Starting transcription: audio_size=%d bytes, language=%s",
+            len(audio_data), language
         )
         
         # Try transcription with retries
         last_error = None
         for attempt in range(self.max_retries + 1):
             try:
-                # Create file-like object from bytes
-                audio_file = BytesIO(audio_data)
-                audio_file.name = "audio.wav"  # OpenAI requires a filename
-                
-                try:
-                    # Call OpenAI Whisper API with timeout
-                    result = await asyncio.wait_for(
-                        self.client.audio.transcriptions.create(
-                            model=self.model,
-                            file=audio_file,
-                            language=language,
-                            response_format="text"
-                        ),
+                if self.client is None:
+                    await self.load_local_model()
+                    # CPU-bound decode runs off the event loop
+                    text = await asyncio.wait_for(
+                        asyncio.to_thread(self._transcribe_local, audio_data, language),
                         timeout=timeout
                     )
-                    
-                    # Success!
-                    text = result.strip() if isinstance(result, str) else ""
-                    logger.info(
-                        f"[STT] Transcription successful: "
-                        f"text_length={len(text)}, attempts={attempt + 1}"
-                    )
-                    return text
-                finally:
-                    # Always close the BytesIO object
-                    audio_file.close()
+                else:
+                    text = await self._transcribe_remote(audio_data, language, timeout)
+                
+                # Success!
+                logger.info(
+                    "[STT] Transcription successful: text_length=%d, attempts=%d",
+                    len(text), attempt + 1
+                )
+                return text
                 
             except asyncio.TimeoutError:
                 last_error = "Transcription timeout"
                 logger.warning(
-                    f"[STT] Transcription timeout after {timeout}s "
-                    f"(attempt {attempt + 1}/{self.max_retries + 1})"
+                    "[STT] Transcription timeout after %ss (attempt %d/%d)",
+                    timeout, attempt + 1, self.max_retries + 1
                 )
                 
             except Exception as e:
                 last_error = f"{type(e).__name__}: {e}"
                 logger.warning(
-                    f"[STT] Transcription failed: {last_error} "
-                    f"(attempt {attempt + 1}/{self.max_retries + 1})"
+                    "[STT] Transcription failed: %s (attempt %d/%d)",
+                    last_error, attempt + 1, self.max_retries + 1
                 )
             
             # Wait before retry (except on last attempt)
             if attempt < self.max_retries:
                 delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                logger.info(f"[STT] Retrying in {delay}s...")
+                logger.info("[STT] Retrying in %ss...", delay)
                 await asyncio.sleep(delay)
         
         # All retries exhausted
         error_msg = f"STT failed after {self.max_retries + 1} attempts: {last_error}"
-        logger.error(f"[STT] {error_msg}")
+        logger.error("[STT] %s", error_msg)
         raise STTServiceError(error_msg)
     
+    async def _transcribe_remote(
+        self,
+        audio_data: bytes,
+        language: Optional[str],
+        timeout: float
+    ) -> str:
+        """
+        Transcribe with the OpenAI Whisper API.
+        
+        Args:
+            audio_data: Raw audio bytes
+            language: Language code
+            timeout: Maximum time to wait for transcription (seconds)
+            
+        Returns:
+            str: Transcribed text
+        """
+        # Create file-like object from bytes
+        audio_file = BytesIO(audio_data)
+        audio_file.name = "audio.wav"  # OpenAI requires a filename
+        
+        try:
+            # Call OpenAI Whisper API with timeout
+            result = await asyncio.wait_for(
+                self.client.audio.transcriptions.create(
+                    model=self.model,
+                    file=audio_file,
+                    language=language,
+                    response_format="text"
+                ),
+                timeout=timeout
+            )
+            return result.strip() if isinstance(result, str) else ""
+        finally:
+            # Always close the BytesIO object
+            audio_file.close()
+    
+    def _transcribe_local(self, audio_data: bytes, language: Optional[str]) -> str:
+        """
+        Transcribe telephony PCM with the local model (blocking; run in a thread).
+        
+        Args:
+            audio_data: PCM 16-bit 8kHz mono
+            language: Language code
+            
+        Returns:
+            str: Transcribed text
+        """
+        import numpy as np
+        
+        usable = len(audio_data) - len(audio_data) % 2
+        samples = np.frombuffer(audio_data[:usable], dtype=np.int16).astype(np.float32)
+        samples /= 32768.0
+        
+        # Linear upsample 8kHz -> 16kHz
+        factor = WHISPER_SAMPLE_RATE // TELEPHONY_SAMPLE_RATE
+        positions = np.arange(len(samples) * factor, dtype=np.float32) / factor
+        samples = np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+        
+        segments, _ = self.local_model.transcribe(
+            samples,
+            language=language,
+            beam_size=1,
+            vad_filter=False,
+            without_timestamps=True
+        )
+        return "".join(segment.text for segment in segments).strip()
+    
     async def health_check(self) -> bool:
         """
         Check if STT service is available.
@@ -167,7 +330,7 @@ class STTService:
             logger.info("[STT] Health check - service configured")
             return True
         except Exception as e:
-            logger.error(f"[STT] Health check failed: {type(e).__name__}: {e}")
+            logger.error("[STT] Health check failed: %s: %s", type(e).__name__, e)
             return False
 
 
@@ -18,12 +18,13 @@ Usage:
         # Handle gracefully - maybe end call or retry
 """
 
+import contextlib
 import logging
-from typing import Optional
+from typing import Optional, AsyncIterator
 import asyncio
-from openai import AsyncOpenAI
 
 from app.config.settings import settings
+from backend.ai_services.openai_client import get_openai_client
 
 
 logger = logging.getLogger(__name__)
@@ -62,17 +63,23 @@ class TTSService:
     """
     
     def __init__(self):
-        """Initialize TTS service with OpenAI client."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        """Initialize TTS service with the shared OpenAI client."""
+        self.client = get_openai_client()
         self.model = settings.tts_model
         self.voice = settings.tts_voice
         # LIVE VOICE: No retries - single-attempt fail-fast for production voice calls
         self.max_retries = 0
         self.retry_delay = 0  # No delays
         self.speed = 1.0  # Normal speaking speed
+        self.max_chars = 500  # Longer text is truncated to prevent timeouts
+        
+        # Streaming output (response_format="pcm"): 16-bit signed LE mono
+        self.pcm_sample_rate = 24000
+        self.stream_chunk_size = 4800  # 100ms of 24kHz PCM
         
         logger.info(
-            f"TTSService initialized with model: {self.model}, voice: {self.voice} (fail-fast mode)"
+            "TTSService initialized with model: %s, voice: %s (fail-fast mode)",
+            self.model, self.voice
         )
     
     async def synthesize_speech(
@@ -94,7 +101,7 @@ class TTSService:
             timeout: Maximum time to wait for synthesis (seconds)
             
         Returns:
-            bytes: Audio data in MP3 format
+            bytes: Raw PCM (16-bit signed LE, mono, pcm_sample_rate Hz)
             
         Raises:
             TTSServiceError: If synthesis fails after retries
@@ -104,25 +111,19 @@ class TTSService:
             - Single-attempt fail-fast (no retries for live voice calls)
             - Times out after specified duration to prevent blocking
             - All errors are logged with context for debugging
-            - Returns MP3 format for efficient streaming
+            - Returns raw PCM rather than MP3, so playback only resamples
+              (ARIClient.pcm_to_telephony) instead of decoding per turn
         """
         # Validate input
         if not text or not text.strip():
             logger.warning("[TTS] Empty text provided, returning empty audio")
             return b""
         
-        # Truncate very long text to prevent timeout
-        max_chars = 500
-        if len(text) > max_chars:
-            logger.warning(
-                f"[TTS] Text too long ({len(text)} chars), "
-                f"truncating to {max_chars} chars"
-            )
-            text = text[:max_chars] + "..."
+        text = self._truncate(text)
         
         logger.info(
-            f"[TTS] Starting synthesis: "
-            f"text_length={len(text)}, voice={voice or self.voice}"
+            "[TTS] Starting synthesis: text_length=%d, voice=%s",
+            len(text), voice or self.voice
         )
         
         # Try synthesis with retries
@@ -135,52 +136,135 @@ class TTSService:
                         model=self.model,
                         voice=voice or self.voice,
                         input=text,
-                        response_format="mp3",
+                        response_format="pcm",
                         speed=speed or self.speed
                     ),
                     timeout=timeout
                 )
                 
                 # Read audio data
-                audio_data = b""
-                async for chunk in response.iter_bytes():
-                    audio_data += chunk
+                audio_data = b"".join([chunk async for chunk in response.iter_bytes()])
                 
                 if not audio_data:
                     raise TTSServiceError("Empty audio data returned")
                 
                 # Success!
                 logger.info(
-                    f"[TTS] Synthesis successful: "
-                    f"audio_size={len(audio_data)} bytes, attempts={attempt + 1}"
+                    "[TTS] Synthesis successful: audio_size=%d bytes, attempts=%d",
+                    len(audio_data), attempt + 1
                 )
                 return audio_data
                 
             except asyncio.TimeoutError:
                 last_error = "Synthesis timeout"
                 logger.warning(
-                    f"[TTS] Synthesis timeout after {timeout}s "
-                    f"(attempt {attempt + 1}/{self.max_retries + 1})"
+                    "[TTS] Synthesis timeout after %ss (attempt %d/%d)",
+                    timeout, attempt + 1, self.max_retries + 1
                 )
                 
             except Exception as e:
                 last_error = f"{type(e).__name__}: {e}"
                 logger.warning(
-                    f"[TTS] Synthesis failed: {last_error} "
-                    f"(attempt {attempt + 1}/{self.max_retries + 1})"
+                    "[TTS] Synthesis failed: %s (attempt %d/%d)",
+                    last_error, attempt + 1, self.max_retries + 1
                 )
             
             # Wait before retry (except on last attempt)
             if attempt < self.max_retries:
                 delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                logger.info(f"[TTS] Retrying in {delay}s...")
+                logger.info("[TTS] Retrying in %ss...", delay)
                 await asyncio.sleep(delay)
         
         # All retries exhausted
         error_msg = f"TTS failed after {self.max_retries + 1} attempts: {last_error}"
-        logger.error(f"[TTS] {error_msg}")
+        logger.error("[TTS] %s", error_msg)
         raise TTSServiceError(error_msg)
     
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        speed: Optional[float] = None,
+        first_chunk_timeout: float = 15.0
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize text to speech, yielding raw PCM as it is generated.
+        
+        Unlike synthesize_speech(), audio is yielded while the API is still
+        producing it, so playback can start after the first chunk instead of
+        after the whole utterance.
+        
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use (default: from settings)
+            speed: Speaking speed 0.25-4.0 (default: 1.0)
+            first_chunk_timeout: Maximum time to wait for the first audio (seconds)
+            
+        Yields:
+            bytes: PCM chunks (16-bit signed LE, mono, pcm_sample_rate Hz)
+            
+        Raises:
+            TTSServiceError: If the stream fails to open in time or breaks mid-way
+        """
+        if not text or not text.strip():
+            logger.warning("[TTS] Empty text provided, returning empty audio")
+            return
+        
+        text = self._truncate(text)
+        
+        logger.info(
+            "[TTS] Starting streaming synthesis: text_length=%d, voice=%s",
+            len(text), voice or self.voice
+        )
+        
+        # LIVE VOICE: single attempt, no retries
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                async with asyncio.timeout(first_chunk_timeout):
+                    response = await stack.enter_async_context(
+                        self.client.audio.speech.with_streaming_response.create(
+                            model=self.model,
+                            voice=voice or self.voice,
+                            input=text,
+                            response_format="pcm",
+                            speed=speed or self.speed
+                        )
+                    )
+                    chunks = response.iter_bytes(self.stream_chunk_size)
+                    first_chunk = await anext(chunks, b"")
+                
+                if not first_chunk:
+                    raise TTSServiceError("Empty audio data returned")
+                
+                audio_size = len(first_chunk)
+                yield first_chunk
+                async for chunk in chunks:
+                    audio_size += len(chunk)
+                    yield chunk
+        
+        except TTSServiceError:
+            raise
+        except TimeoutError:
+            error_msg = f"Stream open timeout after {first_chunk_timeout}s"
+            logger.error("[TTS] %s", error_msg)
+            raise TTSServiceError(error_msg)
+        except Exception as e:
+            error_msg = f"Streaming synthesis failed: {type(e).__name__}: {e}"
+            logger.error("[TTS] %s", error_msg)
+            raise TTSServiceError(error_msg)
+        
+        logger.info("[TTS] Streaming synthesis complete: audio_size=%d bytes", audio_size)
+    
+    def _truncate(self, text: str) -> str:
+        """Truncate very long text to prevent timeout."""
+        if len(text) > self.max_chars:
+            logger.warning(
+                "[TTS] Text too long (%d chars), truncating to %d chars",
+                len(text), self.max_chars
+            )
+            text = text[:self.max_chars] + "..."
+        return text
+    
     async def health_check(self) -> bool:
         """
         Check if TTS service is available.
@@ -196,12 +280,9 @@ class TTSService:
             )
             return len(audio) > 0
         except Exception as e:
-            logger.error(f"[TTS] Health check failed: {type(e).__name__}: {e}")
+            logger.error("[TTS] Health check failed: %s: %s", type(e).__name__, e)
             return False
 
 
 # TODO: Add support for SSML for better control (pauses, emphasis, etc.)
-# TODO: Add audio format conversion if needed (MP3 -> WAV, etc.)
-# TODO: Consider caching common phrases to reduce API calls
 # TODO: Add support for voice cloning for branded experiences
-# TODO: Investigate streaming TTS for lower time-to-first-audio
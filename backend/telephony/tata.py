@@ -21,13 +21,15 @@ SCOPE:
     - ❌ No outbound calls (future phase)
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 from uuid import UUID
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, insert
+from sqlalchemy.engine import Row
 
 from backend.telephony.adapter import TelephonyAdapter
 from backend.telephony.types import CallMetadata, CallEvent, CallEventType, CallDirection
@@ -335,17 +337,16 @@ class TataTelephonyAdapter(TelephonyAdapter):
             )
             
             # TODO: Uncomment when channel_id is available:
-            # from backend.ai_services.ai_loop_handler import AILoopHandler
+            # from backend.ai_services.ai_loop_handler import get_ai_loop_handler
             # import asyncio
             # 
-            # ai_handler = AILoopHandler()
+            # ai_handler = get_ai_loop_handler()
             # asyncio.create_task(
             #     ai_handler.handle_inbound_call(
             #         call_id=str(call_record.id),
             #         channel_id=call_metadata.channel_id,  # Need to add this field
             #         tenant_id=tenant_id,
-            #         ai_profile_id=ai_profile.id,
-            #         db=self.db
+            #         ai_profile_id=ai_profile.id
             #     )
             # )
         else:
@@ -412,12 +413,13 @@ class TataTelephonyAdapter(TelephonyAdapter):
         caller_number: str,
         called_number: str,
         call_id: Optional[str]
-    ) -> Optional[Call]:
+    ) -> Optional[Row]:
         """
         Create a Call record in the database.
         
         This function safely persists the call to the database with
-        proper tenant isolation and error handling.
+        proper tenant isolation and error handling. Uses a single
+        INSERT ... RETURNING round-trip instead of add/commit/refresh.
         
         Args:
             tenant_id: UUID of the tenant
@@ -427,7 +429,7 @@ class TataTelephonyAdapter(TelephonyAdapter):
             call_id: Optional external call ID from Asterisk
             
         Returns:
-            Call record if created successfully, None otherwise
+            Row with (id, started_at) if created successfully, None otherwise
         """
         try:
             logger.debug(
@@ -436,18 +438,17 @@ class TataTelephonyAdapter(TelephonyAdapter):
             )
             
             # Create Call record with proper tenant isolation
-            call = Call(
+            stmt = insert(Call).values(
                 tenant_id=tenant_id,
                 phone_number_id=phone_number_id,
                 direction=DBCallDirection.INBOUND,
                 status=DBCallStatus.COMPLETED,  # TODO: Add INITIATED/IN_PROGRESS status to enum
                 started_at=datetime.now(timezone.utc),
                 ended_at=None  # Will be updated when call ends
-            )
+            ).returning(Call.id, Call.started_at)
             
-            self.db.add(call)
+            call = self.db.execute(stmt).one()
             self.db.commit()
-            self.db.refresh(call)
             
             logger.debug(f"Call record created with ID: {call.id}")
             return call
@@ -470,10 +471,8 @@ class TataTelephonyAdapter(TelephonyAdapter):
         Get the AI profile for a tenant to use in conversations.
         
         Prefers the default profile, falls back to any available profile.
-        
-        NOTE: This method is async for future compatibility but currently
-        uses synchronous database queries. In production with high concurrency,
-        consider using AsyncSession with async queries to avoid blocking the event loop.
+        Both cases are served by one ordered query, run in a worker thread
+        so the synchronous session doesn't block the event loop.
         
         Args:
             tenant_id: UUID of the tenant
@@ -486,23 +485,21 @@ class TataTelephonyAdapter(TelephonyAdapter):
             
             logger.debug(f"Looking up AI profile for tenant={tenant_id}")
             
-            # Try to get default profile first
-            ai_profile = self.db.query(AIProfile).filter(
-                AIProfile.tenant_id == tenant_id,
-                AIProfile.is_default
-            ).first()
-            
-            if ai_profile:
-                logger.debug(f"Found default AI profile: {ai_profile.id}")
-                return ai_profile
-            
-            # Fallback to first available profile
-            ai_profile = self.db.query(AIProfile).filter(
-                AIProfile.tenant_id == tenant_id
-            ).first()
+            # Default profile first, else any available profile
+            stmt = (
+                select(AIProfile)
+                .where(AIProfile.tenant_id == tenant_id)
+                .order_by(AIProfile.is_default.desc())
+                .limit(1)
+            )
+            ai_profile = await asyncio.to_thread(
+                lambda: self.db.execute(stmt).scalars().first()
+            )
             
             if ai_profile:
-                logger.debug(f"Found AI profile (not default): {ai_profile.id}")
+                logger.debug(
+                    f"Found AI profile: {ai_profile.id} (default={ai_profile.is_default})"
+                )
                 return ai_profile
             
             logger.warning(f"No AI profile found for tenant={tenant_id}")
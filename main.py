@@ -15,10 +15,15 @@ business logic must enforce tenant isolation.
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 import sys
+import asyncio
 import logging
 
 from app.config import settings, is_config_valid
 from app.config.redis import init_redis, close_redis
+from app.config.database import async_engine
+from services.notifications import notification_log_buffer
+from backend.ai_services.ai_loop_handler import AILoopHandler, get_ai_loop_handler
+from backend.ai_services.openai_client import close_openai_client
 from app.api import (
     health_router,
     tenant_router,
@@ -56,6 +61,13 @@ app = FastAPI(
 async def startup_event():
     """Initialize resources on application startup."""
     logger.info("Application starting up...")
+    loop = asyncio.get_running_loop()
+    if not type(loop).__module__.startswith("uvloop"):
+        # The AI loop awaits 10+ sockets per turn; uvloop cuts that scheduling overhead
+        logger.warning(
+            f"Running on {type(loop).__name__}, not uvloop - "
+            f"install uvicorn[standard] for lower call latency"
+        )
     try:
         # Initialize Redis for conversation state management
         await init_redis()
@@ -65,17 +77,47 @@ async def startup_event():
         # Don't crash the app - Redis might not be needed for all endpoints
         # But log the error prominently
         logger.warning("Application started WITHOUT Redis - AI loop will not work!")
+    try:
+        handler = get_ai_loop_handler()
+    except Exception as e:
+        logger.error(f"Failed to initialize AI loop handler: {e}")
+        return
+    try:
+        # Pre-synthesize fallback responses in the background (best-effort;
+        # synthesis doesn't need Redis, the TTS cache is skipped without it)
+        app.state.audio_prewarm_task = asyncio.create_task(handler.warm_error_audio())
+    except Exception as e:
+        logger.error(f"Failed to start error audio prewarm: {e}")
+    try:
+        # Load the local STT model (STT_BACKEND=local) in a worker thread before calls arrive
+        await handler.stt.load_local_model()
+    except Exception as e:
+        logger.error(f"Failed to load local STT model: {e}")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup resources on application shutdown."""
     logger.info("Application shutting down...")
-    try:
-        await close_redis()
-        logger.info("Redis closed successfully")
-    except Exception as e:
-        logger.error(f"Error during shutdown: {e}")
+    prewarm_task = getattr(app.state, "audio_prewarm_task", None)
+    if prewarm_task is not None and not prewarm_task.done():
+        # Don't leave a TTS request running against the closing OpenAI client
+        prewarm_task.cancel()
+        await asyncio.gather(prewarm_task, return_exceptions=True)
+    # Each step gets its own try so one failure doesn't leak the resources after it
+    for label, close in (
+        # Persist any notification logs still waiting in the batch buffer
+        ("notification log flush", notification_log_buffer.flush),
+        ("Redis", close_redis),
+        ("database pool", async_engine.dispose),
+        ("ARI client", AILoopHandler.close_shared_ari),
+        ("OpenAI client", close_openai_client),
+    ):
+        try:
+            await close()
+            logger.info(f"Shutdown: {label} done")
+        except Exception as e:
+            logger.error(f"Error during shutdown ({label}): {e}")
 
 
 # Register routers
@@ -187,5 +229,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
-        log_level="info"
+        log_level="info",
+        loop="auto"  # uvloop when installed (see requirements.txt), asyncio otherwise
     )
@@ -19,6 +19,6 @@ All adapters MUST:
 
 from .whatsapp_adapter import WhatsAppAdapter
 from .email_adapter import EmailAdapter
-from .notification_service import NotificationService
+from .notification_service import NotificationService, NotificationLogBuffer, notification_log_buffer
 
-__all__ = ['WhatsAppAdapter', 'EmailAdapter', 'NotificationService']
+__all__ = ['WhatsAppAdapter', 'EmailAdapter', 'NotificationService', 'NotificationLogBuffer', 'notification_log_buffer']
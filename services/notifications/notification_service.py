@@ -17,12 +17,15 @@ STRICT RULES:
 - No improper imports from Phase 5
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Optional, List, Dict, Any, Callable
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.config.database import SessionLocal
 from app.models import CallSummary, NotificationLog
 from services.notifications.whatsapp_adapter import WhatsAppAdapter
 from services.notifications.email_adapter import EmailAdapter
@@ -30,6 +33,125 @@ from services.notifications.email_adapter import EmailAdapter
 logger = logging.getLogger(__name__)
 
 
+class NotificationLogBuffer:
+    """
+    Batches NotificationLog rows into multi-row INSERTs.
+    
+    When many calls end at once, each notification attempt would otherwise
+    cost its own INSERT + COMMIT. Rows are queued in memory and flushed as
+    one executemany INSERT when the batch fills up or the flush window
+    elapses, whichever comes first.
+    
+    Uses its own short-lived session so flushing never touches the
+    request-scoped session of the caller. The sync INSERT + COMMIT runs in
+    a worker thread so a flush never stalls the event loop (and the RTP
+    playback it paces).
+    
+    Note:
+        - Flush failures are logged and the batch is dropped (logging must
+          never interrupt call flow)
+        - Call flush() on shutdown to persist queued rows
+    """
+    
+    def __init__(
+        self,
+        max_batch_size: int = 32,
+        flush_interval: float = 0.05,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        """
+        Initialize notification log buffer.
+        
+        Args:
+            max_batch_size: Flush as soon as this many rows are queued
+            flush_interval: Maximum time (seconds) a row waits before flushing
+            session_factory: Factory for the session used to write batches
+        """
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.session_factory = session_factory
+        self._pending: List[Dict[str, Any]] = []
+        # Batches handed to a worker thread but not yet committed
+        self._in_flight: List[List[Dict[str, Any]]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    async def add(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a NotificationLog row for insertion.
+        
+        Args:
+            row: Column values for one NotificationLog row
+        """
+        self._pending.append(row)
+        
+        if len(self._pending) >= self.max_batch_size:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    def has_pending_sent(self, call_id: UUID) -> bool:
+        """
+        Check whether a "sent" log for this call is still queued.
+        
+        Args:
+            call_id: Call ID
+            
+        Returns:
+            bool: True if a queued row records a sent notification
+        """
+        return any(
+            row["call_id"] == call_id and row["status"] == "sent"
+            for batch in (self._pending, *self._in_flight)
+            for row in batch
+        )
+    
+    async def _flush_later(self) -> None:
+        """Flush once the batching window has elapsed."""
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+    
+    async def flush(self) -> None:
+        """Write all queued rows in a single multi-row INSERT."""
+        if not self._pending:
+            return
+        
+        rows, self._pending = self._pending, []
+        self._in_flight.append(rows)
+        try:
+            await asyncio.to_thread(self._write_batch, rows)
+        finally:
+            self._in_flight.remove(rows)
+    
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        INSERT and COMMIT one batch (blocking; run in a worker thread).
+        
+        Args:
+            rows: Column values for the NotificationLog rows
+        """
+        db = self.session_factory()
+        try:
+            db.execute(insert(NotificationLog), rows)
+            db.commit()
+            
+            logger.debug(
+                f"[NOTIFICATION_SERVICE] Flushed notification logs: count={len(rows)}"
+            )
+            
+        except Exception as e:
+            # Don't fail if logging fails
+            logger.error(
+                f"[NOTIFICATION_SERVICE] Failed to flush {len(rows)} notification logs: {e}"
+            )
+            db.rollback()
+        finally:
+            db.close()
+
+
+# Shared buffer so bursts across calls coalesce into one INSERT
+notification_log_buffer = NotificationLogBuffer()
+
+
 class NotificationService:
     """
     Orchestrates notification delivery for call summaries.
@@ -48,14 +170,16 @@ class NotificationService:
     4. Never raise exceptions (fail silently)
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, log_buffer: Optional[NotificationLogBuffer] = None):
         """
         Initialize notification service.
         
         Args:
-            db: Database session for logging
+            db: Database session for duplicate-notification checks
+            log_buffer: Buffer for batched log inserts (default: shared buffer)
         """
         self.db = db
+        self.log_buffer = log_buffer or notification_log_buffer
         self.whatsapp_adapter = WhatsAppAdapter()
         self.email_adapter = EmailAdapter()
         logger.info("[NOTIFICATION_SERVICE] Initialized")
@@ -102,7 +226,7 @@ class NotificationService:
             NotificationLog.status == "sent"
         ).first()
         
-        if existing_log:
+        if existing_log or self.log_buffer.has_pending_sent(call_id):
             logger.warning(
                 f"[NOTIFICATION_SERVICE] Notification already sent for call: {call_id}"
             )
@@ -174,7 +298,7 @@ class NotificationService:
             )
             
             # Log attempt
-            self._log_notification_attempt(
+            await self._log_notification_attempt(
                 tenant_id=tenant_id,
                 call_id=call_id,
                 call_summary_id=call_summary_id,
@@ -192,7 +316,7 @@ class NotificationService:
             )
             
             # Log failed attempt
-            self._log_notification_attempt(
+            await self._log_notification_attempt(
                 tenant_id=tenant_id,
                 call_id=call_id,
                 call_summary_id=call_summary_id,
@@ -233,7 +357,7 @@ class NotificationService:
             )
             
             # Log attempt
-            self._log_notification_attempt(
+            await self._log_notification_attempt(
                 tenant_id=tenant_id,
                 call_id=call_id,
                 call_summary_id=call_summary_id,
@@ -251,7 +375,7 @@ class NotificationService:
             )
             
             # Log failed attempt
-            self._log_notification_attempt(
+            await self._log_notification_attempt(
                 tenant_id=tenant_id,
                 call_id=call_id,
                 call_summary_id=call_summary_id,
@@ -263,7 +387,7 @@ class NotificationService:
             
             return False
     
-    def _log_notification_attempt(
+    async def _log_notification_attempt(
         self,
         tenant_id: UUID,
         call_id: UUID,
@@ -274,7 +398,7 @@ class NotificationService:
         error_message: Optional[str]
     ) -> None:
         """
-        Log notification attempt to database.
+        Queue notification attempt for batched insertion into the database.
         
         Args:
             tenant_id: Tenant ID
@@ -286,21 +410,18 @@ class NotificationService:
             error_message: Error message if failed
         """
         try:
-            log_entry = NotificationLog(
-                tenant_id=tenant_id,
-                call_id=call_id,
-                call_summary_id=call_summary_id,
-                notification_type=notification_type,
-                recipient=recipient,
-                status=status,
-                error_message=error_message
-            )
-            
-            self.db.add(log_entry)
-            self.db.commit()
+            await self.log_buffer.add({
+                "tenant_id": tenant_id,
+                "call_id": call_id,
+                "call_summary_id": call_summary_id,
+                "notification_type": notification_type,
+                "recipient": recipient,
+                "status": status,
+                "error_message": error_message
+            })
             
             logger.debug(
-                f"[NOTIFICATION_SERVICE] Logged notification attempt: "
+                f"[NOTIFICATION_SERVICE] Queued notification attempt: "
                 f"type={notification_type}, status={status}"
             )
             
@@ -309,8 +430,6 @@ class NotificationService:
             logger.error(
                 f"[NOTIFICATION_SERVICE] Failed to log notification: {e}"
             )
-            # Rollback to prevent transaction issues
-            self.db.rollback()
 
 
 # Phase 6 Implementation Notes:
@@ -319,5 +438,6 @@ class NotificationService:
 # - No imports from Phase 5 telephony code
 # - Notification failures are logged but never interrupt call flow
 # - Maximum one notification per call is enforced
+# - Notification logs are batched into multi-row INSERTs (NotificationLogBuffer)
 # - Clear separation between WhatsApp and email adapters
 # - All operations are tenant_id scoped